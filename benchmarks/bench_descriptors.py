@@ -0,0 +1,70 @@
+"""Micro-benchmark of the translated attribute access.
+
+It compares reading a translated attribute, e.g. `movie.title`, resolved by
+the descriptor with reading a plain model field and with resolving the
+translation on every read. The "bound" case stands for the objects fetched
+with `TranslatedModelQuerySet.for_language()`, which skip looking up the
+active language.
+
+Usage:
+
+    python -m benchmarks.bench_descriptors
+"""
+
+import os
+import timeit
+
+import django
+from django.utils import translation
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+# Number of attribute reads per run, e.g. of a listing page template
+READS = 10_000
+
+
+def main():
+    django.setup()
+
+    from translated_models.descriptors import LANGUAGE_NAME
+
+    from tests.models import Movie
+
+    movie = Movie(title="The Pianist", title_pl="Pianista", genre="Drama")
+    descriptor = Movie.title
+
+    bound_movie = Movie(title="The Pianist", title_pl="Pianista")
+    bound_movie.__dict__[LANGUAGE_NAME] = "pl"
+
+    def plain():
+        for _ in range(READS):
+            movie.premiere_date
+
+    def uncached():
+        for _ in range(READS):
+            getattr(
+                movie, descriptor.resolve(movie, translation.get_language())
+            )
+
+    def cached():
+        for _ in range(READS):
+            movie.title
+
+    def bound():
+        bound_movie.title
+        for _ in range(READS):
+            bound_movie.title
+
+    with translation.override("pl"):
+        for name, func in (
+            ("plain", plain),
+            ("uncached", uncached),
+            ("cached", cached),
+            ("bound", bound),
+        ):
+            time = min(timeit.repeat(func, number=10, repeat=5)) / 10
+            print("{:<10}{:>10.3f} ms".format(name, time * 1000))
+
+
+if __name__ == "__main__":
+    main()
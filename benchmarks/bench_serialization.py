@@ -0,0 +1,100 @@
+"""Benchmark of serializing translated objects for a single language.
+
+It compares building the dictionaries of the translated objects, e.g. for a
+JSON API response, from the model instances fetched for the language (see
+`TranslatedModelQuerySet.for_language()`) with fetching them directly with
+`TranslatedModelQuerySet.translated_values()`, both streamed with
+`iterator()`. The table of `tests.models.Movie` is filled with N rows, half
+of them translated into Polish, so that the other half falls back to the
+original values. The results are printed as JSON, so that they can be
+stored and compared between versions.
+
+Usage:
+
+    python -m benchmarks.bench_serialization [--rows N] [--repeat R]
+"""
+
+import argparse
+import json
+import os
+import platform
+import timeit
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+# Fields of the dictionaries serialized
+FIELDS = ("pk", "title", "genre")
+
+
+def measure(func, repeat):
+    """Return the best time of a single call of the function, in ms."""
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    django.setup()
+
+    from django.db import connection
+    from django.utils import timezone
+
+    from tests.models import Movie
+
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(Movie)
+
+    now = timezone.now()
+    Movie.objects.bulk_create(
+        (
+            Movie(
+                title="Title {}".format(index),
+                title_pl="Tytul {}".format(index) if index % 2 else None,
+                genre="Genre",
+                premiere_date=now,
+            )
+            for index in range(args.rows)
+        ),
+        batch_size=1000,
+    )
+
+    def instances():
+        return [
+            {name: getattr(movie, name) for name in FIELDS}
+            for movie in Movie.objects.for_language("pl").iterator(2000)
+        ]
+
+    def translated_values():
+        return list(
+            Movie.objects.translated_values("pl", *FIELDS).iterator(2000)
+        )
+
+    assert instances() == translated_values()
+
+    results = {
+        "instances": measure(instances, args.repeat),
+        "translated_values": measure(translated_values, args.repeat),
+    }
+
+    print(
+        json.dumps(
+            {
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "database": connection.vendor,
+                "rows": args.rows,
+                "unit": "ms",
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
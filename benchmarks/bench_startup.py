@@ -0,0 +1,155 @@
+"""Benchmark of the startup costs of translated models.
+
+It generates a synthetic app of N translated models with M translated fields
+each, translated into K languages, and measures the time of populating the
+app registry with the models, running the model checks (both the first run
+and the cached ones), calling `get_translated_fields()` and `get_languages()`,
+and compiling the SQL of a translated queryset. The results are printed as
+JSON, so that they can be stored and compared between versions.
+
+Usage:
+
+    python -m benchmarks.bench_startup [--models N] [--fields M]
+        [--languages K] [--repeat R]
+"""
+
+import argparse
+import json
+import os
+import platform
+import timeit
+
+import django
+from django.conf import global_settings
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+# Label of the synthetic app, the package of the benchmarks
+APP_LABEL = "benchmarks"
+
+
+def get_languages(count):
+    """Return the LANGUAGES setting of the given number of languages, with
+    English first, as the original language of the models."""
+    languages = [("en", "English")]
+    for code, name in global_settings.LANGUAGES:
+        if len(languages) == count:
+            break
+        if "-" not in code and code != "en":
+            languages.append((code, name))
+    return languages
+
+
+def create_models(fields):
+    """Return a function creating the given number of translated models with
+    the given number of fields each, in a fresh app registry."""
+    from django.apps.registry import Apps
+    from django.db import models
+
+    from translated_models.models import TranslatedModel
+
+    def create(count):
+        registry = Apps([APP_LABEL])
+        return [
+            type(
+                "Model{}".format(index),
+                (TranslatedModel,),
+                {
+                    "__module__": __name__,
+                    "original_language": "en",
+                    "Meta": type(
+                        "Meta",
+                        (),
+                        {"app_label": APP_LABEL, "apps": registry},
+                    ),
+                    **{
+                        "field{}".format(field): models.CharField(
+                            max_length=255
+                        )
+                        for field in range(fields)
+                    },
+                },
+            )
+            for index in range(count)
+        ]
+
+    return create
+
+
+def measure(func, repeat, number=1):
+    """Return the best time of a single call of the function, in ms."""
+    return (
+        min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e3
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--models", type=int, default=100)
+    parser.add_argument("--fields", type=int, default=5)
+    parser.add_argument("--languages", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    django.setup()
+
+    from django.test.utils import override_settings
+
+    from translated_models import models as translated_models
+
+    languages = get_languages(args.languages)
+    with override_settings(LANGUAGES=languages):
+        create = create_models(args.fields)
+        models = create(args.models)
+
+        def check_cold():
+            translated_models.check_results.clear()
+            for model in models:
+                model.check()
+
+        def check_warm():
+            for model in models:
+                model.check()
+
+        def get_attributes():
+            for model in models:
+                model.get_translated_fields()
+                model.get_languages()
+
+        def compile_sql():
+            for model in models:
+                str(
+                    model.objects.for_language(languages[-1][0])
+                    .filter(field0="x")
+                    .order_by("field0")
+                    .query
+                )
+
+        results = {
+            "populate_registry": measure(
+                lambda: create(args.models), args.repeat
+            ),
+            "check_cold": measure(check_cold, args.repeat),
+            "check_warm": measure(check_warm, args.repeat),
+            "get_attributes": measure(get_attributes, args.repeat, 10),
+            "compile_sql": measure(compile_sql, args.repeat),
+        }
+
+    print(
+        json.dumps(
+            {
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "models": args.models,
+                "fields": args.fields,
+                "languages": args.languages,
+                "unit": "ms",
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Benchmark of the storages of the translations.
+
+It compares the models storing the translations in a column per translated
+field and language (`tests.models.Book`) with the ones storing them in a
+single JSON field (`tests.models.Article`) and in a table of translations
+(`tests.models.Note`), all having a translated CharField translated into
+Polish. Each of the tables is filled with N rows,
+and the times of fetching the objects, filtering and ordering them by the
+translations, and setting the translations in bulk are measured. The results
+are printed as JSON, so that they can be stored and compared between
+versions and database backends.
+
+Usage:
+
+    python -m benchmarks.bench_storage [--rows N] [--repeat R]
+"""
+
+import argparse
+import json
+import os
+import platform
+import timeit
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+
+def measure(func, repeat):
+    """Return the best time of a single call of the function, in ms."""
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1e3
+
+
+def run(model, rows, repeat):
+    """Return a dictionary of the times of the operations on the given model
+    filled with the given number of rows."""
+    queryset = model.objects.for_language("pl")
+
+    model.objects.bulk_create(
+        model(title="Title {}".format(index)) for index in range(rows)
+    )
+    pks = list(model.objects.values_list("pk", flat=True))
+    # The translations stored elsewhere than in the columns aren't created
+    # by `bulk_create()`
+    model.objects.bulk_set_translations(
+        "pl", {pk: {"title": "Tytul {}".format(pk)} for pk in pks}
+    )
+
+    def fetch():
+        for obj in queryset:
+            obj.title
+
+    def filter_():
+        list(queryset.filter(title__startswith="Tytul 1"))
+
+    def order_by():
+        list(queryset.order_by("title")[:20])
+
+    def with_translations():
+        list(model.objects.with_translations("pl").values("title_translated"))
+
+    def bulk_set_translations():
+        model.objects.bulk_set_translations(
+            "pl", {pk: {"title": "Tytul"} for pk in pks}
+        )
+
+    return {
+        "fetch": measure(fetch, repeat),
+        "filter": measure(filter_, repeat),
+        "order_by": measure(order_by, repeat),
+        "with_translations": measure(with_translations, repeat),
+        "bulk_set_translations": measure(bulk_set_translations, repeat),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    django.setup()
+
+    from django.db import connection
+
+    from translated_models.models import get_translation_model
+
+    from tests.models import Article, Book, Note
+
+    results = {}
+    for storage, models in (
+        ("columns", [Book]),
+        ("json", [Article]),
+        ("table", [Note, get_translation_model(Note)]),
+    ):
+        with connection.schema_editor() as schema_editor:
+            for model in models:
+                schema_editor.create_model(model)
+        try:
+            results[storage] = run(models[0], args.rows, args.repeat)
+        finally:
+            with connection.schema_editor() as schema_editor:
+                for model in reversed(models):
+                    schema_editor.delete_model(model)
+
+    print(
+        json.dumps(
+            {
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "database": connection.vendor,
+                "rows": args.rows,
+                "unit": "ms",
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Micro-benchmark of the language code lookups run by the model checks.
+
+It compares the frozenset indexes of `translated_models.utils` with the
+former implementation, which rebuilt the tuple of codes from the LANGUAGES
+setting and scanned it on every call.
+
+Usage:
+
+    python -m benchmarks.bench_utils
+"""
+
+import os
+import timeit
+
+import django
+from django.conf import global_settings, settings
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+# Number of models, and languages per model, checked at startup
+MODELS = 500
+LANGUAGES = ["en", "pl", "de", "fr", "pt-br"]
+
+
+def _is_language_in_languages_settings(code, settings):
+    codes, names = zip(*settings.LANGUAGES)
+    return code.split("-")[0] in codes
+
+
+def check_models_baseline():
+    for _ in range(MODELS):
+        for code in LANGUAGES:
+            _is_language_in_languages_settings(code, global_settings)
+            _is_language_in_languages_settings(code, settings)
+
+
+def check_models():
+    from translated_models.utils import (
+        is_language_in_django,
+        is_language_in_settings,
+    )
+
+    for _ in range(MODELS):
+        for code in LANGUAGES:
+            is_language_in_django(code)
+            is_language_in_settings(code)
+
+
+def main():
+    django.setup()
+
+    for name, func in (
+        ("baseline", check_models_baseline),
+        ("indexed", check_models),
+    ):
+        time = min(timeit.repeat(func, number=10, repeat=5)) / 10
+        print("{:<10}{:>10.3f} ms".format(name, time * 1000))
+
+
+if __name__ == "__main__":
+    main()
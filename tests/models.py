@@ -1,6 +1,6 @@
 from django.db import models
 
-from translated_models.models import TranslatedModel
+from translated_models.models import TranslatedModel, TranslatedModelManager
 
 
 class Movie(TranslatedModel):
@@ -21,3 +21,86 @@ class Movie(TranslatedModel):
 
     class Meta:
         app_label = "tests"
+
+
+class Book(TranslatedModel):
+    """An example of concrete model with translated fields given."""
+
+    # Translatable fields
+    title = models.CharField(max_length=255)
+
+    translated_fields = ["title"]
+
+    indexed_fields = ["title"]
+
+    original_language = "en"
+
+    class Meta:
+        app_label = "tests"
+
+
+class Genre(TranslatedModel):
+    """An example of concrete model with the translations cached."""
+
+    # Translatable fields
+    name = models.CharField(max_length=255)
+
+    # Manager caching the objects in the process
+    cached_objects = TranslatedModelManager(cache_size=2)
+
+    cache_translations = True
+
+    original_language = "en"
+
+    class Meta:
+        app_label = "tests"
+
+
+class Article(TranslatedModel):
+    """An example of concrete model with the translations stored in a single
+    JSON field."""
+
+    # Translatable fields
+    title = models.CharField(max_length=255)
+    lead = models.TextField(blank=True)
+
+    # Manager caching the objects in the process
+    cached_objects = TranslatedModelManager(cache_size=10)
+
+    translation_storage = "json"
+
+    original_language = "en"
+
+    class Meta:
+        app_label = "tests"
+
+
+class Note(TranslatedModel):
+    """An example of concrete model with the translations stored in a table
+    of translations."""
+
+    # Translatable fields
+    title = models.CharField(max_length=255)
+    text = models.TextField(blank=True)
+
+    translation_storage = "table"
+
+    original_language = "en"
+
+    class Meta:
+        app_label = "tests"
+
+
+class Post(TranslatedModel):
+    """An example of concrete model searched by its translations."""
+
+    # Translatable fields
+    title = models.CharField(max_length=255)
+    body = models.TextField(blank=True)
+
+    search_fields = ["title", "body"]
+
+    original_language = "en"
+
+    class Meta:
+        app_label = "tests"
@@ -0,0 +1,106 @@
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from .models import Book, Genre
+
+
+class TestAsyncTranslatedModelQuerySet(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.solaris = Book.objects.create(
+            title="Solaris", title_pl="Solaris (pl)"
+        )
+        cls.ubik = Book.objects.create(title="Ubik")
+
+    async def test_async_iteration(self):
+        books = [
+            book.title
+            async for book in Book.objects.for_language("pl").order_by("pk")
+        ]
+        self.assertEqual(books, ["Solaris (pl)", "Ubik"])
+
+    async def test_abulk_set_translations(self):
+        count = await Book.objects.abulk_set_translations(
+            "pl", {self.ubik.pk: {"title": "Ubik (pl)"}}
+        )
+        self.assertEqual(count, 1)
+        book = await Book.objects.for_language("pl").aget(pk=self.ubik.pk)
+        self.assertEqual(book.title, "Ubik (pl)")
+
+    async def test_atranslation_coverage(self):
+        coverage = await Book.objects.atranslation_coverage()
+        self.assertEqual(
+            coverage, {"total": 2, "translated": {"title": {"pl": 1}}}
+        )
+
+    async def test_acached_translations(self):
+        translations = await Book.objects.acached_translations(
+            [self.solaris.pk], "pl"
+        )
+        self.assertEqual(
+            translations, {self.solaris.pk: {"title": "Solaris (pl)"}}
+        )
+
+    async def test_aiter_missing(self):
+        pages = [page async for page in Book.objects.aiter_missing("pl")]
+        self.assertEqual(pages, [[{"pk": self.ubik.pk, "title": "Ubik"}]])
+
+
+class TestAsyncTranslatedModelManager(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.drama = Genre.objects.create(name="Drama", name_pl="Dramat")
+
+    def setUp(self):
+        cache.clear()
+        Genre.cached_objects.lru_cache.clear()
+        self.addCleanup(Genre.cached_objects.lru_cache.clear)
+
+    async def test_aget(self):
+        lru_cache = Genre.cached_objects.lru_cache
+        await Genre.cached_objects.aget(pk=self.drama.pk)
+        hits = lru_cache.hits
+        genre = await Genre.cached_objects.aget(pk=self.drama.pk)
+        self.assertEqual(lru_cache.hits, hits + 1)
+        self.assertEqual(genre.name_pl, "Dramat")
+
+    async def test_aget_other_lookups(self):
+        genre = await Genre.cached_objects.aget(name="Drama")
+        self.assertEqual(genre.pk, self.drama.pk)
+
+    async def test_ain_bulk(self):
+        lru_cache = Genre.cached_objects.lru_cache
+        await Genre.cached_objects.ain_bulk([self.drama.pk])
+        hits = lru_cache.hits
+        genres = await Genre.cached_objects.ain_bulk([self.drama.pk])
+        self.assertEqual(lru_cache.hits, hits + 1)
+        self.assertEqual(list(genres), [self.drama.pk])
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "translated_models_cache",
+        }
+    }
+)
+class TestAsyncTranslatedModelManagerDatabaseCache(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command("createcachetable", verbosity=0)
+        cls.drama = Genre.objects.create(name="Drama", name_pl="Dramat")
+
+    def setUp(self):
+        Genre.cached_objects.lru_cache.clear()
+        Genre.cached_objects.lru_cache.refreshed_at = None
+        self.addCleanup(Genre.cached_objects.lru_cache.clear)
+
+    async def test_aget(self):
+        genre = await Genre.cached_objects.aget(pk=self.drama.pk)
+        self.assertEqual(genre.name_pl, "Dramat")
+
+    async def test_ain_bulk(self):
+        genres = await Genre.cached_objects.ain_bulk([self.drama.pk])
+        self.assertEqual(list(genres), [self.drama.pk])
@@ -0,0 +1,218 @@
+import json
+import os
+import tempfile
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from translated_models.backfill import backfill_translations
+from translated_models.translators import EchoTranslator
+
+from .models import Movie, Note
+
+
+class TestBackfillTranslations(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Movie.objects.bulk_create(
+            Movie(
+                title=title,
+                title_pl=title_pl,
+                genre="Drama",
+                premiere_date=timezone.now(),
+            )
+            for title, title_pl in (
+                ("Hamlet", None),
+                ("Solaris", "Solaris (pl)"),
+                ("Ubik", ""),
+            )
+        )
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.checkpoint = os.path.join(directory.name, "checkpoint.json")
+
+    def titles(self):
+        return list(
+            Movie.objects.order_by("pk").values_list("title_pl", flat=True)
+        )
+
+    def test_backfill_translations(self):
+        state = backfill_translations(
+            Movie.objects.all(), "pl", fields=["title"]
+        )
+        self.assertEqual(self.titles(), ["Hamlet", "Solaris (pl)", "Ubik"])
+        self.assertEqual(state["translations"], 2)
+        self.assertEqual(state["batches"], 1)
+
+    def test_backfill_translations_batches(self):
+        state = backfill_translations(
+            Movie.objects.all(), "pl", fields=["title"], batch_size=1
+        )
+        self.assertEqual(self.titles(), ["Hamlet", "Solaris (pl)", "Ubik"])
+        self.assertEqual(state["batches"], 3)
+
+    def test_backfill_translations_translator(self):
+        backfill_translations(
+            Movie.objects.all(),
+            "pl",
+            fields=["title"],
+            translator=EchoTranslator("{text} ({language})"),
+        )
+        self.assertEqual(
+            self.titles(), ["Hamlet (pl)", "Solaris (pl)", "Ubik (pl)"]
+        )
+
+    def test_backfill_translations_table_storage(self):
+        note = Note.objects.create(title="Solaris")
+        backfill_translations(Note.objects.all(), "pl")
+        self.assertEqual(Note.objects.get(pk=note.pk).title_pl, "Solaris")
+        self.assertIsNone(Note.objects.get(pk=note.pk).text_pl)
+
+    def test_backfill_translations_checkpoint(self):
+        saved = []
+
+        def progress(state):
+            with open(self.checkpoint, encoding="utf-8") as stream:
+                saved.append(json.load(stream))
+
+        backfill_translations(
+            Movie.objects.all(),
+            "pl",
+            fields=["title"],
+            batch_size=2,
+            checkpoint=self.checkpoint,
+            progress=progress,
+        )
+        pks = list(Movie.objects.order_by("pk").values_list("pk", flat=True))
+        self.assertEqual(
+            saved,
+            [
+                {
+                    "model": "tests.Movie",
+                    "language": "pl",
+                    "fields": ["title"],
+                    "last_pk": last_pk,
+                    "translations": translations,
+                    "batches": batches,
+                }
+                for last_pk, translations, batches in (
+                    (pks[1], 1, 1),
+                    (pks[2], 2, 2),
+                )
+            ],
+        )
+        # The finished backfill isn't resumed by the next one
+        self.assertFalse(os.path.exists(self.checkpoint))
+        Movie.objects.update(title_pl=None)
+        backfill_translations(
+            Movie.objects.all(),
+            "pl",
+            fields=["title"],
+            checkpoint=self.checkpoint,
+        )
+        self.assertEqual(self.titles(), ["Hamlet", "Solaris", "Ubik"])
+
+    def test_backfill_translations_interrupted(self):
+        def progress(state):
+            raise KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            backfill_translations(
+                Movie.objects.all(),
+                "pl",
+                fields=["title"],
+                batch_size=1,
+                checkpoint=self.checkpoint,
+                progress=progress,
+            )
+        self.assertTrue(os.path.exists(self.checkpoint))
+        state = backfill_translations(
+            Movie.objects.all(),
+            "pl",
+            fields=["title"],
+            batch_size=1,
+            checkpoint=self.checkpoint,
+        )
+        self.assertEqual(self.titles(), ["Hamlet", "Solaris (pl)", "Ubik"])
+        self.assertEqual(state["batches"], 3)
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+    def test_backfill_translations_resumed(self):
+        pks = list(Movie.objects.order_by("pk").values_list("pk", flat=True))
+        with open(self.checkpoint, "w", encoding="utf-8") as stream:
+            json.dump(
+                {
+                    "model": "tests.Movie",
+                    "language": "pl",
+                    "fields": ["title"],
+                    "last_pk": pks[0],
+                    "translations": 0,
+                    "batches": 1,
+                },
+                stream,
+            )
+        state = backfill_translations(
+            Movie.objects.all(),
+            "pl",
+            fields=["title"],
+            checkpoint=self.checkpoint,
+        )
+        self.assertEqual(self.titles(), [None, "Solaris (pl)", "Ubik"])
+        self.assertEqual(state["batches"], 2)
+
+    def test_backfill_translations_other_checkpoint(self):
+        with open(self.checkpoint, "w", encoding="utf-8") as stream:
+            json.dump(
+                {
+                    "model": "tests.Movie",
+                    "language": "pl",
+                    "fields": ["title", "genre"],
+                    "last_pk": None,
+                    "translations": 0,
+                    "batches": 0,
+                },
+                stream,
+            )
+        with self.assertRaises(ValueError):
+            backfill_translations(
+                Movie.objects.all(),
+                "pl",
+                fields=["title"],
+                checkpoint=self.checkpoint,
+            )
+
+    def test_backfill_translations_progress(self):
+        progress = mock.Mock()
+        backfill_translations(
+            Movie.objects.all(),
+            "pl",
+            fields=["title"],
+            batch_size=2,
+            progress=progress,
+        )
+        self.assertEqual(progress.call_count, 2)
+        state = progress.call_args.args[0]
+        self.assertEqual(state["eta"], 0)
+        self.assertGreaterEqual(state["elapsed"], 0)
+
+    def test_backfill_translations_throttle(self):
+        with mock.patch("time.sleep") as sleep:
+            backfill_translations(
+                Movie.objects.all(),
+                "pl",
+                fields=["title"],
+                batch_size=1,
+                throttle=0.5,
+            )
+        self.assertEqual(sleep.call_args_list, [mock.call(0.5)] * 2)
+
+    def test_backfill_translations_invalid_language(self):
+        with self.assertRaises(ValueError):
+            backfill_translations(Movie.objects.all(), "en")
+
+    def test_backfill_translations_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            backfill_translations(Movie.objects.all(), "pl", batch_size=0)
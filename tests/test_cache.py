@@ -0,0 +1,266 @@
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.db.models.deletion import Collector
+from django.db.models.signals import post_delete
+from django.test import TestCase
+from django.utils import translation
+
+from translated_models.cache import get_version, increment_generation, set_many
+
+from .models import Article, Book, Genre, Movie
+
+
+class TestCachedTranslations(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.drama = Genre.objects.create(name="Drama", name_pl="Dramat")
+        cls.comedy = Genre.objects.create(name="Comedy")
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def get_translations(self):
+        return Genre.objects.cached_translations(
+            [self.drama.pk, self.comedy.pk], "pl"
+        )
+
+    def test_cached_translations(self):
+        with self.assertNumQueries(1):
+            translations = self.get_translations()
+        self.assertEqual(
+            translations,
+            {
+                self.drama.pk: {"name": "Dramat"},
+                self.comedy.pk: {"name": "Comedy"},
+            },
+        )
+
+    def test_cached_translations_cached(self):
+        self.get_translations()
+        with self.assertNumQueries(0):
+            translations = self.get_translations()
+        self.assertEqual(translations[self.drama.pk], {"name": "Dramat"})
+
+    def test_cached_translations_missing_objects(self):
+        self.assertEqual(Genre.objects.cached_translations([0], "pl"), {})
+
+    def test_cached_translations_not_cached(self):
+        book = Book.objects.create(title="Solaris")
+        Book.objects.cached_translations([book.pk], "pl")
+        with self.assertNumQueries(1):
+            Book.objects.cached_translations([book.pk], "pl")
+
+    def test_invalidated_on_save(self):
+        self.get_translations()
+        self.drama.name_pl = "Dramat (pl)"
+        self.drama.save()
+        self.assertEqual(
+            self.get_translations()[self.drama.pk], {"name": "Dramat (pl)"}
+        )
+
+    def test_invalidated_on_delete(self):
+        self.get_translations()
+        self.comedy.delete()
+        self.assertNotIn(self.comedy.pk, self.get_translations())
+
+    def test_invalidated_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.drama.name_pl = "Dramat (pl)"
+            self.drama.save()
+        # A concurrent reader caches the translation committed before
+        set_many(Genre, {self.drama.pk: {"name": "Dramat"}}, "pl")
+        for callback in callbacks:
+            callback()
+        self.assertEqual(
+            self.get_translations()[self.drama.pk], {"name": "Dramat (pl)"}
+        )
+
+    def test_receivers_connected_to_cached_models_only(self):
+        self.assertTrue(post_delete.has_listeners(Genre))
+        self.assertFalse(post_delete.has_listeners(Movie))
+        self.assertTrue(
+            Collector(using="default").can_fast_delete(Session.objects.all())
+        )
+
+    def test_invalidated_on_update(self):
+        self.get_translations()
+        version = get_version(Genre)
+        Genre.objects.update(name_pl="Gatunek")
+        self.assertNotEqual(get_version(Genre), version)
+        self.assertEqual(
+            self.get_translations()[self.comedy.pk], {"name": "Gatunek"}
+        )
+
+    def test_invalidated_on_bulk_set_translations(self):
+        self.get_translations()
+        Genre.objects.bulk_set_translations(
+            "pl", {self.comedy.pk: {"name": "Komedia"}}
+        )
+        self.assertEqual(
+            self.get_translations()[self.comedy.pk], {"name": "Komedia"}
+        )
+
+    def test_invalidated_on_bulk_update(self):
+        self.get_translations()
+        self.comedy.name_pl = "Komedia"
+        Genre.objects.bulk_update([self.comedy], ["name_pl"])
+        self.assertEqual(
+            self.get_translations()[self.comedy.pk], {"name": "Komedia"}
+        )
+
+    def test_bulk_writes_invalidated_per_object(self):
+        self.get_translations()
+        version = get_version(Genre)
+        Genre.objects.bulk_set_translations(
+            "pl", {self.comedy.pk: {"name": "Komedia"}}
+        )
+        self.comedy.name_pl = "Komedia (pl)"
+        Genre.objects.bulk_update([self.comedy], ["name_pl"])
+        self.assertEqual(get_version(Genre), version)
+        with self.assertNumQueries(1):
+            translations = self.get_translations()
+        self.assertEqual(
+            translations,
+            {
+                self.drama.pk: {"name": "Dramat"},
+                self.comedy.pk: {"name": "Komedia (pl)"},
+            },
+        )
+
+    def test_bulk_writes_invalidated_on_commit(self):
+        self.comedy.name_pl = "Komedia"
+        for write, genre, name_pl in (
+            (
+                lambda: Genre.objects.bulk_set_translations(
+                    "pl", {self.drama.pk: {"name": "Dramat (pl)"}}
+                ),
+                self.drama,
+                "Dramat (pl)",
+            ),
+            (
+                lambda: Genre.objects.bulk_update([self.comedy], ["name_pl"]),
+                self.comedy,
+                "Komedia",
+            ),
+            (
+                lambda: Genre.objects.filter(pk=self.comedy.pk).update(
+                    name_pl="Komedia (pl)"
+                ),
+                self.comedy,
+                "Komedia (pl)",
+            ),
+        ):
+            with self.subTest(name_pl=name_pl):
+                previous = self.get_translations()[genre.pk]
+                with self.captureOnCommitCallbacks() as callbacks:
+                    write()
+                # A concurrent reader caches the translation committed before
+                set_many(Genre, {genre.pk: previous}, "pl")
+                for callback in callbacks:
+                    callback()
+                self.assertEqual(
+                    self.get_translations()[genre.pk], {"name": name_pl}
+                )
+
+
+class TestLRUCache(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.genres = [
+            Genre.objects.create(name=name, name_pl=name_pl)
+            for name, name_pl in (
+                ("Drama", "Dramat"),
+                ("Comedy", "Komedia"),
+                ("Horror", None),
+            )
+        ]
+
+    def setUp(self):
+        cache.clear()
+        Genre.cached_objects.lru_cache.clear()
+        self.addCleanup(Genre.cached_objects.lru_cache.clear)
+
+    def test_get(self):
+        drama = self.genres[0]
+        Genre.cached_objects.get(pk=drama.pk)
+        with self.assertNumQueries(0):
+            genre = Genre.cached_objects.get(pk=drama.pk)
+        self.assertEqual(genre.name_en, "Drama")
+        self.assertEqual(genre.name_pl, "Dramat")
+        with translation.override("pl"):
+            self.assertEqual(genre.name, "Dramat")
+
+    def test_get_other_lookups(self):
+        Genre.cached_objects.get(name="Drama")
+        with self.assertNumQueries(1):
+            Genre.cached_objects.get(name="Drama")
+
+    def test_get_does_not_exist(self):
+        with self.assertRaises(Genre.DoesNotExist):
+            Genre.cached_objects.get(pk=0)
+
+    def test_in_bulk(self):
+        pks = [genre.pk for genre in self.genres[:2]]
+        Genre.cached_objects.in_bulk(pks[:1])
+        with self.assertNumQueries(1):
+            genres = Genre.cached_objects.in_bulk(pks)
+        self.assertEqual(set(genres), set(pks))
+        with self.assertNumQueries(0):
+            Genre.cached_objects.in_bulk(pks)
+
+    def test_maxsize(self):
+        Genre.cached_objects.in_bulk([genre.pk for genre in self.genres])
+        self.assertEqual(Genre.cached_objects.lru_cache.info()["size"], 2)
+        with self.assertNumQueries(1):
+            Genre.cached_objects.get(pk=self.genres[0].pk)
+
+    def test_info(self):
+        lru_cache = Genre.cached_objects.lru_cache
+        lru_cache.hits = lru_cache.misses = 0
+        pk = self.genres[0].pk
+        Genre.cached_objects.get(pk=pk)
+        Genre.cached_objects.get(pk=pk)
+        self.assertEqual(
+            lru_cache.info(),
+            {"hits": 1, "misses": 1, "maxsize": 2, "size": 1},
+        )
+
+    def test_mutable_values_not_shared(self):
+        article = Article.objects.create(title="Solaris", title_pl="Solaris")
+        self.addCleanup(Article.cached_objects.lru_cache.clear)
+        for _ in range(2):
+            obj = Article.cached_objects.get(pk=article.pk)
+            obj.title_pl = "Unsaved"
+        self.assertEqual(
+            Article.cached_objects.get(pk=article.pk).title_pl, "Solaris"
+        )
+
+    def test_invalidated_on_save(self):
+        drama = self.genres[0]
+        Genre.cached_objects.get(pk=drama.pk)
+        drama.name_pl = "Dramat (pl)"
+        drama.save()
+        genre = Genre.cached_objects.get(pk=drama.pk)
+        self.assertEqual(genre.name_pl, "Dramat (pl)")
+
+    def test_cached_per_database(self):
+        pk = self.genres[0].pk
+        Genre.cached_objects.get(pk=pk)
+        other_lru_cache = Genre.cached_objects.db_manager("other").lru_cache
+        self.assertIsNot(other_lru_cache, Genre.cached_objects.lru_cache)
+        self.assertIsNone(other_lru_cache.get(pk))
+        other_lru_cache.set(pk, (pk,))
+        self.addCleanup(other_lru_cache.clear)
+        # The caches of all the databases are invalidated
+        self.genres[0].save()
+        self.assertIsNone(other_lru_cache.get(pk))
+
+    def test_invalidated_by_generation(self):
+        pk = self.genres[0].pk
+        lru_cache = Genre.cached_objects.lru_cache
+        Genre.cached_objects.get(pk=pk)
+        increment_generation(Genre)
+        lru_cache.refreshed_at = None
+        with self.assertNumQueries(1):
+            Genre.cached_objects.get(pk=pk)
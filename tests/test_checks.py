@@ -19,3 +19,11 @@ class TestChecks(TestCase):
         self.assertCheckFailsWithMessageCode(
             checks.check_settings, "translated_models.E001"
         )
+
+    @override_settings(
+        TRANSLATED_MODELS_FALLBACK_LANGUAGES={"pl": "en"},
+    )
+    def test_check_settings_fails_with_E012(self):
+        self.assertCheckFailsWithMessageCode(
+            checks.check_settings, "translated_models.E012"
+        )
@@ -0,0 +1,308 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+
+from .models import Article, Book, Movie
+
+
+class TestTranslationsCommands(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.solaris = Book.objects.create(
+            title="Solaris", title_pl="Solaris (pl)"
+        )
+        cls.ubik = Book.objects.create(title='Ubik, "the novel"\n')
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def export(self, *args):
+        stdout = StringIO()
+        call_command("exporttranslations", "tests.Book", *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def roundtrip(self, extension):
+        path = os.path.join(self.directory, "books." + extension)
+        call_command("exporttranslations", "tests.Book", output=path)
+        Book.objects.update(title_pl=None)
+        with open(path, encoding="utf-8") as stream:
+            content = stream.read()
+        with open(path, "w", encoding="utf-8") as stream:
+            stream.write(content.replace("Solaris (pl)", "Solaris PL"))
+        call_command("importtranslations", "tests.Book", path, verbosity=0)
+
+    def test_export_csv(self):
+        self.assertEqual(
+            self.export().splitlines()[:2],
+            ["pk,title,title_pl", f"{self.solaris.pk},Solaris,Solaris (pl)"],
+        )
+
+    def test_export_jsonl(self):
+        self.assertEqual(
+            self.export("--format", "jsonl").splitlines()[0],
+            '{"pk": %d, "title": "Solaris", "title_pl": "Solaris (pl)"}'
+            % self.solaris.pk,
+        )
+
+    def test_export_po(self):
+        self.assertIn(
+            'msgctxt "%d.title_pl"\nmsgid "Solaris"\nmsgstr "Solaris (pl)"\n'
+            % self.solaris.pk,
+            self.export("--format", "po"),
+        )
+
+    def test_export_invalid_model(self):
+        with self.assertRaises(CommandError):
+            call_command("exporttranslations", "auth.User")
+
+    def test_export_invalid_language(self):
+        with self.assertRaises(CommandError):
+            self.export("-l", "en")
+
+    def test_export_invalid_field(self):
+        with self.assertRaises(CommandError):
+            call_command("exporttranslations", "tests.Movie", "-f", "x")
+
+    def test_export_invalid_chunk_size(self):
+        with self.assertRaises(CommandError):
+            self.export("--chunk-size", "0")
+
+    def test_import_csv(self):
+        self.roundtrip("csv")
+        self.assertEqual(
+            Book.objects.values_list("title_pl", flat=True).order_by("pk")[0],
+            "Solaris PL",
+        )
+
+    def test_import_jsonl(self):
+        self.roundtrip("jsonl")
+        self.assertEqual(
+            Book.objects.get(pk=self.solaris.pk).title_pl, "Solaris PL"
+        )
+
+    def test_import_po(self):
+        self.roundtrip("po")
+        self.assertEqual(
+            Book.objects.get(pk=self.solaris.pk).title_pl, "Solaris PL"
+        )
+
+    def test_import_skips_empty_translations(self):
+        path = os.path.join(self.directory, "books.csv")
+        with open(path, "w", encoding="utf-8") as stream:
+            stream.write(f"pk,title_pl\n{self.solaris.pk},\n")
+        call_command("importtranslations", "tests.Book", path, verbosity=0)
+        self.assertEqual(
+            Book.objects.get(pk=self.solaris.pk).title_pl, "Solaris (pl)"
+        )
+
+    def test_import_leaves_original_values(self):
+        path = os.path.join(self.directory, "books.jsonl")
+        with open(path, "w", encoding="utf-8") as stream:
+            stream.write('{"pk": %d, "title": "Ubik"}\n' % self.solaris.pk)
+        call_command("importtranslations", "tests.Book", path, verbosity=0)
+        self.assertEqual(
+            Book.objects.get(pk=self.solaris.pk).title_en, "Solaris"
+        )
+
+    def test_import_batches(self):
+        movies = [
+            Movie(title=str(index), genre="", premiere_date=timezone.now())
+            for index in range(5)
+        ]
+        Movie.objects.bulk_create(movies)
+        path = os.path.join(self.directory, "movies.csv")
+        with open(path, "w", encoding="utf-8") as stream:
+            stream.write("pk,title_pl\n")
+            for movie in Movie.objects.all():
+                stream.write(f"{movie.pk},{movie.title_en} (pl)\n")
+        with self.assertNumQueries(3):
+            # One query per batch
+            call_command(
+                "importtranslations",
+                "tests.Movie",
+                path,
+                batch_size=2,
+                verbosity=0,
+            )
+        self.assertEqual(
+            Movie.objects.filter(title_pl__endswith="(pl)").count(), 5
+        )
+
+    def test_import_invalid_batch_size(self):
+        path = os.path.join(self.directory, "books.csv")
+        with open(path, "w", encoding="utf-8") as stream:
+            stream.write(f"pk,title_pl\n{self.solaris.pk},Solaris PL\n")
+        for batch_size in ("0", "-1"):
+            with self.subTest(batch_size=batch_size):
+                with self.assertRaises(CommandError):
+                    call_command(
+                        "importtranslations",
+                        "tests.Book",
+                        path,
+                        "--batch-size",
+                        batch_size,
+                    )
+
+    def test_import_json_storage(self):
+        article = Article.objects.create(
+            title="Solaris", lead="A novel", title_pl="Solaris (pl)"
+        )
+        path = os.path.join(self.directory, "articles.csv")
+        with open(path, "w", encoding="utf-8") as stream:
+            stream.write(f"pk,lead_pl\n{article.pk},Powiesc\n")
+        call_command("importtranslations", "tests.Article", path, verbosity=0)
+        # The translations are merged into the JSON field
+        self.assertEqual(
+            Article.objects.get(pk=article.pk).translations,
+            {"pl": {"title": "Solaris (pl)", "lead": "Powiesc"}},
+        )
+
+
+class TestTranslationCoverageCommand(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Book.objects.create(title="Solaris", title_pl="Solaris (pl)")
+        Book.objects.create(title="Ubik", title_pl="")
+
+    def test_translation_coverage(self):
+        stdout = StringIO()
+        call_command("translationcoverage", "tests.Book", stdout=stdout)
+        self.assertEqual(
+            stdout.getvalue(), "tests.Book.title [pl]: 50.0% (1/2)\n"
+        )
+
+    def test_translation_coverage_all_models(self):
+        stdout = StringIO()
+        call_command("translationcoverage", stdout=stdout)
+        self.assertIn("tests.Book.title [pl]: 50.0% (1/2)", stdout.getvalue())
+        # No objects to be translated
+        self.assertIn("tests.Movie.genre [pl]: n/a", stdout.getvalue())
+
+    def test_translation_coverage_all_models_language(self):
+        stdout = StringIO()
+        call_command(
+            "translationcoverage", "-l", "pl", "-l", "de", stdout=stdout
+        )
+        self.assertIn("tests.Book.title [pl]: 50.0% (1/2)", stdout.getvalue())
+        self.assertNotIn("[de]", stdout.getvalue())
+        # The models not using the language are skipped
+        stdout = StringIO()
+        call_command("translationcoverage", "-l", "de", stdout=stdout)
+        self.assertEqual(stdout.getvalue(), "")
+
+    def test_translation_coverage_invalid_language(self):
+        with self.assertRaises(CommandError):
+            call_command("translationcoverage", "tests.Book", "-l", "xx")
+
+
+class TestPrefillTranslationsCommand(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.book = Book.objects.create(title="Solaris")
+
+    def test_prefill_translations(self):
+        stdout = StringIO()
+        call_command(
+            "prefilltranslations",
+            "tests.Book",
+            "-l",
+            "pl",
+            "--translator",
+            "translated_models.translators.EchoTranslator",
+            stdout=stdout,
+        )
+        self.assertEqual(Book.objects.get().title_pl, "Solaris")
+        self.assertEqual(
+            stdout.getvalue(),
+            "Prefilled translations of 1 object(s), translating 1 text(s).\n",
+        )
+
+    def test_prefill_translations_no_translator(self):
+        with self.assertRaises(CommandError):
+            call_command("prefilltranslations", "tests.Book", "-l", "pl")
+
+    def test_prefill_translations_invalid_language(self):
+        with self.assertRaises(CommandError):
+            call_command(
+                "prefilltranslations",
+                "tests.Book",
+                "-l",
+                "en",
+                "--translator",
+                "translated_models.translators.EchoTranslator",
+            )
+
+
+class TestBackfillTranslationsCommand(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.book = Book.objects.create(title="Solaris")
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.checkpoint = os.path.join(directory.name, "checkpoint.json")
+
+    def test_backfill_translations(self):
+        stdout = StringIO()
+        call_command(
+            "backfilltranslations",
+            "tests.Book",
+            "-l",
+            "pl",
+            "--checkpoint",
+            self.checkpoint,
+            stdout=stdout,
+        )
+        self.assertEqual(Book.objects.get().title_pl, "Solaris")
+        self.assertEqual(
+            stdout.getvalue().splitlines(),
+            [
+                "Batch 1: 1 translation(s) set up to pk {}, ETA "
+                "0:00:00.".format(self.book.pk),
+                "Backfilled 1 translation(s) in 1 batch(es).",
+            ],
+        )
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+    def test_backfill_translations_restart(self):
+        options = {"checkpoint": self.checkpoint, "verbosity": 0}
+        with open(self.checkpoint, "w", encoding="utf-8") as stream:
+            json.dump(
+                {
+                    "model": "tests.Book",
+                    "language": "pl",
+                    "fields": ["title"],
+                    "last_pk": self.book.pk,
+                    "translations": 1,
+                    "batches": 1,
+                },
+                stream,
+            )
+        call_command(
+            "backfilltranslations", "tests.Book", "-l", "pl", **options
+        )
+        self.assertIsNone(Book.objects.get().title_pl)
+        call_command(
+            "backfilltranslations",
+            "tests.Book",
+            "-l",
+            "pl",
+            "--restart",
+            **options,
+        )
+        self.assertEqual(Book.objects.get().title_pl, "Solaris")
+
+    def test_backfill_translations_invalid_field(self):
+        with self.assertRaises(CommandError):
+            call_command(
+                "backfilltranslations", "tests.Book", "-l", "pl", "-f", "x"
+            )
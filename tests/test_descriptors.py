@@ -0,0 +1,110 @@
+from django.forms.models import model_to_dict
+from django.test import TestCase, override_settings
+from django.utils import timezone, translation
+
+from translated_models.descriptors import CACHE_NAME
+
+from .models import Movie
+
+
+class TestTranslatedFieldDescriptor(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.movie = Movie.objects.create(
+            title="The Pianist",
+            title_pl="Pianista",
+            genre="Drama",
+            premiere_date=timezone.now(),
+        )
+
+    def test_original_language(self):
+        with translation.override("en"):
+            self.assertEqual(self.movie.title, "The Pianist")
+
+    def test_active_language(self):
+        with translation.override("pl"):
+            self.assertEqual(self.movie.title, "Pianista")
+
+    def test_base_language(self):
+        with translation.override("pl-pl"):
+            self.assertEqual(self.movie.title, "Pianista")
+
+    def test_missing_translation_falls_back_to_original(self):
+        with translation.override("pl"):
+            self.assertEqual(self.movie.genre, "Drama")
+
+    def test_unknown_language_falls_back_to_original(self):
+        with translation.override("de"):
+            self.assertEqual(self.movie.title, "The Pianist")
+
+    @override_settings(
+        LANGUAGES=[("en", "English"), ("pl", "Polish"), ("de", "German")],
+        TRANSLATED_MODELS_FALLBACK_LANGUAGES={"de": ["pl"]},
+    )
+    def test_missing_translation_falls_back_to_fallback_language(self):
+        with translation.override("de"):
+            self.assertEqual(self.movie.title, "Pianista")
+
+    def test_deactivated_translation_falls_back_to_original(self):
+        with translation.override(None):
+            self.assertEqual(self.movie.title, "The Pianist")
+
+    def test_original_value_stored_under_attname(self):
+        self.assertEqual(self.movie.title_en, "The Pianist")
+
+    def test_set_stores_original_value(self):
+        movie = Movie(title="The Pianist", genre="Drama")
+        with translation.override("pl"):
+            movie.title = "Pianist, The"
+        self.assertEqual(movie.title_en, "Pianist, The")
+
+    def test_set_original_value_translated(self):
+        movie = Movie.objects.get(pk=self.movie.pk)
+        with translation.override("pl"):
+            movie.title = "Pianist, The"
+            # The translation into the active language is still read
+            self.assertEqual(movie.title, "Pianista")
+        with translation.override("en"):
+            self.assertEqual(movie.title, "Pianist, The")
+
+    def test_resolution_cached(self):
+        movie = Movie.objects.get()
+        with translation.override("pl"):
+            movie.title
+        self.assertDictEqual(
+            movie.__dict__[CACHE_NAME], {("title", "pl"): "title_pl"}
+        )
+
+    def test_cache_cleared_on_translation_set(self):
+        movie = Movie.objects.get()
+        with translation.override("pl"):
+            self.assertEqual(movie.genre, "Drama")
+            movie.genre_pl = "Dramat"
+            self.assertEqual(movie.genre, "Dramat")
+
+    def test_save_stores_original_value(self):
+        with translation.override("pl"):
+            movie = Movie.objects.get()
+            movie.save()
+        self.assertEqual(Movie.objects.get().title_en, "The Pianist")
+
+    def test_model_to_dict_returns_original_value(self):
+        with translation.override("pl"):
+            data = model_to_dict(self.movie)
+        self.assertEqual(data["title"], "The Pianist")
+        self.assertEqual(data["title_pl"], "Pianista")
+
+    def test_deferred_translation_loaded(self):
+        movie = Movie.objects.defer("title_pl").get()
+        with translation.override("pl"):
+            self.assertEqual(movie.title, "Pianista")
+
+    def test_language_bound_by_queryset(self):
+        movie = Movie.objects.for_language("pl").get()
+        with translation.override("en"):
+            self.assertEqual(movie.title, "Pianista")
+
+    def test_language_bound_by_queryset_clone(self):
+        movie = Movie.objects.for_language("pl").filter(genre="Drama").get()
+        with translation.override("en"):
+            self.assertEqual(movie.title, "Pianista")
@@ -1,6 +1,16 @@
-from django.test import TestCase
+from unittest import mock
 
-from .models import Movie
+from django.db import connections, models
+from django.db.migrations.state import ModelState
+from django.db.models.functions import Upper
+from django.test import TestCase, override_settings
+from django.test.utils import register_lookup
+from django.utils import timezone, translation
+
+from translated_models.models import TranslationPrefetch
+from translated_models.search import TranslationSearchIndex
+
+from .models import Article, Book, Movie, Note, Post
 
 
 class TestTranslatedModel(TestCase):
@@ -9,7 +19,15 @@ class TestTranslatedModel(TestCase):
         cls.model = Movie
         cls.original = {
             attr: getattr(cls.model, attr)
-            for attr in ("translated_fields", "languages")
+            for attr in (
+                "translated_fields",
+                "languages",
+                "original_language",
+                "indexed_fields",
+                "partial_indexes",
+                "translation_storage",
+                "search_fields",
+            )
         }
 
     def model_reset(self):
@@ -29,6 +47,7 @@ class TestTranslatedModel(TestCase):
 
     def setUp(self):
         self.model_reset()
+        self.addCleanup(self.model_reset)
 
     def test_get_translated_fields_translated_fields_none(self):
         self.assertSetEqual(
@@ -95,3 +114,939 @@ class TestTranslatedModel(TestCase):
         # Language not set in settings module in the `languages` attribute
         self.model_update(original_language="de")
         self.assertModelCheckFailsWithMessageCode("translated_models.E011")
+
+    def test_check_model_cached(self):
+        self.model.check()
+        with mock.patch.object(
+            self.model, "_check_translated_fields"
+        ) as check_translated_fields:
+            self.model.check()
+        check_translated_fields.assert_not_called()
+
+    def test_check_model_cache_invalidated(self):
+        self.model.check()
+        self.model_update(original_language="xy")
+        self.assertModelCheckFailsWithMessageCode("translated_models.E010")
+
+    def test_check_model_unhashable_attributes(self):
+        self.model_update(translated_fields=[["title"]])
+        self.assertModelCheckFailsWithMessageCode("translated_models.E002")
+
+    def test_check_model_fails_with_E013(self):
+        # Invalid type for the `indexed_fields` attribute
+        self.model_update(indexed_fields="title")
+        self.assertModelCheckFailsWithMessageCode("translated_models.E013")
+
+    def test_check_model_fails_with_E014(self):
+        # Non-translated field in the `indexed_fields` attribute
+        self.model_update(indexed_fields=["premiere_date"])
+        self.assertModelCheckFailsWithMessageCode("translated_models.E014")
+
+    def test_check_model_fails_with_E015(self):
+        # Unknown translation storage
+        self.model_update(translation_storage="hstore")
+        self.assertModelCheckFailsWithMessageCode("translated_models.E015")
+
+    def test_check_model_fails_with_E016(self):
+        # Indexes of the translation fields stored in the JSON field
+        self.model_update(translation_storage="json", indexed_fields=["title"])
+        self.assertModelCheckFailsWithMessageCode("translated_models.E016")
+
+    def test_check_model_fails_with_E017(self):
+        # Invalid type for the `search_fields` attribute
+        self.model_update(search_fields="title")
+        self.assertModelCheckFailsWithMessageCode("translated_models.E017")
+
+    def test_check_model_fails_with_E018(self):
+        # Non-translated field in the `search_fields` attribute
+        self.model_update(search_fields=["premiere_date"])
+        self.assertModelCheckFailsWithMessageCode("translated_models.E018")
+
+    def test_check_model_fails_with_E019(self):
+        # Search of the translation fields stored in the JSON field
+        self.model_update(translation_storage="json", search_fields=["title"])
+        self.assertModelCheckFailsWithMessageCode("translated_models.E019")
+
+    def test_get_translation_index(self):
+        index = self.model.get_translation_index("title_pl", "title_pl_idx")
+        self.assertEqual(index.fields, ["title_pl"])
+        self.assertEqual(index.name, "title_pl_idx")
+        self.assertIsNone(index.condition)
+
+    def test_get_translation_index_partial_indexes(self):
+        self.model_update(partial_indexes=True)
+        index = self.model.get_translation_index("title_pl", "title_pl_idx")
+        self.assertEqual(index.condition, models.Q(title_pl__isnull=False))
+
+
+class TestTranslationFields(TestCase):
+    def test_translation_fields_created(self):
+        self.assertEqual(
+            Movie.get_translation_field_names(), ["title_pl", "genre_pl"]
+        )
+
+    def test_translation_fields_not_created_for_original_language(self):
+        # The name is the attname of the original field
+        self.assertEqual(Movie._meta.get_field("title_en").name, "title")
+
+    def test_translation_field_type(self):
+        field = Movie._meta.get_field("genre_pl")
+        self.assertIsInstance(field, models.CharField)
+        self.assertEqual(field.max_length, 255)
+
+    def test_translation_field_optional(self):
+        field = Movie._meta.get_field("title_pl")
+        self.assertTrue(field.null)
+        self.assertTrue(field.blank)
+
+    def test_translation_field_attributes(self):
+        field = Movie._meta.get_field("title_pl")
+        self.assertEqual(field.translation_of, "title")
+        self.assertEqual(field.translation_language, "pl")
+
+    def test_translation_indexes_created(self):
+        self.assertEqual(
+            [index.fields for index in Book._meta.indexes], [["title_pl"]]
+        )
+
+    def test_translation_indexes_in_migrations(self):
+        state = ModelState.from_model(Book)
+        self.assertEqual(
+            [index.fields for index in state.options["indexes"]],
+            [["title_pl"]],
+        )
+
+    def test_translation_indexes_not_created(self):
+        self.assertEqual(Movie._meta.indexes, [])
+
+
+class TestTranslatedModelQuerySet(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Book.objects.create(title="Solaris", title_pl="Solaris (pl)")
+
+    def test_get_translation_field_names(self):
+        self.assertEqual(Book.get_translation_field_names(), ["title_pl"])
+
+    def test_for_language_defers_other_languages(self):
+        book = Book.objects.for_language("en").get()
+        self.assertSetEqual(book.get_deferred_fields(), {"title_pl"})
+
+    def test_for_language_loads_given_language(self):
+        book = Book.objects.for_language("pl").get()
+        self.assertSetEqual(book.get_deferred_fields(), set())
+
+    def test_for_language_falls_back_to_base_language(self):
+        book = Book.objects.for_language("pl-pl").get()
+        self.assertSetEqual(book.get_deferred_fields(), set())
+
+    def test_active_language(self):
+        with translation.override("en"):
+            book = Book.objects.active_language().get()
+        self.assertSetEqual(book.get_deferred_fields(), {"title_pl"})
+
+    def test_with_translations(self):
+        Book.objects.create(title="Ubik")
+        self.assertQuerysetEqual(
+            Book.objects.with_translations("pl").order_by("pk"),
+            ["Solaris (pl)", "Ubik"],
+            transform=lambda book: book.title_translated,
+        )
+
+    def test_with_translations_empty_translation(self):
+        Book.objects.create(title="Ubik", title_pl="")
+        book = Book.objects.with_translations("pl").get(title="Ubik")
+        self.assertEqual(book.title_translated, "Ubik")
+
+    def test_with_translations_defers_translation_fields(self):
+        book = Book.objects.with_translations("pl").get()
+        self.assertSetEqual(book.get_deferred_fields(), {"title_pl"})
+
+    def test_with_translations_resolves_translated_attributes(self):
+        book = Book.objects.with_translations("pl").get()
+        with self.assertNumQueries(0):
+            self.assertEqual(book.title, "Solaris (pl)")
+
+    def test_with_translations_active_language(self):
+        with translation.override("pl"):
+            book = Book.objects.with_translations().get()
+        self.assertEqual(book.title_translated, "Solaris (pl)")
+
+    @override_settings(
+        LANGUAGES=[("en", "English"), ("pl", "Polish"), ("de", "German")],
+        TRANSLATED_MODELS_FALLBACK_LANGUAGES={"de": ["pl"]},
+    )
+    def test_with_translations_fallback_languages(self):
+        book = Book.objects.with_translations("de").get()
+        self.assertEqual(book.title_translated, "Solaris (pl)")
+
+
+class TestTranslatedModelQuerySetLookups(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Book.objects.create(title="Solaris", title_pl="Solaris (pl)")
+        Book.objects.create(title="Ubik", title_pl="")
+        Book.objects.create(title="Eden", title_pl="Zeden")
+
+    def test_filter_unbound(self):
+        self.assertQuerysetEqual(
+            Book.objects.filter(title__endswith="(pl)"), []
+        )
+
+    def test_filter_original_language(self):
+        self.assertQuerysetEqual(
+            Book.objects.for_language("en").filter(title="Eden"),
+            ["Eden"],
+            transform=lambda book: book.title,
+        )
+
+    def test_filter(self):
+        self.assertQuerysetEqual(
+            Book.objects.for_language("pl").filter(title__endswith="(pl)"),
+            ["Solaris (pl)"],
+            transform=lambda book: book.title,
+        )
+
+    def test_filter_falls_back_to_original_language(self):
+        self.assertQuerysetEqual(
+            Book.objects.for_language("pl").filter(title="Ubik"),
+            ["Ubik"],
+            transform=lambda book: book.title,
+        )
+
+    def test_filter_q(self):
+        self.assertQuerysetEqual(
+            Book.objects.for_language("pl")
+            .filter(models.Q(title="Ubik") | models.Q(title="Zeden"))
+            .order_by("pk"),
+            ["Ubik", "Zeden"],
+            transform=lambda book: book.title,
+        )
+
+    def test_exclude(self):
+        self.assertQuerysetEqual(
+            Book.objects.for_language("pl")
+            .exclude(title__startswith="Solaris")
+            .order_by("pk"),
+            ["Ubik", "Zeden"],
+            transform=lambda book: book.title,
+        )
+
+    def test_order_by(self):
+        self.assertQuerysetEqual(
+            Book.objects.for_language("pl").order_by("-title"),
+            ["Zeden", "Ubik", "Solaris (pl)"],
+            transform=lambda book: book.title,
+        )
+
+    def test_order_by_active_language(self):
+        with translation.override("pl"):
+            queryset = Book.objects.active_language().order_by("title")
+        self.assertQuerysetEqual(
+            queryset,
+            ["Solaris (pl)", "Ubik", "Zeden"],
+            transform=lambda book: book.title,
+        )
+
+    def test_values(self):
+        self.assertQuerysetEqual(
+            Book.objects.for_language("pl").values("title").order_by("pk"),
+            [
+                {"title": "Solaris (pl)"},
+                {"title": "Ubik"},
+                {"title": "Zeden"},
+            ],
+        )
+
+    def test_values_transform(self):
+        with register_lookup(models.CharField, Upper):
+            queryset = (
+                Book.objects.for_language("pl")
+                .values("title", "title__upper")
+                .order_by("pk")
+            )
+            # The transforms are applied to the original values
+            self.assertQuerysetEqual(
+                Book.objects.for_language("pl")
+                .values("title__upper")
+                .order_by("pk"),
+                [
+                    {"title__upper": "SOLARIS"},
+                    {"title__upper": "UBIK"},
+                    {"title__upper": "EDEN"},
+                ],
+            )
+            self.assertQuerysetEqual(
+                queryset,
+                [
+                    {"title": "Solaris (pl)", "title__upper": "SOLARIS"},
+                    {"title": "Ubik", "title__upper": "UBIK"},
+                    {"title": "Zeden", "title__upper": "EDEN"},
+                ],
+            )
+
+    def test_values_list(self):
+        queryset = Book.objects.for_language("pl").order_by("pk")
+        self.assertQuerysetEqual(
+            queryset.values_list("pk", "title"),
+            [
+                (book.pk, title)
+                for book, title in zip(
+                    Book.objects.order_by("pk"),
+                    ["Solaris (pl)", "Ubik", "Zeden"],
+                )
+            ],
+        )
+        self.assertQuerysetEqual(
+            queryset.values_list("title", flat=True),
+            ["Solaris (pl)", "Ubik", "Zeden"],
+        )
+        self.assertEqual(
+            queryset.values_list("title", "title_pl", named=True)[0],
+            ("Solaris (pl)", "Solaris (pl)"),
+        )
+        self.assertEqual(
+            queryset.values_list("title", named=True)[2].title, "Zeden"
+        )
+
+    def test_values_list_unbound(self):
+        self.assertQuerysetEqual(
+            Book.objects.order_by("pk").values_list("title", flat=True),
+            ["Solaris", "Ubik", "Eden"],
+        )
+
+    def test_values_all_fields(self):
+        values = Book.objects.order_by("pk").values().first()
+        self.assertEqual(values["title"], "Solaris")
+        self.assertEqual(values["title_pl"], "Solaris (pl)")
+        self.assertNotIn("title_en", values)
+        values = (
+            Book.objects.for_language("pl")
+            .annotate(one=models.Value(1))
+            .order_by("pk")
+            .values()
+            .first()
+        )
+        self.assertEqual(values["title"], "Solaris (pl)")
+        self.assertEqual(values["one"], 1)
+
+    def test_values_alias_collision(self):
+        with self.assertRaises(ValueError):
+            Book.objects.with_translations("pl").values(
+                "title", "title_translated"
+            )
+
+    def test_with_translations_filter(self):
+        book = Book.objects.with_translations("pl").get(title="Zeden")
+        self.assertEqual(book.title_translated, "Zeden")
+
+
+class TestTranslatedValues(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.solaris = Movie.objects.create(
+            title="Solaris",
+            title_pl="Solaris (pl)",
+            genre="Sci-Fi",
+            premiere_date=timezone.now(),
+        )
+
+    def test_translated_values(self):
+        self.assertEqual(
+            list(Movie.objects.translated_values("pl", "pk", "title")),
+            [{"pk": self.solaris.pk, "title": "Solaris (pl)"}],
+        )
+
+    def test_translated_values_fallback(self):
+        self.assertEqual(
+            Movie.objects.translated_values("pl", "genre").get(),
+            {"genre": "Sci-Fi"},
+        )
+
+    def test_translated_values_original_language(self):
+        self.assertEqual(
+            Movie.objects.translated_values("en", "title").get(),
+            {"title": "Solaris"},
+        )
+
+    def test_translated_values_all_fields(self):
+        self.assertCountEqual(
+            Movie.objects.translated_values("pl").get(),
+            ["id", "title", "genre", "premiere_date"],
+        )
+
+    def test_translated_values_all_fields_json_storage(self):
+        Article.objects.create(title="Solaris", title_pl="Solaris (pl)")
+        self.assertEqual(
+            Article.objects.translated_values("pl").get(),
+            {"id": mock.ANY, "title": "Solaris (pl)", "lead": ""},
+        )
+
+    def test_translated_values_iterator(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                list(
+                    Movie.objects.translated_values("pl", "title").iterator(
+                        chunk_size=1
+                    )
+                ),
+                [{"title": "Solaris (pl)"}],
+            )
+
+    def test_translated_values_bound(self):
+        self.assertEqual(
+            Movie.objects.translated_values("pl", "pk")
+            .filter(title__endswith="(pl)")
+            .count(),
+            1,
+        )
+
+    def test_translated_values_table_storage(self):
+        Note.objects.create(title="Solaris", title_pl="Solaris (pl)")
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                list(
+                    Note.objects.for_language("pl").translated_values(
+                        "pl", "title"
+                    )
+                ),
+                [{"title": "Solaris (pl)"}],
+            )
+
+
+class TestSearch(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.solaris = Post.objects.create(
+            title="Solaris",
+            title_pl="Solaris po polsku",
+            body="A planet covered by an ocean.",
+        )
+        cls.stalker = Post.objects.create(
+            title="Stalker",
+            body="A journey through the Zone to a room granting wishes.",
+            body_pl="Podróż przez Zonę do pokoju spełniającego życzenia.",
+        )
+
+    def test_search_indexes(self):
+        indexes = [
+            index
+            for index in Post._meta.indexes
+            if isinstance(index, TranslationSearchIndex)
+        ]
+        self.assertEqual(len(indexes), 2)
+        self.assertEqual(
+            [index.search_fields for index in indexes],
+            [("title", "body"), ("title", "body")],
+        )
+        self.assertEqual(
+            [
+                index.expressions[0].source_expressions[0].value
+                for index in indexes
+            ],
+            ["english", "simple"],
+        )
+
+    def test_search(self):
+        self.assertQuerysetEqual(
+            Post.objects.search("planet ocean", "en"), [self.solaris]
+        )
+
+    def test_search_ranked(self):
+        self.solaris.body = "The Zone, and the Zone again."
+        self.solaris.save()
+        posts = Post.objects.search("zone", "en")
+        self.assertQuerysetEqual(posts, [self.solaris, self.stalker])
+        self.assertGreater(posts[0].search_rank, posts[1].search_rank)
+
+    def test_search_translations(self):
+        self.assertQuerysetEqual(
+            Post.objects.search("polsku", "pl"), [self.solaris]
+        )
+        self.assertQuerysetEqual(Post.objects.search("polsku", "en"), [])
+
+    def test_search_fallback(self):
+        self.assertQuerysetEqual(
+            Post.objects.search("stalker pokoju", "pl"), [self.stalker]
+        )
+
+    def test_search_translations_only(self):
+        # The original values of the translated fields aren't searched
+        self.assertQuerysetEqual(Post.objects.search("journey", "pl"), [])
+
+    def test_search_active_language(self):
+        with translation.override("pl"):
+            self.assertQuerysetEqual(
+                Post.objects.search("życzenia"), [self.stalker]
+            )
+
+    def test_search_updated(self):
+        self.stalker.title_pl = "Pikinik"
+        self.stalker.save()
+        self.assertQuerysetEqual(
+            Post.objects.search("pikinik", "pl"), [self.stalker]
+        )
+
+    def test_search_syntax(self):
+        self.assertQuerysetEqual(
+            Post.objects.search('"ocean" AND OR NEAR(', "en"), []
+        )
+
+    def test_search_empty_query(self):
+        self.assertQuerysetEqual(Post.objects.search(" ", "en"), [])
+
+    def test_search_lazy(self):
+        with self.assertNumQueries(0):
+            posts = Post.objects.search("ocean", "en")
+        Post.objects.create(title="Ocean")
+        with self.assertNumQueries(1):
+            self.assertEqual(posts.count(), 2)
+
+    def test_search_deleted(self):
+        self.solaris.delete()
+        self.assertQuerysetEqual(Post.objects.search("polsku", "pl"), [])
+        self.assertQuerysetEqual(Post.objects.search("ocean", "en"), [])
+
+    def test_search_subquery(self):
+        self.assertQuerysetEqual(
+            Post.objects.filter(
+                pk__in=Post.objects.search("zone", "en").values("pk")
+            ),
+            [self.stalker],
+        )
+
+    def test_search_unsupported_database(self):
+        with mock.patch.object(connections["default"], "vendor", "mysql"):
+            messages = Post.check(databases=["default"])
+        self.assertEqual(
+            [message.id for message in messages], ["translated_models.W001"]
+        )
+
+    def test_search_not_searchable(self):
+        with self.assertRaises(ValueError):
+            Movie.objects.search("solaris")
+
+
+class TestBulkSetTranslations(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.movies = Movie.objects.bulk_create(
+            Movie(title=title, genre="Sci-Fi", premiere_date=timezone.now())
+            for title in ("Solaris", "Ubik", "Eden")
+        )
+
+    def test_bulk_set_translations(self):
+        solaris, ubik, eden = self.movies
+        with self.assertNumQueries(1):
+            count = Movie.objects.bulk_set_translations(
+                "pl",
+                {
+                    solaris.pk: {"title": "Solaris (pl)", "genre": "SF"},
+                    ubik.pk: {"title": "Ubik (pl)"},
+                },
+            )
+        self.assertEqual(count, 2)
+        self.assertQuerysetEqual(
+            Movie.objects.order_by("pk").values_list("title_pl", "genre_pl"),
+            [("Solaris (pl)", "SF"), ("Ubik (pl)", None), (None, None)],
+        )
+
+    def test_bulk_set_translations_batch_size(self):
+        with self.assertNumQueries(2):
+            Movie.objects.bulk_set_translations(
+                "pl",
+                {movie.pk: {"genre": "SF"} for movie in self.movies},
+                batch_size=2,
+            )
+        self.assertEqual(Movie.objects.filter(genre_pl="SF").count(), 3)
+
+    def test_bulk_set_translations_leaves_other_fields(self):
+        Movie.objects.update(genre_pl="SF")
+        solaris, ubik, eden = self.movies
+        Movie.objects.bulk_set_translations(
+            "pl",
+            {solaris.pk: {"genre": "Fantastyka"}, ubik.pk: {"title": "Ubik"}},
+        )
+        self.assertQuerysetEqual(
+            Movie.objects.order_by("pk").values_list("genre_pl", flat=True),
+            ["Fantastyka", "SF", "SF"],
+        )
+
+    def test_bulk_set_translations_invalid_language(self):
+        with self.assertRaises(ValueError):
+            Movie.objects.bulk_set_translations("en", {})
+
+    def test_bulk_set_translations_invalid_field(self):
+        with self.assertRaises(ValueError):
+            Movie.objects.bulk_set_translations(
+                "pl", {self.movies[0].pk: {"premiere_date": None}}
+            )
+
+
+class TestJSONStorage(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.solaris = Article.objects.create(
+            title="Solaris", title_pl="Solaris (pl)"
+        )
+        cls.ubik = Article.objects.create(title="Ubik", lead="A novel")
+
+    def test_translation_fields_have_no_columns(self):
+        self.assertEqual(
+            Article.get_translation_field_names(), ["title_pl", "lead_pl"]
+        )
+        self.assertEqual(
+            [field.name for field in Article._meta.concrete_fields],
+            ["id", "title", "lead", "translations"],
+        )
+
+    def test_translation_fields_not_in_migrations(self):
+        state = ModelState.from_model(Article)
+        self.assertEqual(
+            list(state.fields), ["id", "title", "lead", "translations"]
+        )
+
+    def test_translations_stored_in_json_field(self):
+        self.assertEqual(
+            Article.objects.values_list("translations", flat=True).get(
+                pk=self.solaris.pk
+            ),
+            {"pl": {"title": "Solaris (pl)"}},
+        )
+
+    def test_translation_field_set_none(self):
+        self.solaris.title_pl = None
+        self.assertEqual(self.solaris.translations, {})
+        self.assertIsNone(self.solaris.title_pl)
+
+    def test_translated_attribute(self):
+        article = Article.objects.get(pk=self.solaris.pk)
+        with translation.override("pl"):
+            self.assertEqual(article.title, "Solaris (pl)")
+
+    def test_filter(self):
+        self.assertQuerysetEqual(
+            Article.objects.filter(title_pl__startswith="Solaris"),
+            [self.solaris],
+        )
+        self.assertQuerysetEqual(
+            Article.objects.filter(title_pl__isnull=True), [self.ubik]
+        )
+
+    def test_filter_for_language(self):
+        self.assertQuerysetEqual(
+            Article.objects.for_language("pl").filter(title__endswith="(pl)"),
+            [self.solaris],
+        )
+
+    def test_order_by(self):
+        self.assertQuerysetEqual(
+            Article.objects.for_language("pl").order_by("-title"),
+            ["Ubik", "Solaris (pl)"],
+            transform=lambda article: article.title,
+        )
+
+    def test_with_translations(self):
+        self.assertEqual(
+            Article.objects.with_translations("pl")
+            .values_list("title_translated", flat=True)
+            .get(pk=self.solaris.pk),
+            "Solaris (pl)",
+        )
+
+    def test_bulk_set_translations_merges_translations(self):
+        with self.assertNumQueries(2):
+            count = Article.objects.bulk_set_translations(
+                "pl",
+                {
+                    self.solaris.pk: {"lead": "Powiesc"},
+                    self.ubik.pk: {"title": "Ubik (pl)"},
+                },
+            )
+        self.assertEqual(count, 2)
+        self.assertQuerysetEqual(
+            Article.objects.order_by("pk").values_list(
+                "translations", flat=True
+            ),
+            [
+                {"pl": {"title": "Solaris (pl)", "lead": "Powiesc"}},
+                {"pl": {"title": "Ubik (pl)"}},
+            ],
+        )
+
+    def test_bulk_update_translation_fields(self):
+        self.ubik.lead_pl = "Powiesc"
+        Article.objects.bulk_update([self.ubik], ["lead_pl"])
+        self.assertEqual(
+            Article.objects.get(pk=self.ubik.pk).lead_pl, "Powiesc"
+        )
+
+    def test_translation_coverage(self):
+        self.assertEqual(
+            Article.objects.translation_coverage(),
+            {
+                "total": 2,
+                "translated": {"title": {"pl": 1}, "lead": {"pl": 0}},
+            },
+        )
+
+
+class TestTableStorage(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.solaris = Note.objects.create(
+            title="Solaris", title_pl="Solaris (pl)"
+        )
+        cls.ubik = Note.objects.create(title="Ubik", text="A novel")
+
+    def test_translation_model_created(self):
+        translation_model = Note._meta.get_field("translations").related_model
+        self.assertEqual(translation_model.__name__, "NoteTranslation")
+        self.assertEqual(
+            [field.name for field in translation_model._meta.concrete_fields],
+            ["id", "parent", "language", "title", "text"],
+        )
+        self.assertEqual(
+            translation_model._meta.constraints[0].fields,
+            ("parent", "language"),
+        )
+
+    def test_translation_fields_have_no_columns(self):
+        self.assertEqual(
+            [field.name for field in Note._meta.concrete_fields],
+            ["id", "title", "text"],
+        )
+
+    def test_translations_stored_in_table(self):
+        self.assertQuerysetEqual(
+            self.solaris.translations.all(),
+            [("pl", "Solaris (pl)", None)],
+            transform=lambda row: (row.language, row.title, row.text),
+        )
+
+    def test_translation_field_set(self):
+        self.ubik.text_pl = "Powiesc"
+        self.ubik.save()
+        self.assertEqual(Note.objects.get(pk=self.ubik.pk).text_pl, "Powiesc")
+
+    def test_translation_field_set_other_language_prefetched(self):
+        note = Note.objects.create(
+            title="Eden", title_pl="Eden (pl)", text_pl="Powiesc"
+        )
+        note = Note.objects.for_language("en").get(pk=note.pk)
+        self.assertEqual(note.title_pl, "Eden (pl)")
+        note.title_pl = "Eden (zmieniony)"
+        note.save()
+        self.assertQuerysetEqual(
+            Note.objects.get(pk=note.pk).translations.all(),
+            [("pl", "Eden (zmieniony)", "Powiesc")],
+            transform=lambda row: (row.language, row.title, row.text),
+        )
+
+    def test_translation_field_set_existing_row(self):
+        note = Note.objects.get(pk=self.solaris.pk)
+        note.text_pl = "Powiesc"
+        note.save()
+        self.assertQuerysetEqual(
+            self.solaris.translations.all(),
+            [("pl", "Solaris (pl)", "Powiesc")],
+            transform=lambda row: (row.language, row.title, row.text),
+        )
+
+    def test_translation_fields_loaded_once(self):
+        note = Note.objects.get(pk=self.solaris.pk)
+        with self.assertNumQueries(1):
+            note.title_pl
+            note.text_pl
+
+    def test_for_language_prefetches_translations(self):
+        with self.assertNumQueries(2):
+            with translation.override("pl"):
+                self.assertEqual(
+                    [
+                        note.title
+                        for note in Note.objects.active_language().order_by(
+                            "pk"
+                        )
+                    ],
+                    ["Solaris (pl)", "Ubik"],
+                )
+
+    def test_translation_prefetch_limited_to_languages(self):
+        prefetch = TranslationPrefetch(Note, "pl")
+        self.assertEqual(prefetch.queryset._translation_languages, ("pl",))
+
+    def test_filter(self):
+        self.assertQuerysetEqual(
+            Note.objects.filter(title_pl__startswith="Solaris"),
+            [self.solaris],
+        )
+        self.assertQuerysetEqual(
+            Note.objects.filter(title_pl__isnull=True), [self.ubik]
+        )
+
+    def test_order_by(self):
+        self.assertQuerysetEqual(
+            Note.objects.for_language("pl").order_by("-title"),
+            ["Ubik", "Solaris (pl)"],
+            transform=lambda note: note.title,
+        )
+
+    def test_with_translations(self):
+        self.assertEqual(
+            Note.objects.with_translations("pl")
+            .values_list("title_translated", flat=True)
+            .get(pk=self.solaris.pk),
+            "Solaris (pl)",
+        )
+
+    def test_bulk_set_translations(self):
+        with self.assertNumQueries(3):
+            count = Note.objects.bulk_set_translations(
+                "pl",
+                {
+                    self.solaris.pk: {"text": "Powiesc"},
+                    self.ubik.pk: {"title": "Ubik (pl)"},
+                },
+            )
+        self.assertEqual(count, 2)
+        self.assertQuerysetEqual(
+            Note.objects.order_by("pk").values_list("title_pl", "text_pl"),
+            [("Solaris (pl)", "Powiesc"), ("Ubik (pl)", None)],
+        )
+
+    def test_bulk_update_translation_fields(self):
+        self.ubik.text_pl = "Powiesc"
+        Note.objects.bulk_update([self.ubik], ["text_pl"])
+        self.assertEqual(Note.objects.get(pk=self.ubik.pk).text_pl, "Powiesc")
+
+    def test_translation_coverage(self):
+        self.assertEqual(
+            Note.objects.translation_coverage(),
+            {
+                "total": 2,
+                "translated": {"title": {"pl": 1}, "text": {"pl": 0}},
+            },
+        )
+
+
+class TestTranslationCoverage(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Movie.objects.bulk_create(
+            Movie(
+                title=title,
+                title_pl=title_pl,
+                genre="Sci-Fi",
+                genre_pl=genre_pl,
+                premiere_date=timezone.now(),
+            )
+            for title, title_pl, genre_pl in (
+                ("Solaris", "Solaris (pl)", "Fantastyka"),
+                ("Ubik", "", None),
+                ("Eden", "Eden (pl)", None),
+            )
+        )
+
+    def test_translation_coverage(self):
+        with self.assertNumQueries(1):
+            coverage = Movie.objects.translation_coverage()
+        self.assertEqual(
+            coverage,
+            {
+                "total": 3,
+                "translated": {"title": {"pl": 2}, "genre": {"pl": 1}},
+            },
+        )
+
+    def test_translation_coverage_filtered(self):
+        coverage = Movie.objects.filter(title="Ubik").translation_coverage(
+            fields=["title"]
+        )
+        self.assertEqual(
+            coverage, {"total": 1, "translated": {"title": {"pl": 0}}}
+        )
+
+    def test_translation_coverage_invalid_language(self):
+        with self.assertRaises(ValueError):
+            Movie.objects.translation_coverage(languages=["xx"])
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache"
+            }
+        }
+    )
+    def test_translation_coverage_cached(self):
+        Movie.objects.translation_coverage(timeout=60)
+        with self.assertNumQueries(0):
+            coverage = Movie.objects.translation_coverage(timeout=60)
+        self.assertEqual(coverage["total"], 3)
+
+
+class TestMissingTranslations(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.movies = Movie.objects.bulk_create(
+            Movie(
+                title=title,
+                title_pl=title_pl,
+                genre="Sci-Fi",
+                genre_pl="Fantastyka",
+                premiere_date=timezone.now(),
+            )
+            for title, title_pl in (
+                ("Solaris", "Solaris (pl)"),
+                ("Ubik", ""),
+                ("Eden", None),
+                ("Fiasco", None),
+            )
+        )
+
+    def test_missing(self):
+        self.assertQuerysetEqual(
+            Movie.objects.missing("pl").order_by("pk"),
+            ["Ubik", "Eden", "Fiasco"],
+            transform=lambda movie: movie.title_en,
+        )
+
+    def test_missing_fields(self):
+        self.assertQuerysetEqual(Movie.objects.missing("pl", ["genre"]), [])
+
+    def test_missing_invalid_language(self):
+        with self.assertRaises(ValueError):
+            Movie.objects.missing("en")
+
+    def test_iter_missing(self):
+        with self.assertNumQueries(3):
+            pages = list(
+                Movie.objects.iter_missing("pl", ["title"], page_size=2)
+            )
+        self.assertEqual(
+            pages,
+            [
+                [
+                    {"pk": self.movies[1].pk, "title": "Ubik"},
+                    {"pk": self.movies[2].pk, "title": "Eden"},
+                ],
+                [{"pk": self.movies[3].pk, "title": "Fiasco"}],
+            ],
+        )
+
+    def test_iter_missing_original_values(self):
+        pages = Movie.objects.for_language("pl").iter_missing(
+            "pl", ["title", "genre"], after=self.movies[2].pk
+        )
+        self.assertEqual(
+            next(pages),
+            [{"pk": self.movies[3].pk, "title": "Fiasco", "genre": "Sci-Fi"}],
+        )
+
+    def test_iter_missing_after(self):
+        pages = Movie.objects.for_language("pl").iter_missing(
+            "pl", ["title"], after=self.movies[2].pk
+        )
+        self.assertEqual(
+            next(pages), [{"pk": self.movies[3].pk, "title": "Fiasco"}]
+        )
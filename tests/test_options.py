@@ -0,0 +1,72 @@
+from django.test import TestCase, override_settings
+
+from translated_models.options import TranslationOptions
+
+from .models import Book, Movie
+
+
+class TestTranslationOptions(TestCase):
+    def test_built_at_class_preparation(self):
+        self.assertIsInstance(Movie._translation_meta, TranslationOptions)
+        self.assertIs(Movie._translation_meta.model, Movie)
+
+    def test_fields(self):
+        self.assertEqual(Movie._translation_meta.fields, ("title", "genre"))
+
+    def test_languages(self):
+        self.assertEqual(Movie._translation_meta.languages, ("en", "pl"))
+
+    def test_original_language(self):
+        self.assertEqual(Movie._translation_meta.original_language, "en")
+
+    def test_field_names(self):
+        self.assertDictEqual(
+            dict(Book._translation_meta.field_names["title"]),
+            {"en": "title", "pl": "title_pl"},
+        )
+
+    def test_deferred_field_names(self):
+        meta = Book._translation_meta
+        self.assertEqual(meta.deferred_field_names["en"], ("title_pl",))
+        self.assertEqual(meta.deferred_field_names["pl"], ())
+        self.assertEqual(meta.deferred_field_names[None], ("title_pl",))
+
+    def test_fallback_languages(self):
+        self.assertEqual(
+            Movie._translation_meta.fallback_languages["pl"], ("pl", "en")
+        )
+        self.assertEqual(
+            Movie._translation_meta.fallback_languages[None], ("en",)
+        )
+
+    @override_settings(
+        LANGUAGES=[("en", "English"), ("pl", "Polish"), ("de", "German")],
+        TRANSLATED_MODELS_FALLBACK_LANGUAGES={"de": ["pl"]},
+    )
+    def test_fallback_languages_from_settings(self):
+        meta = Movie._translation_meta
+        self.assertEqual(meta.fallback_languages["de"], ("de", "pl", "en"))
+        self.assertEqual(
+            meta.fallback_field_names["title"]["de"], ("title_pl", "title")
+        )
+        self.assertEqual(meta.deferred_field_names["de"], ())
+
+    def test_get_language(self):
+        meta = Book._translation_meta
+        self.assertEqual(meta.get_language("pl"), "pl")
+        self.assertEqual(meta.get_language("en-us"), "en")
+        self.assertIsNone(meta.get_language("de"))
+        self.assertIsNone(meta.get_language(None))
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            Movie._translation_meta.languages = ()
+        with self.assertRaises(AttributeError):
+            del Movie._translation_meta.fields
+
+    def test_rebuilt_on_setting_changed(self):
+        meta = Movie._translation_meta
+        with override_settings(LANGUAGES=[("en", "English")]):
+            self.assertIsNot(Movie._translation_meta, meta)
+            self.assertEqual(Movie._translation_meta.languages, ("en",))
+        self.assertEqual(Movie._translation_meta.languages, ("en", "pl"))
@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+import translated_models
+from translated_models import models
+
+
+class TestPackage(SimpleTestCase):
+    def test_lazy_exports(self):
+        self.assertIs(
+            translated_models.TranslatedModel, models.TranslatedModel
+        )
+
+    def test_invalid_export(self):
+        with self.assertRaises(AttributeError):
+            translated_models.TranslatedField
+
+    def test_import_time(self):
+        # Importing the package must neither import Django nor require the
+        # settings to be configured
+        env = {
+            name: value
+            for name, value in os.environ.items()
+            if name != "DJANGO_SETTINGS_MODULE"
+        }
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-X",
+                "importtime",
+                "-c",
+                "import translated_models",
+            ],
+            capture_output=True,
+            cwd=settings.BASE_DIR,
+            env=env,
+            text=True,
+            check=True,
+        )
+        modules = [
+            line.rsplit("|", 1)[1].strip()
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:") and "|" in line
+        ]
+        self.assertIn("translated_models", modules)
+        self.assertFalse(
+            [module for module in modules if module.startswith("django")]
+        )
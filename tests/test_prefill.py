@@ -0,0 +1,121 @@
+import threading
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from translated_models.prefill import prefill_translations
+from translated_models.translators import (
+    BaseTranslator,
+    EchoTranslator,
+    get_translator,
+)
+
+from .models import Movie
+
+
+class RecordingTranslator(EchoTranslator):
+    """Translator recording the batches of texts it's called with."""
+
+    def __init__(self):
+        super().__init__("{text} ({language})")
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def translate(self, texts, source_language, target_language):
+        with self.lock:
+            self.batches.append(list(texts))
+        return super().translate(texts, source_language, target_language)
+
+
+class TestPrefillTranslations(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Movie.objects.bulk_create(
+            Movie(
+                title=title,
+                title_pl=title_pl,
+                genre="Drama",
+                premiere_date=timezone.now(),
+            )
+            for title, title_pl in (
+                ("Hamlet", None),
+                ("Hamlet", ""),
+                ("Solaris", "Solaris"),
+                ("Ubik", None),
+            )
+        )
+
+    def test_prefill_translations(self):
+        translator = RecordingTranslator()
+        stats = prefill_translations(
+            Movie.objects.all(), "pl", translator, fields=["title"]
+        )
+        self.assertEqual(stats, {"objects": 3, "texts": 2})
+        self.assertQuerysetEqual(
+            Movie.objects.order_by("pk").values_list("title_pl", flat=True),
+            ["Hamlet (pl)", "Hamlet (pl)", "Solaris", "Ubik (pl)"],
+        )
+
+    def test_prefill_translations_deduplicates_texts(self):
+        translator = RecordingTranslator()
+        prefill_translations(Movie.objects.all(), "pl", translator)
+        self.assertEqual(
+            sorted(text for batch in translator.batches for text in batch),
+            ["Drama", "Hamlet", "Ubik"],
+        )
+
+    def test_prefill_translations_across_pages(self):
+        translator = RecordingTranslator()
+        stats = prefill_translations(
+            Movie.objects.all(),
+            "pl",
+            translator,
+            fields=["title"],
+            page_size=1,
+            batch_size=1,
+        )
+        self.assertEqual(stats, {"objects": 3, "texts": 2})
+
+    def test_prefill_translations_batches(self):
+        translator = RecordingTranslator()
+        prefill_translations(
+            Movie.objects.all(),
+            "pl",
+            translator,
+            fields=["title"],
+            batch_size=1,
+        )
+        self.assertEqual(sorted(translator.batches), [["Hamlet"], ["Ubik"]])
+
+    def test_prefill_translations_invalid_sizes(self):
+        for sizes in ({"page_size": 0}, {"batch_size": -1}):
+            with self.subTest(**sizes):
+                with self.assertRaises(ValueError):
+                    prefill_translations(
+                        Movie.objects.all(), "pl", EchoTranslator(), **sizes
+                    )
+
+
+class TestTranslators(TestCase):
+    def test_base_translator(self):
+        with self.assertRaises(NotImplementedError):
+            BaseTranslator().translate(["Hamlet"], "en", "pl")
+
+    def test_get_translator(self):
+        translator = get_translator(
+            "translated_models.translators.EchoTranslator"
+        )
+        self.assertEqual(
+            translator.translate(["Hamlet"], "en", "pl"), ["Hamlet"]
+        )
+
+    def test_get_translator_not_set(self):
+        self.assertIsNone(get_translator())
+
+    @override_settings(
+        TRANSLATED_MODELS_TRANSLATOR=(
+            "translated_models.translators.EchoTranslator"
+        )
+    )
+    def test_get_translator_setting(self):
+        self.assertIsInstance(get_translator(), EchoTranslator)
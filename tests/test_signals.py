@@ -0,0 +1,72 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from translated_models import signals
+
+from .models import Book, Genre
+
+
+class TestSignals(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.solaris = Book.objects.create(
+            title="Solaris", title_pl="Solaris (pl)"
+        )
+        cls.ubik = Book.objects.create(title="Ubik")
+
+    def connect(self, signal):
+        calls = []
+
+        def receiver(sender, **kwargs):
+            calls.append({"sender": sender, **kwargs})
+
+        signal.connect(receiver)
+        self.addCleanup(signal.disconnect, receiver)
+        return calls
+
+    def test_no_receivers(self):
+        self.assertFalse(signals.translation_resolved.receivers)
+
+    def test_translation_resolved(self):
+        calls = self.connect(signals.translation_resolved)
+        for book in Book.objects.for_language("pl").order_by("pk"):
+            book.title
+            book.title
+        self.assertEqual(
+            [
+                (call["field"], call["resolved_language"], call["fallback"])
+                for call in calls
+            ],
+            [("title", "pl", False), ("title", "en", True)],
+        )
+
+    def test_translation_fields_deferred(self):
+        calls = self.connect(signals.translation_fields_deferred)
+        Book.objects.for_language("en")
+        self.assertEqual(
+            [(call["deferred"], call["loaded"]) for call in calls], [(1, 0)]
+        )
+
+    def test_translation_cache_accessed(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        Genre.cached_objects.lru_cache.clear()
+        self.addCleanup(Genre.cached_objects.lru_cache.clear)
+        genre = Genre.objects.create(name="Drama")
+        calls = self.connect(signals.translation_cache_accessed)
+        Genre.cached_objects.get(pk=genre.pk)
+        Genre.cached_objects.get(pk=genre.pk)
+        self.assertEqual(
+            [(call["cache"], call["hits"], call["misses"]) for call in calls],
+            [("objects", 0, 1), ("objects", 1, 0)],
+        )
+
+    def test_bulk_translation_executed(self):
+        calls = self.connect(signals.bulk_translation_executed)
+        Book.objects.bulk_set_translations(
+            "pl", {self.ubik.pk: {"title": "Ubik (pl)"}}
+        )
+        [call] = calls
+        self.assertEqual(call["operation"], "bulk_set_translations")
+        self.assertEqual(call["rows"], 1)
+        self.assertGreaterEqual(call["duration"], 0)
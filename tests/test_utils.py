@@ -1,6 +1,7 @@
 from django.test import TestCase, override_settings
 
 from translated_models.utils import (
+    get_settings_language_codes,
     is_field_translatable,
     is_language_in_django,
     is_language_in_settings,
@@ -23,12 +24,25 @@ class Tests(TestCase):
     def test_is_language_in_django_invalid_code(self):
         self.assertFalse(is_language_in_django("xy"))
 
+    def test_is_language_in_django_valid_full_code(self):
+        self.assertTrue(is_language_in_django("zh-hans"))
+
     def test_is_language_in_settings_valid_code(self):
         self.assertTrue(is_language_in_settings("en-us"))
 
     def test_is_language_in_settings_invalid_code(self):
         self.assertFalse(is_language_in_settings("de"))
 
+    def test_get_settings_language_codes(self):
+        self.assertEqual(
+            get_settings_language_codes(), frozenset({"en", "pl", "fr"})
+        )
+
+    def test_get_settings_language_codes_cleared_on_setting_changed(self):
+        with override_settings(LANGUAGES=[("de", "German")]):
+            self.assertTrue(is_language_in_settings("de"))
+        self.assertFalse(is_language_in_settings("de"))
+
     def test_is_field_translatable_valid_field(self):
         field = Movie._meta.get_field("title")
         self.assertTrue(is_field_translatable(field))
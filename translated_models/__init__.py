@@ -1,3 +1,31 @@
-from . import settings
-
 __version__ = ""
+
+# Names exported by the package, by the names of the modules they're defined
+# in. The modules are imported once any of the names is accessed, so that
+# importing the package itself doesn't import Django nor access its settings.
+_exports = {
+    "TranslatedModel": "models",
+    "TranslatedModelBase": "models",
+    "TranslatedModelManager": "models",
+    "TranslatedModelQuerySet": "models",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    from importlib import import_module
+
+    try:
+        module = _exports[name]
+    except KeyError:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+    value = getattr(import_module("." + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return [*globals(), *_exports]
@@ -8,3 +8,6 @@ class TranslatedModelsConfig(apps.AppConfig):
 
     def ready(self):
         from . import checks  # noqa: F401
+        from .settings import set_defaults
+
+        set_defaults()
@@ -0,0 +1,217 @@
+import json
+import os
+import time
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from . import signals
+from .models import COLUMNS_STORAGE
+
+
+def load_checkpoint(path):
+    """Return the state of the backfill stored in the checkpoint file of the
+    given path, or None if there's no such file."""
+    try:
+        with open(path, encoding="utf-8") as stream:
+            return json.load(stream)
+    except FileNotFoundError:
+        return None
+
+
+def save_checkpoint(path, state):
+    """Store the state of the backfill in the checkpoint file of the given
+    path, replacing the file atomically, so that it's never left partially
+    written."""
+    temporary_path = "{}.tmp".format(path)
+    with open(temporary_path, "w", encoding="utf-8") as stream:
+        json.dump(state, stream, cls=DjangoJSONEncoder)
+    os.replace(temporary_path, path)
+
+
+def get_eta(state, first_pk, last_pk, elapsed):
+    """Return the estimated number of seconds left to the end of the
+    backfill, based on the part of the range of primary keys processed so
+    far, or None if it can't be estimated, e.g. for non-integer keys."""
+    if not all(isinstance(pk, int) for pk in (first_pk, last_pk)):
+        return None
+    done = state["last_pk"] - first_pk
+    if done <= 0:
+        return None
+    return max(0.0, elapsed * (last_pk - state["last_pk"]) / done)
+
+
+def backfill_batch(queryset, language, fields, translator=None):
+    """Set the missing translations of the given translated fields of the
+    objects of the queryset into the language of the given code, and return
+    the number of the translations set.
+
+    The translations are copied from the original values, or translated
+    with the given translator (see
+    `translated_models.translators.BaseTranslator`). They're written with a
+    single query per field, limited to the objects still missing the
+    translation, so that the ones set meanwhile are left intact. The
+    translator is called before, out of any transaction.
+    """
+    model = queryset.model
+    meta = model._translation_meta
+    count = 0
+    for name in fields:
+        # Objects without the original value have nothing to be translated
+        missing = queryset.missing(language, [name]).filter(
+            **{"{}__gt".format(name): ""}
+        )
+        if translator is None and model.translation_storage == COLUMNS_STORAGE:
+            count += missing.update(
+                **{meta.field_names[name][language]: models.F(name)}
+            )
+            continue
+
+        # The original values are selected by the attname, which isn't
+        # translated, whatever language the queryset is bound to
+        values = dict(
+            missing.values_list("pk", model._meta.get_field(name).attname)
+        )
+        if not values:
+            continue
+        if translator is not None:
+            texts = list(dict.fromkeys(values.values()))
+            translations = dict(
+                zip(
+                    texts,
+                    translator.translate(
+                        texts, meta.original_language, language
+                    ),
+                )
+            )
+            values = {pk: translations[text] for pk, text in values.items()}
+        count += missing.bulk_set_translations(
+            language, {pk: {name: value} for pk, value in values.items()}
+        )
+    return count
+
+
+def backfill_translations(
+    queryset,
+    language,
+    fields=None,
+    translator=None,
+    batch_size=1000,
+    throttle=0,
+    checkpoint=None,
+    progress=None,
+):
+    """Set the missing translations of the objects of the queryset into the
+    language of the given code, e.g. added to the LANGUAGES setting, in
+    batches of the objects of consecutive primary keys, and return the state
+    of the backfill: a dictionary of the primary key of the last object
+    processed (`last_pk`), and of the numbers of the translations set
+    (`translations`) and of the batches processed (`batches`).
+
+    The translations of the given translated fields (all if None) are
+    copied from the original values, or translated with the given
+    translator (see `backfill_batch()`). Each of the batches is written with
+    separate short queries, so that only the rows of the batch are locked
+    for a short time, and the backfill waits for the given number of
+    seconds before the next one, so that the database isn't saturated.
+
+    If the path of the checkpoint file is given, the state is stored there
+    after each batch, and the backfill is resumed from it. The file is
+    removed once the backfill finishes, so that the next backfill processes
+    all the objects again. The function of the progress, if given, is called
+    after each batch with the state, the number of seconds elapsed
+    (`elapsed`), and the estimated number of seconds left (`eta`).
+    """
+    if batch_size <= 0:
+        raise ValueError("Batch size must be a positive integer.")
+
+    started_at = time.perf_counter()
+    model = queryset.model
+    meta = model._translation_meta
+    language = queryset._get_translation_language(language)
+    if fields is None:
+        fields = meta.fields
+    fields = list(fields)
+
+    state = {
+        "model": model._meta.label,
+        "language": language,
+        "fields": fields,
+        "last_pk": None,
+        "translations": 0,
+        "batches": 0,
+    }
+    saved = load_checkpoint(checkpoint) if checkpoint is not None else None
+    if saved is not None:
+        if any(
+            saved.get(key) != state[key]
+            for key in ("model", "language", "fields")
+        ):
+            raise ValueError(
+                "The checkpoint '{}' belongs to another backfill.".format(
+                    checkpoint
+                )
+            )
+        state.update(saved)
+        if state["last_pk"] is not None:
+            state["last_pk"] = model._meta.pk.to_python(state["last_pk"])
+
+    pks = queryset.order_by("pk").values_list("pk", flat=True)
+    # Range of the primary keys to be processed, for the ETA; the objects
+    # created during the backfill are processed too
+    first_pk = state["last_pk"]
+    if first_pk is None:
+        first_pk = pks.first()
+        if isinstance(first_pk, int):
+            first_pk -= 1
+    last_pk = pks.last()
+
+    batches = 0
+    while True:
+        remaining = pks
+        batch = queryset
+        if state["last_pk"] is not None:
+            remaining = remaining.filter(pk__gt=state["last_pk"])
+            batch = batch.filter(pk__gt=state["last_pk"])
+        # Upper bound of the batch, found in the index of the primary key
+        batch_pks = list(remaining[:batch_size])
+        if not batch_pks:
+            break
+        if throttle and batches:
+            time.sleep(throttle)
+
+        state["translations"] += backfill_batch(
+            batch.filter(pk__lte=batch_pks[-1]), language, fields, translator
+        )
+        state["last_pk"] = batch_pks[-1]
+        state["batches"] += 1
+        batches += 1
+        if checkpoint is not None:
+            save_checkpoint(checkpoint, state)
+
+        if progress is not None:
+            elapsed = time.perf_counter() - started_at
+            progress(
+                {
+                    **state,
+                    "elapsed": elapsed,
+                    "eta": get_eta(state, first_pk, last_pk, elapsed),
+                }
+            )
+        if len(batch_pks) < batch_size:
+            break
+
+    if checkpoint is not None:
+        try:
+            os.remove(checkpoint)
+        except FileNotFoundError:
+            pass
+
+    if signals.bulk_translation_executed.receivers:
+        signals.bulk_translation_executed.send(
+            sender=model,
+            operation="backfill_translations",
+            rows=state["translations"],
+            duration=time.perf_counter() - started_at,
+        )
+    return state
@@ -0,0 +1,281 @@
+import copy
+import datetime
+import decimal
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.core.cache import caches
+
+from .settings import get_setting
+
+# Prefix of the keys of the cached translations
+KEY_PREFIX = "translated_models"
+
+# Types of the immutable values of the fields, which the cached rows share
+IMMUTABLE_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    str,
+    bytes,
+    decimal.Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    uuid.UUID,
+)
+
+
+def get_cache():
+    """Return the cache the translations are stored in (see
+    TRANSLATED_MODELS_CACHE setting)."""
+    return caches[get_setting("TRANSLATED_MODELS_CACHE")]
+
+
+def get_version_key(model):
+    """Return the key of the version of the model's cached translations."""
+    return "{}:{}:version".format(KEY_PREFIX, model._meta.label_lower)
+
+
+def get_version(model):
+    """Return the version of the model's cached translations, which is part
+    of the keys of all of them.
+
+    The version starts with the current time, so that the translations
+    cached before the version was evicted from the cache aren't reused.
+    """
+    return get_cache().get_or_set(get_version_key(model), time.time_ns, None)
+
+
+def get_key(model, version, pk, name, language):
+    """Return the key of the cached translation of the field of the given
+    name of the object of the given primary key into the given language."""
+    return "{}:{}:{}:{}:{}:{}".format(
+        KEY_PREFIX, model._meta.label_lower, version, pk, name, language
+    )
+
+
+def get_many(model, pks, fields, language):
+    """Return a dictionary mapping the primary keys of the objects to the
+    dictionaries of the cached translations of the given fields into the
+    given language, omitting the objects missing any of them."""
+    version = get_version(model)
+    keys = {
+        get_key(model, version, pk, name, language): (pk, name)
+        for pk in pks
+        for name in fields
+    }
+    translations = {}
+    for key, value in get_cache().get_many(keys).items():
+        pk, name = keys[key]
+        translations.setdefault(pk, {})[name] = value
+    return {
+        pk: values
+        for pk, values in translations.items()
+        if len(values) == len(fields)
+    }
+
+
+def set_many(model, translations, language):
+    """Cache the translations into the given language, given as a dictionary
+    mapping the primary keys of the objects to the dictionaries of the
+    translations of their fields."""
+    version = get_version(model)
+    get_cache().set_many(
+        {
+            get_key(model, version, pk, name, language): value
+            for pk, values in translations.items()
+            for name, value in values.items()
+        },
+        None,
+    )
+
+
+def delete_many(model, pks):
+    """Invalidate the cached translations of the objects of the given
+    primary keys, of all the fields and languages."""
+    meta = model._translation_meta
+    version = get_version(model)
+    get_cache().delete_many(
+        [
+            get_key(model, version, pk, name, language)
+            for pk in pks
+            for name in meta.fields
+            for language in meta.languages
+        ]
+    )
+
+
+def invalidate(model):
+    """Invalidate all the cached translations of the model by changing their
+    version."""
+    cache = get_cache()
+    key = get_version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The version was evicted from the cache
+        cache.set(key, time.time_ns(), None)
+
+
+def get_generation_key(model):
+    """Return the key of the generation of the model's objects."""
+    return "{}:{}:generation".format(KEY_PREFIX, model._meta.label_lower)
+
+
+def get_generation(model):
+    """Return the generation of the model's objects, which changes once any
+    of them is changed."""
+    return get_cache().get_or_set(
+        get_generation_key(model), time.time_ns, None
+    )
+
+
+async def aget_generation(model):
+    """Asynchronous version of `get_generation()`."""
+    return await get_cache().aget_or_set(
+        get_generation_key(model), time.time_ns, None
+    )
+
+
+def increment_generation(model):
+    """Change the generation of the model's objects."""
+    cache = get_cache()
+    key = get_generation_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The generation was evicted from the cache
+        cache.set(key, time.time_ns(), None)
+
+
+def copy_row(row):
+    """Return a copy of the row, with the mutable values, e.g. the dictionaries
+    of the JSON fields, copied deeply, so that the changes made to them by
+    any of the objects aren't seen by the others."""
+    return tuple(
+        value if isinstance(value, IMMUTABLE_TYPES) else copy.deepcopy(value)
+        for value in row
+    )
+
+
+class LRUCache:
+    """A bounded in-process cache of the rows of a model's objects, given as
+    tuples of the values of the concrete fields, including the translation
+    fields, and evicted in the least recently used order.
+
+    The rows are copied once they're cached and returned, so that the
+    objects built from them share no mutable values.
+
+    The cache is cleared once the generation of the model's objects changes
+    in any process. The generation is looked up in the cache of the
+    TRANSLATED_MODELS_CACHE setting at most once per the refresh interval,
+    in seconds, so that the lookups of the cached rows don't query it.
+    """
+
+    __slots__ = (
+        "model",
+        "maxsize",
+        "refresh_interval",
+        "rows",
+        "generation",
+        "refreshed_at",
+        "hits",
+        "misses",
+        "lock",
+    )
+
+    def __init__(self, model, maxsize, refresh_interval=1.0):
+        self.model = model
+        self.maxsize = maxsize
+        self.refresh_interval = refresh_interval
+        self.rows = OrderedDict()
+        self.generation = None
+        self.refreshed_at = None
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return "<{}: {} ({}/{})>".format(
+            self.__class__.__name__,
+            self.model.__name__,
+            len(self.rows),
+            self.maxsize,
+        )
+
+    def is_fresh(self, now):
+        """Return whether the refresh interval hasn't passed yet."""
+        return (
+            self.refreshed_at is not None
+            and now - self.refreshed_at < self.refresh_interval
+        )
+
+    def refresh(self):
+        """Clear the cache if the generation of the model's objects changed
+        since the last refresh, once the refresh interval passes."""
+        now = time.monotonic()
+        if not self.is_fresh(now):
+            self.set_generation(get_generation(self.model), now)
+
+    async def arefresh(self):
+        """Asynchronous version of `refresh()`, looking the generation up
+        without blocking the event loop."""
+        now = time.monotonic()
+        if not self.is_fresh(now):
+            self.set_generation(await aget_generation(self.model), now)
+
+    def set_generation(self, generation, now):
+        """Clear the cache if the given generation differs from the one the
+        cache was refreshed with last time."""
+        with self.lock:
+            if generation != self.generation:
+                self.rows.clear()
+                self.generation = generation
+            self.refreshed_at = now
+
+    def get(self, pk):
+        """Return the row of the object of the given primary key, or None if
+        it isn't cached."""
+        with self.lock:
+            try:
+                row = self.rows[pk]
+            except KeyError:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.rows.move_to_end(pk)
+        return copy_row(row)
+
+    def set(self, pk, row):
+        """Cache the row of the object of the given primary key, evicting the
+        least recently used row if the cache is full."""
+        row = copy_row(row)
+        with self.lock:
+            self.rows[pk] = row
+            self.rows.move_to_end(pk)
+            if len(self.rows) > self.maxsize:
+                self.rows.popitem(last=False)
+
+    def discard(self, pks):
+        """Evict the rows of the objects of the given primary keys."""
+        with self.lock:
+            for pk in pks:
+                self.rows.pop(pk, None)
+
+    def clear(self):
+        with self.lock:
+            self.rows.clear()
+
+    def info(self):
+        """Return a dictionary of the cache statistics."""
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "maxsize": self.maxsize,
+                "size": len(self.rows),
+            }
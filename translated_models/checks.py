@@ -3,6 +3,8 @@ import os
 from django.conf import global_settings, settings
 from django.core.checks import Error, Tags, register
 
+from .settings import get_setting
+
 django_languages = global_settings.LANGUAGES
 
 
@@ -20,4 +22,23 @@ def check_settings(app_configs, **kwargs):
             )
         )
 
+    fallback_languages = get_setting("TRANSLATED_MODELS_FALLBACK_LANGUAGES")
+    if not (
+        isinstance(fallback_languages, dict)
+        and all(
+            isinstance(code, str)
+            and isinstance(fallbacks, (list, tuple))
+            and all(isinstance(fallback, str) for fallback in fallbacks)
+            for code, fallbacks in fallback_languages.items()
+        )
+    ):
+        errors.append(
+            Error(
+                "TRANSLATED_MODELS_FALLBACK_LANGUAGES setting must be a "
+                "dictionary mapping language codes to collections (list or "
+                "tuple) of language codes.",
+                id="translated_models.E012",
+            )
+        )
+
     return errors
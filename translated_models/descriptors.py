@@ -0,0 +1,104 @@
+from django.db.models.query_utils import DeferredAttribute
+from django.utils.translation import get_language
+
+from . import signals
+
+# Name of the instance attribute caching names of the resolved fields
+CACHE_NAME = "_translation_cache"
+
+# Name of the instance attribute storing the language the instance was
+# fetched for, if any
+LANGUAGE_NAME = "_translation_language"
+
+
+class TranslatedFieldDescriptor:
+    """Accessor to the translation of a translated field into the active
+    language.
+
+    In the `movie.title` example, the value of the `title_pl` field is
+    returned if Polish is active. If the translation is missing, the ones
+    into the fallback languages (see TRANSLATED_MODELS_FALLBACK_LANGUAGES
+    setting) are tried, and the value of the original field is returned
+    eventually. The original value itself is stored under the field's
+    attname, e.g. `title_en` for English being the original language, just
+    like the foreign key values are.
+
+    Setting the attribute sets the original value, whatever the active
+    language, so that the objects created, or changed by forms, keep their
+    original values. It's read back as long as the translation into the
+    active language is missing; set the translation field, e.g.
+    `movie.title_pl`, to change the translation.
+
+    The name of the field the attribute is resolved to is cached per
+    instance and language, and the cache is cleared once any of the
+    translation fields of the instance is set. The instances fetched for a
+    given language (see `TranslatedModelQuerySet.for_language()`) are
+    resolved for that language, without looking up the active one.
+    """
+
+    def __init__(self, field):
+        self.field = field
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        data = instance.__dict__
+        try:
+            language = data[LANGUAGE_NAME]
+        except KeyError:
+            language = get_language()
+        try:
+            attname = data[CACHE_NAME][self.field.name, language]
+        except KeyError:
+            attname = self.resolve(instance, language)
+        return getattr(instance, attname)
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.field.attname] = value
+
+    def resolve(self, instance, language):
+        """Return the attname of the field storing the translation into the
+        language of the given code, or into the first of its fallback
+        languages the translation is available in, caching it in the
+        instance."""
+        field = self.field
+        meta = instance._translation_meta
+
+        attname = field.attname
+        for name in meta.fallback_field_names[field.name][
+            meta.get_language(language)
+        ]:
+            if name == field.name:
+                break
+            if getattr(instance, name) not in (None, ""):
+                attname = name
+                break
+
+        instance.__dict__.setdefault(CACHE_NAME, {})[
+            field.name, language
+        ] = attname
+
+        if signals.translation_resolved.receivers:
+            resolved_field = instance._meta.get_field(attname)
+            resolved_language = getattr(
+                resolved_field, "translation_language", meta.original_language
+            )
+            signals.translation_resolved.send(
+                sender=instance.__class__,
+                instance=instance,
+                field=field.name,
+                language=language,
+                resolved_language=resolved_language,
+                fallback=resolved_language != meta.get_language(language),
+            )
+        return attname
+
+
+class TranslationFieldDescriptor(DeferredAttribute):
+    """Accessor to the value of a translation field, clearing the instance's
+    cache of the resolved translations once the value is set."""
+
+    def __set__(self, instance, value):
+        data = instance.__dict__
+        data[self.field.attname] = value
+        data.pop(CACHE_NAME, None)
@@ -0,0 +1,223 @@
+import functools
+
+from django.db.models import Subquery
+from django.db.models.expressions import Col
+from django.db.models.fields.json import KeyTextTransform, KeyTransform
+from django.db.models.functions import Cast
+from django.db.models.lookups import Exact
+
+from .descriptors import CACHE_NAME
+
+# Name of the instance attribute storing the rows of the translations table
+# loaded, by their languages, None standing for the translations missing
+ROWS_NAME = "_translation_rows"
+
+# Name of the instance attribute storing the names of the fields of the rows
+# of the translations table changed since the instance was saved, by their
+# languages
+CHANGED_ROWS_NAME = "_translation_rows_changed"
+
+
+class JSONTranslationFieldDescriptor:
+    """Accessor to the value of a translation field stored in the JSON field
+    of the translations, clearing the instance's cache of the resolved
+    translations once the value is set."""
+
+    def __init__(self, field):
+        self.field = field
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        field = self.field
+        translations = getattr(instance, field.storage_name) or {}
+        return translations.get(field.translation_language, {}).get(
+            field.translation_of
+        )
+
+    def __set__(self, instance, value):
+        field = self.field
+        translations = getattr(instance, field.storage_name)
+        if translations is None:
+            translations = {}
+            setattr(instance, field.storage_name, translations)
+        # Missing translations are left out of the JSON object, so that it
+        # holds the translations only, whichever languages are added later
+        if value is None:
+            values = translations.get(field.translation_language, {})
+            values.pop(field.translation_of, None)
+            if not values:
+                translations.pop(field.translation_language, None)
+        else:
+            translations.setdefault(field.translation_language, {})[
+                field.translation_of
+            ] = value
+        instance.__dict__.pop(CACHE_NAME, None)
+
+
+def get_translation_rows(instance, storage_name, language):
+    """Return a dictionary mapping the languages to the rows of the table of
+    the translations of the instance, loaded at least for the language of
+    the given code.
+
+    The rows prefetched (see `translated_models.models.TranslationPrefetch`)
+    are used first. The rows of the other languages, if needed, are loaded
+    with a single query, once per instance, bypassing the prefetched rows,
+    which may be limited to some of the languages.
+    """
+    rows = instance.__dict__.setdefault(ROWS_NAME, {})
+    if language in rows:
+        return rows
+
+    prefetched = getattr(instance, "_prefetched_objects_cache", {}).get(
+        storage_name
+    )
+    if prefetched is not None:
+        for row in prefetched:
+            rows.setdefault(row.language, row)
+        # The rows of all the languages are prefetched, unless the prefetch
+        # is limited to some of them
+        languages = prefetched._translation_languages
+        if languages is None:
+            languages = instance._translation_meta.languages
+        for code in languages:
+            rows.setdefault(code, None)
+        if language in rows:
+            return rows
+
+    if not instance._state.adding:
+        relation = instance._meta.get_field(storage_name)
+        for row in relation.related_model._base_manager.filter(
+            **{relation.field.name: instance}
+        ):
+            rows.setdefault(row.language, row)
+    for code in instance._translation_meta.languages:
+        rows.setdefault(code, None)
+    return rows
+
+
+class TableTranslationFieldDescriptor:
+    """Accessor to the value of a translation field stored in the table of
+    the translations, clearing the instance's cache of the resolved
+    translations once the value is set.
+
+    The rows changed are saved once the instance is saved.
+    """
+
+    def __init__(self, field):
+        self.field = field
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        field = self.field
+        row = get_translation_rows(
+            instance, field.storage_name, field.translation_language
+        )[field.translation_language]
+        if row is None:
+            return None
+        return getattr(row, field.translation_of)
+
+    def __set__(self, instance, value):
+        field = self.field
+        language = field.translation_language
+        rows = get_translation_rows(instance, field.storage_name, language)
+        row = rows[language]
+        if row is None:
+            if value is None:
+                return
+            row = rows[language] = field.translation_model(language=language)
+        setattr(row, field.translation_of, value)
+        instance.__dict__.setdefault(CHANGED_ROWS_NAME, {}).setdefault(
+            language, set()
+        ).add(field.translation_of)
+        instance.__dict__.pop(CACHE_NAME, None)
+
+
+class ColumnlessTranslationField:
+    """Mixin of the translation fields stored elsewhere than in their own
+    columns, e.g. in the JSON field of the translations.
+
+    The fields are private and have no column, so they're neither part of
+    the migrations nor of the queries' SELECT clauses. Referring to a field
+    in a lookup, `F()` expression, `order_by()`, or `values()`, refers to the
+    expression returned by `get_col()` instead of a column.
+    """
+
+    def __init__(self, *args, storage_name, **kwargs):
+        self.storage_name = storage_name
+        super().__init__(*args, **kwargs)
+
+    def get_attname_column(self):
+        attname, column = super().get_attname_column()
+        return attname, None
+
+    def contribute_to_class(self, cls, name, private_only=False):
+        super().contribute_to_class(cls, name, private_only=True)
+        # Fields without a column are given no descriptor by Django
+        setattr(cls, self.attname, self.descriptor_class(self))
+
+
+class JSONTranslationField(ColumnlessTranslationField):
+    """Mixin of the translation fields stored in the JSON field of the
+    translations.
+
+    The translation is extracted from the JSON field, e.g. `translations ->
+    'pl' ->> 'title'` in PostgreSQL, and cast to the type of the field.
+    """
+
+    descriptor_class = JSONTranslationFieldDescriptor
+
+    def get_col(self, alias, output_field=None):
+        storage = self.model._meta.get_field(self.storage_name)
+        return Cast(
+            KeyTextTransform(
+                self.translation_of,
+                KeyTransform(
+                    self.translation_language, storage.get_col(alias)
+                ),
+            ),
+            output_field=self,
+        )
+
+
+class TableTranslationField(ColumnlessTranslationField):
+    """Mixin of the translation fields stored in the table of the
+    translations, a row per object and language.
+
+    The translation is selected from the table with a correlated subquery.
+    """
+
+    descriptor_class = TableTranslationFieldDescriptor
+
+    @property
+    def translation_model(self):
+        return self.model._meta.get_field(self.storage_name).related_model
+
+    def get_col(self, alias, output_field=None):
+        relation = self.model._meta.get_field(self.storage_name)
+        translation_model = relation.related_model
+        # The rows are matched with the columns, since the lookups of the
+        # foreign key would leave a join in the subquery to be relabeled
+        queryset = translation_model._base_manager.filter(
+            Exact(
+                relation.field.get_col(translation_model._meta.db_table),
+                Col(alias, self.model._meta.pk),
+            ),
+            language=self.translation_language,
+        ).values(self.translation_of)[:1]
+        return Subquery(queryset, output_field=self)
+
+
+@functools.lru_cache(maxsize=None)
+def get_translation_field_class(mixin, field_class):
+    """Return a subclass of the given field class storing its values as the
+    given mixin of the translation fields does."""
+    return type(
+        "{}{}".format(
+            mixin.__name__.replace("TranslationField", ""),
+            field_class.__name__,
+        ),
+        (mixin, field_class),
+        {"__module__": __name__},
+    )
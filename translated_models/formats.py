@@ -0,0 +1,123 @@
+import csv
+import json
+import re
+
+# Name of the column identifying the rows
+PK_COLUMN = "pk"
+
+
+def write_csv(stream, rows, columns, sources):
+    """Write the rows to the stream as CSV, with a header of the column
+    names."""
+    writer = csv.DictWriter(stream, fieldnames=columns)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+
+
+def read_csv(stream):
+    """Yield the rows read from the CSV stream, empty values being None."""
+    for row in csv.DictReader(stream):
+        yield {column: value or None for column, value in row.items()}
+
+
+def write_jsonl(stream, rows, columns, sources):
+    """Write the rows to the stream as JSON Lines, one object per row."""
+    for row in rows:
+        stream.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+
+
+def read_jsonl(stream):
+    """Yield the rows read from the JSON Lines stream."""
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _po_escape(value):
+    return (
+        value.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+        .replace("\t", "\\t")
+    )
+
+
+_po_unescape_re = re.compile(r"\\(.)")
+
+_po_unescape_map = {"n": "\n", "r": "\r", "t": "\t"}
+
+
+def _po_unescape(value):
+    return _po_unescape_re.sub(
+        lambda match: _po_unescape_map.get(match[1], match[1]), value
+    )
+
+
+def write_po(stream, rows, columns, sources):
+    """Write the rows to the stream as a gettext PO file.
+
+    Each translation of a row is written as a separate entry, with the
+    original value as `msgid` and the context of `<pk>.<column>`. Entries
+    with no original value are skipped, since `msgid` can't be empty.
+    """
+    stream.write('msgid ""\nmsgstr ""\n')
+    stream.write('"Content-Type: text/plain; charset=UTF-8\\n"\n\n')
+    for row in rows:
+        for column, source in sources.items():
+            if not row[source]:
+                continue
+            stream.write(
+                'msgctxt "{}.{}"\nmsgid "{}"\nmsgstr "{}"\n\n'.format(
+                    _po_escape(str(row[PK_COLUMN])),
+                    column,
+                    _po_escape(row[source]),
+                    _po_escape(row[column] or ""),
+                )
+            )
+
+
+def read_po(stream):
+    """Yield the rows read from the gettext PO stream written by
+    `write_po()`, merging consecutive entries of the same row."""
+    row = None
+    for context, value in _read_po_entries(stream):
+        pk, column = context.rsplit(".", 1)
+        if row is None or row[PK_COLUMN] != pk:
+            if row is not None:
+                yield row
+            row = {PK_COLUMN: pk}
+        row[column] = value or None
+    if row is not None:
+        yield row
+
+
+def _read_po_entries(stream):
+    """Yield pairs of `msgctxt` and `msgstr` of the PO stream's entries."""
+    entry = {}
+    keyword = None
+    for line in stream:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith('"'):
+            # Continuation of the previous keyword's string
+            entry[keyword] += _po_unescape(line[1:-1])
+            continue
+        keyword, value = line.split(" ", 1)
+        if keyword == "msgctxt" and "msgid" in entry:
+            if "msgctxt" in entry:
+                yield entry["msgctxt"], entry.get("msgstr", "")
+            entry = {}
+        entry[keyword] = _po_unescape(value[1:-1])
+    if "msgctxt" in entry:
+        yield entry["msgctxt"], entry.get("msgstr", "")
+
+
+# Writers and readers of the formats available, by the formats' names
+FORMATS = {
+    "csv": (write_csv, read_csv),
+    "jsonl": (write_jsonl, read_jsonl),
+    "po": (write_po, read_po),
+}
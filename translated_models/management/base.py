@@ -0,0 +1,155 @@
+import os
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from ..formats import FORMATS
+from ..models import TranslatedModelBase
+from ..translators import get_translator
+
+
+def get_translated_model(label):
+    """Return the translated model of the given label, raising CommandError
+    if there's no such model."""
+    try:
+        model = apps.get_model(label)
+    except (LookupError, ValueError) as e:
+        raise CommandError(str(e))
+    if not issubclass(model, TranslatedModelBase):
+        raise CommandError(
+            "'{}' isn't a translated model.".format(model._meta.label)
+        )
+    return model
+
+
+class TranslationsCommand(BaseCommand):
+    """Base class of the commands transferring the translations of a model
+    from or to a file."""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "model",
+            help="Translated model, in the form of 'app_label.ModelName'.",
+        )
+        parser.add_argument(
+            "-l",
+            "--language",
+            action="append",
+            dest="languages",
+            help=(
+                "Language of the translations. Use multiple times to pass "
+                "more languages. All the model's languages by default."
+            ),
+        )
+        parser.add_argument(
+            "-f",
+            "--field",
+            action="append",
+            dest="fields",
+            help=(
+                "Translated field. Use multiple times to pass more fields. "
+                "All the model's translated fields by default."
+            ),
+        )
+        parser.add_argument(
+            "--format",
+            choices=sorted(FORMATS),
+            help=(
+                "Format of the file. Inferred from the file's extension by "
+                "default, falling back to CSV."
+            ),
+        )
+
+    def get_columns(self, model, languages, fields):
+        """Return a dictionary mapping the names of the translation fields of
+        the given fields (all if None) and languages (all if None) to the
+        names of their translated fields."""
+        meta = model._translation_meta
+
+        if fields is None:
+            fields = meta.fields
+        for name in fields:
+            if name not in meta.fields:
+                raise CommandError(
+                    "'{}' isn't a translated field of '{}'.".format(
+                        name, model._meta.label
+                    )
+                )
+
+        if languages is None:
+            languages = meta.languages
+        else:
+            codes = languages
+            languages = []
+            for code in codes:
+                language = meta.get_language(code)
+                if language is None or language == meta.original_language:
+                    raise CommandError(
+                        "'{}' isn't a translation language of '{}'.".format(
+                            code, model._meta.label
+                        )
+                    )
+                languages.append(language)
+
+        return {
+            meta.field_names[name][language]: name
+            for name in fields
+            for language in languages
+            if language != meta.original_language
+            and language in meta.field_names[name]
+        }
+
+    def get_format(self, format, path):
+        """Return the writer and reader of the given format (inferred from
+        the file's extension if None)."""
+        if format is None:
+            extension = os.path.splitext(path or "")[1][1:].lower()
+            format = extension if extension in FORMATS else "csv"
+        return FORMATS[format]
+
+
+class FillTranslationsCommand(BaseCommand):
+    """Base class of the commands filling the missing translations of a
+    model into a language."""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "model",
+            help="Translated model, in the form of 'app_label.ModelName'.",
+        )
+        parser.add_argument(
+            "-l",
+            "--language",
+            required=True,
+            help="Language of the translations.",
+        )
+        parser.add_argument(
+            "-f",
+            "--field",
+            action="append",
+            dest="fields",
+            help=(
+                "Translated field. Use multiple times to pass more fields. "
+                "All the model's translated fields by default."
+            ),
+        )
+
+    def check_fields(self, model, fields):
+        """Raise CommandError if any of the given fields isn't a translated
+        field of the model."""
+        for name in fields or ():
+            if name not in model._translation_meta.fields:
+                raise CommandError(
+                    "'{}' isn't a translated field of '{}'.".format(
+                        name, model._meta.label
+                    )
+                )
+
+    def get_translator(self, path):
+        """Return the translator of the given import path (see
+        `translated_models.translators.get_translator()`), raising
+        CommandError if it can't be imported."""
+        try:
+            return get_translator(path)
+        except ImportError as e:
+            raise CommandError(str(e))
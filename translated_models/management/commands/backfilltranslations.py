@@ -0,0 +1,110 @@
+import datetime
+import os
+
+from django.core.management.base import CommandError
+
+from ...backfill import backfill_translations
+from ..base import FillTranslationsCommand, get_translated_model
+
+
+class Command(FillTranslationsCommand):
+    help = (
+        "Backfill the missing translations of a translated model into a "
+        "language, e.g. added to the LANGUAGES setting, online, in batches "
+        "of consecutive primary keys. The translations are copied from the "
+        "original values, unless a translator is given."
+    )
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--translator",
+            help=(
+                "Import path of the translator class to machine-translate "
+                "the original values with, instead of copying them."
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of objects processed at once.",
+        )
+        parser.add_argument(
+            "--throttle",
+            type=float,
+            default=0,
+            help="Number of seconds to wait between the batches.",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help=(
+                "Path of the file storing the progress of an unfinished "
+                "backfill, which it's resumed from, and which is removed "
+                "once the backfill finishes. "
+                "'backfill_<app_label>_<model>_<language>.json' by default."
+            ),
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore the progress stored in the checkpoint file.",
+        )
+
+    def handle(self, *args, **options):
+        model = get_translated_model(options["model"])
+
+        translator = None
+        if options["translator"] is not None:
+            translator = self.get_translator(options["translator"])
+
+        fields = options["fields"]
+        self.check_fields(model, fields)
+
+        checkpoint = options["checkpoint"]
+        if checkpoint is None:
+            checkpoint = "backfill_{}_{}.json".format(
+                model._meta.label_lower.replace(".", "_"),
+                options["language"],
+            )
+        if options["restart"]:
+            try:
+                os.remove(checkpoint)
+            except FileNotFoundError:
+                pass
+
+        def progress(state):
+            if options["verbosity"] < 1:
+                return
+            eta = state["eta"]
+            self.stdout.write(
+                "Batch {}: {} translation(s) set up to pk {}, ETA {}.".format(
+                    state["batches"],
+                    state["translations"],
+                    state["last_pk"],
+                    "unknown"
+                    if eta is None
+                    else datetime.timedelta(seconds=round(eta)),
+                )
+            )
+
+        try:
+            state = backfill_translations(
+                model._default_manager.all(),
+                options["language"],
+                fields=fields,
+                translator=translator,
+                batch_size=options["batch_size"],
+                throttle=options["throttle"],
+                checkpoint=checkpoint,
+                progress=progress,
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if options["verbosity"] > 0:
+            self.stdout.write(
+                "Backfilled {} translation(s) in {} batch(es).".format(
+                    state["translations"], state["batches"]
+                )
+            )
@@ -0,0 +1,54 @@
+from django.core.management.base import CommandError
+
+from ...formats import PK_COLUMN
+from ..base import TranslationsCommand, get_translated_model
+
+
+class Command(TranslationsCommand):
+    help = (
+        "Export the translations of a translated model, together with the "
+        "original values, to a CSV, JSON Lines, or gettext PO file."
+    )
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "-o",
+            "--output",
+            help="File to write the translations to. Standard output if "
+            "not given.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Number of rows fetched from the database at once.",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] <= 0:
+            raise CommandError("Chunk size must be a positive integer.")
+        model = get_translated_model(options["model"])
+        sources = self.get_columns(
+            model, options["languages"], options["fields"]
+        )
+        write, read = self.get_format(options["format"], options["output"])
+
+        originals = list(dict.fromkeys(sources.values()))
+        columns = [PK_COLUMN, *originals, *sources]
+
+        # Rows are streamed from the database in chunks, so that the memory
+        # usage doesn't depend on the number of rows
+        rows = (
+            dict(zip(columns, values))
+            for values in model._default_manager.order_by("pk")
+            .values_list("pk", *originals, *sources)
+            .iterator(chunk_size=options["chunk_size"])
+        )
+
+        output = options["output"]
+        if output is None:
+            write(self.stdout, rows, columns, sources)
+            return
+        with open(output, "w", encoding="utf-8", newline="") as stream:
+            write(stream, rows, columns, sources)
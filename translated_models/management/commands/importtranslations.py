@@ -0,0 +1,94 @@
+import itertools
+import sys
+
+from django.core.management.base import CommandError
+
+from ...formats import PK_COLUMN
+from ..base import TranslationsCommand, get_translated_model
+
+
+class Command(TranslationsCommand):
+    help = (
+        "Import the translations of a translated model from a CSV, JSON "
+        "Lines, or gettext PO file, as written by the exporttranslations "
+        "command. Empty translations are skipped."
+    )
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "input",
+            nargs="?",
+            help="File to read the translations from. Standard input if not "
+            "given or '-'.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows updated in a single query.",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] <= 0:
+            raise CommandError("Batch size must be a positive integer.")
+        model = get_translated_model(options["model"])
+        columns = self.get_columns(
+            model, options["languages"], options["fields"]
+        )
+
+        path = options["input"]
+        if path == "-":
+            path = None
+        write, read = self.get_format(options["format"], path)
+
+        if path is None:
+            count = self.import_rows(
+                model, read(sys.stdin), columns, options["batch_size"]
+            )
+        else:
+            with open(path, encoding="utf-8", newline="") as stream:
+                count = self.import_rows(
+                    model, read(stream), columns, options["batch_size"]
+                )
+
+        if options["verbosity"] > 0:
+            self.stdout.write(
+                "Imported translations of {} object(s).".format(count)
+            )
+
+    def import_rows(self, model, rows, columns, batch_size):
+        """Set the translations of the given translation columns of the
+        model's objects to the values of the rows, a batch of rows at a time,
+        and return the number of rows updated."""
+        meta = model._translation_meta
+        to_python = model._meta.pk.to_python
+        languages = {
+            field_name: language
+            for names in meta.field_names.values()
+            for language, field_name in names.items()
+        }
+        queryset = model._default_manager.all()
+
+        count = 0
+        rows = iter(rows)
+        while batch := list(itertools.islice(rows, batch_size)):
+            # Translations are grouped by their languages and set only for
+            # the columns the rows carry them for, so that the other columns
+            # are left intact
+            translations = {}
+            for row in batch:
+                try:
+                    pk = to_python(row[PK_COLUMN])
+                except KeyError:
+                    raise CommandError(
+                        "Missing '{}' column.".format(PK_COLUMN)
+                    )
+                for column, value in row.items():
+                    if column in columns and value not in (None, ""):
+                        translations.setdefault(
+                            languages[column], {}
+                        ).setdefault(pk, {})[columns[column]] = value
+            for language, values in translations.items():
+                count += queryset.bulk_set_translations(language, values)
+        return count
@@ -0,0 +1,71 @@
+from django.core.management.base import CommandError
+
+from ...prefill import prefill_translations
+from ..base import FillTranslationsCommand, get_translated_model
+
+
+class Command(FillTranslationsCommand):
+    help = (
+        "Prefill the missing translations of a translated model into a "
+        "language with a machine translation backend."
+    )
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--translator",
+            help=(
+                "Import path of the translator class. The "
+                "TRANSLATED_MODELS_TRANSLATOR setting by default."
+            ),
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of batches sent to the translator at once.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Number of texts sent to the translator at once.",
+        )
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=500,
+            help="Number of rows fetched from the database at once.",
+        )
+
+    def handle(self, *args, **options):
+        model = get_translated_model(options["model"])
+
+        translator = self.get_translator(options["translator"])
+        if translator is None:
+            raise CommandError(
+                "Pass the --translator option or set the "
+                "TRANSLATED_MODELS_TRANSLATOR setting."
+            )
+
+        fields = options["fields"]
+        self.check_fields(model, fields)
+
+        try:
+            stats = prefill_translations(
+                model._default_manager.all(),
+                options["language"],
+                translator,
+                fields=fields,
+                page_size=options["page_size"],
+                batch_size=options["batch_size"],
+                workers=options["workers"],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if options["verbosity"] > 0:
+            self.stdout.write(
+                "Prefilled translations of {} object(s), translating {} "
+                "text(s).".format(stats["objects"], stats["texts"])
+            )
@@ -0,0 +1,82 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import TranslatedModelBase
+from ..base import get_translated_model
+
+
+class Command(BaseCommand):
+    help = (
+        "Show the percentage of the objects translated into each language, "
+        "for each translated field of the translated models."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models",
+            nargs="*",
+            help="Translated models, in the form of 'app_label.ModelName'. "
+            "All the translated models by default.",
+        )
+        parser.add_argument(
+            "-l",
+            "--language",
+            action="append",
+            dest="languages",
+            help="Language to show the coverage for. Use multiple times to "
+            "pass more languages. All the models' languages by default. The "
+            "models not given, which use none of the languages, are skipped.",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=int,
+            help="Number of seconds to cache the coverage for.",
+        )
+
+    def handle(self, *args, **options):
+        languages = options["languages"]
+        if options["models"]:
+            models = [
+                get_translated_model(label) for label in options["models"]
+            ]
+        else:
+            models = [
+                model
+                for model in apps.get_models()
+                if issubclass(model, TranslatedModelBase)
+            ]
+
+        for model in models:
+            model_languages = languages
+            if languages is not None and not options["models"]:
+                # The models not named explicitly are skipped unless they use
+                # any of the languages
+                meta = model._translation_meta
+                model_languages = [
+                    code
+                    for code in languages
+                    if meta.get_language(code) is not None
+                ]
+                if not model_languages:
+                    continue
+            try:
+                coverage = model._default_manager.translation_coverage(
+                    languages=model_languages, timeout=options["timeout"]
+                )
+            except ValueError as e:
+                raise CommandError(str(e))
+            total = coverage["total"]
+            for name, counts in coverage["translated"].items():
+                for language, count in counts.items():
+                    self.stdout.write(
+                        "{}.{} [{}]: {}".format(
+                            model._meta.label,
+                            name,
+                            language,
+                            "{:.1f}% ({}/{})".format(
+                                100 * count / total, count, total
+                            )
+                            if total
+                            else "n/a",
+                        )
+                    )
@@ -1,26 +1,1279 @@
+import hashlib
+import itertools
 import os
+import time
 
+from asgiref.sync import sync_to_async
+
+from django.apps import apps
 from django.conf import settings
-from django.core.checks import Error
-from django.core.exceptions import FieldDoesNotExist
-from django.db import models
+from django.core.checks import Error, Warning
+from django.core.exceptions import (
+    EmptyResultSet,
+    FieldDoesNotExist,
+    ValidationError,
+)
+from django.core.signals import setting_changed
+from django.db import NotSupportedError, connections, models, transaction
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import Cast, Coalesce, NullIf
+from django.db.models.query import (
+    ModelIterable,
+    NamedValuesListIterable,
+    ValuesIterable,
+    ValuesListIterable,
+)
+from django.db.models.signals import class_prepared, post_delete, post_save
+from django.db.models.utils import create_namedtuple_class
+from django.dispatch import receiver
 from django.utils.text import get_text_list
+from django.utils.translation import get_language
 
+from . import cache, signals
+from .descriptors import (
+    CACHE_NAME,
+    LANGUAGE_NAME,
+    TranslatedFieldDescriptor,
+    TranslationFieldDescriptor,
+)
+from .fields import (
+    CHANGED_ROWS_NAME,
+    ROWS_NAME,
+    JSONTranslationField,
+    TableTranslationField,
+    get_translation_field_class,
+)
+from .options import TranslationOptions
+from .search import (
+    SearchMatch,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TranslationSearchIndex,
+    get_search_config,
+    get_search_query,
+)
+from .settings import get_setting
 from .utils import (
+    get_translation_field_name,
     is_field_translatable,
     is_language_in_django,
     is_language_in_settings,
 )
 
+# Storages of the translations (see `translation_storage` model attribute)
+COLUMNS_STORAGE = "columns"
+JSON_STORAGE = "json"
+TABLE_STORAGE = "table"
+
+# Mixins of the translation fields of the storages other than the columns
+STORAGE_FIELD_MIXINS = {
+    JSON_STORAGE: JSONTranslationField,
+    TABLE_STORAGE: TableTranslationField,
+}
+
+# Name of the JSON field storing the translations of the models using the JSON
+# storage, and of the relation to the table of the translations of the models
+# using the table storage
+TRANSLATIONS_FIELD_NAME = "translations"
+
+
+class TranslatedModelIterable(ModelIterable):
+    """Iterable yielding translated objects bound to the language which the
+    queryset was fetched for."""
+
+    def __iter__(self):
+        queryset = self.queryset
+        language = queryset._translation_language
+        # The translations resolved in the database are used by the
+        # translated fields' descriptors as they were already resolved
+        cache = {
+            (name, language): annotation
+            for name, annotation in queryset._translation_annotations.items()
+        }
+        for obj in super().__iter__():
+            obj.__dict__[LANGUAGE_NAME] = language
+            if cache:
+                obj.__dict__[CACHE_NAME] = cache.copy()
+            yield obj
+
+
+class TranslatedValuesIterable(ValuesIterable):
+    """Iterable yielding a dictionary for each row, with the translations
+    looked up under the names of the translated fields."""
+
+    def __iter__(self):
+        queryset = self.queryset
+        query = queryset.query
+        compiler = query.get_compiler(queryset.db)
+
+        # The keys are renamed once per query, not once per row; the columns
+        # of `extra(select=...)` are always at the start of the row
+        renamed = queryset._translation_values_names
+        names = [
+            renamed.get(name, name)
+            for name in (
+                *query.extra_select,
+                *query.values_select,
+                *query.annotation_select,
+            )
+        ]
+        for row in compiler.results_iter(
+            chunked_fetch=self.chunked_fetch, chunk_size=self.chunk_size
+        ):
+            yield dict(zip(names, row))
+
+
+class TranslatedNamedValuesListIterable(NamedValuesListIterable):
+    """Iterable yielding a named tuple for each row, with the translations
+    looked up under the names of the translated fields."""
+
+    def __iter__(self):
+        queryset = self.queryset
+        renamed = queryset._translation_values_names
+        tuple_class = create_namedtuple_class(
+            *(renamed.get(name, name) for name in queryset._fields)
+        )
+        new = tuple.__new__
+        for row in ValuesListIterable(queryset):
+            yield new(tuple_class, row)
+
+
+class TranslationQuerySet(models.QuerySet):
+    """Database lookup for a set of rows of a table of translations (see
+    `translation_storage` model attribute)."""
+
+    # Languages the rows are limited to, if any (see `TranslationPrefetch`)
+    _translation_languages = None
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._translation_languages = self._translation_languages
+        return clone
+
+
+class TranslationPrefetch(models.Prefetch):
+    """Prefetch of the rows of the table of translations (see
+    `translation_storage` model attribute) of the objects of the given
+    translated model, limited to the language of the given code (the active
+    one if None) and its fallback languages.
+
+    The rows of all the objects are fetched with a single query, so that the
+    translation fields of these languages are read without querying the
+    database for each of the objects. Pass a lookup spanning relations, e.g.
+    `"books__translations"`, to prefetch the rows of the related objects.
+    """
+
+    def __init__(self, model, language=None, lookup=TRANSLATIONS_FIELD_NAME):
+        if language is None:
+            language = get_language()
+        meta = model._translation_meta
+        languages = tuple(
+            code
+            for code in meta.fallback_languages[meta.get_language(language)]
+            if code != meta.original_language
+        )
+        queryset = get_translation_model(model)._default_manager.filter(
+            language__in=languages
+        )
+        queryset._translation_languages = languages
+        super().__init__(lookup, queryset)
+
 
 class TranslatedModelQuerySet(models.QuerySet):
     """Database lookup for a set of translated objects."""
 
+    _translation_language = None
+    _translation_annotations = {}
+    _translation_values_names = {}
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._translation_language = self._translation_language
+        clone._translation_annotations = self._translation_annotations
+        clone._translation_values_names = self._translation_values_names
+        return clone
+
+    def _translate_lookups(self, lookups, select=False):
+        """Return a new QuerySet aliasing the translations of the translated
+        fields the given lookups start with, and a mapping of the names of
+        these fields to the names of the aliases.
+
+        The translations are resolved into the language which the queryset
+        is bound to, along its fallback chain. Nothing is aliased if the
+        queryset isn't bound to any language, or if the chain consists of
+        the original field only, as the original column is looked up then.
+        """
+        language = self._translation_language
+        if language is None:
+            return self, {}
+
+        meta = self.model._translation_meta
+        language = meta.get_language(language)
+
+        names = {}
+        for lookup in lookups:
+            name = lookup.split(LOOKUP_SEP, 1)[0]
+            if (
+                name not in names
+                and name in meta.fallback_field_names
+                and len(meta.fallback_field_names[name][language]) > 1
+            ):
+                names[name] = self._translation_annotations.get(
+                    name, "{}_translated".format(name)
+                )
+        if not names:
+            return self, names
+
+        aliases = {
+            alias: get_translation_expression(self.model, name, language)
+            for name, alias in names.items()
+            if select or alias not in self.query.annotations
+        }
+        if select:
+            return self.annotate(**aliases), names
+        return self.alias(**aliases), names
+
+    @staticmethod
+    def _translate_lookup(lookup, names):
+        """Return the lookup with the name of the translated field it starts
+        with replaced according to the given mapping."""
+        name, *parts = lookup.split(LOOKUP_SEP, 1)
+        if name not in names:
+            return lookup
+        return LOOKUP_SEP.join((names[name], *parts))
+
+    @classmethod
+    def _get_q_lookups(cls, q):
+        """Yield the lookups of the given Q object and the ones nested."""
+        for child in q.children:
+            if isinstance(child, models.Q):
+                yield from cls._get_q_lookups(child)
+            elif isinstance(child, tuple):
+                yield child[0]
+
+    @classmethod
+    def _translate_q(cls, q, names):
+        """Return a copy of the given Q object with the lookups translated
+        according to the given mapping."""
+        children = [
+            cls._translate_q(child, names)
+            if isinstance(child, models.Q)
+            else (cls._translate_lookup(child[0], names), child[1])
+            if isinstance(child, tuple)
+            else child
+            for child in q.children
+        ]
+        return models.Q(*children, _connector=q.connector, _negated=q.negated)
+
+    def _filter_or_exclude_translated(self, method, args, kwargs):
+        clone, names = self._translate_lookups(
+            (
+                *kwargs,
+                *(
+                    lookup
+                    for arg in args
+                    if isinstance(arg, models.Q)
+                    for lookup in self._get_q_lookups(arg)
+                ),
+            )
+        )
+        if names:
+            args = [
+                self._translate_q(arg, names)
+                if isinstance(arg, models.Q)
+                else arg
+                for arg in args
+            ]
+            kwargs = {
+                self._translate_lookup(lookup, names): value
+                for lookup, value in kwargs.items()
+            }
+        return getattr(super(TranslatedModelQuerySet, clone), method)(
+            *args, **kwargs
+        )
+
+    def filter(self, *args, **kwargs):
+        """Return a new QuerySet instance with the args ANDed to the existing
+        set. The lookups of the translated fields are resolved into the
+        language which the queryset is bound to."""
+        return self._filter_or_exclude_translated("filter", args, kwargs)
+
+    def exclude(self, *args, **kwargs):
+        """Return a new QuerySet instance with NOT (args) ANDed to the
+        existing set. The lookups of the translated fields are resolved into
+        the language which the queryset is bound to."""
+        return self._filter_or_exclude_translated("exclude", args, kwargs)
+
+    def order_by(self, *field_names):
+        """Return a new QuerySet instance with the ordering changed. The
+        translated fields are ordered by the translations into the language
+        which the queryset is bound to."""
+        clone, names = self._translate_lookups(
+            field_name.lstrip("-")
+            for field_name in field_names
+            if isinstance(field_name, str)
+        )
+        if names:
+            field_names = [
+                field_name
+                if not isinstance(field_name, str)
+                else "-" + self._translate_lookup(field_name[1:], names)
+                if field_name.startswith("-")
+                else self._translate_lookup(field_name, names)
+                for field_name in field_names
+            ]
+        return super(TranslatedModelQuerySet, clone).order_by(*field_names)
+
+    def _get_values_fields(self):
+        """Return the names of all the fields selected by `values()` and
+        `values_list()` if none are given.
+
+        The translated fields are selected under their names, as the other
+        fields are, rather than under the attnames their original values are
+        stored under (see `TranslatedFieldDescriptor`).
+        """
+        meta = self.model._translation_meta
+        return (
+            *self.query.extra_select,
+            *(
+                field.name if field.name in meta.fields else field.attname
+                for field in self.model._meta.concrete_fields
+            ),
+            *self.query.annotation_select,
+        )
+
+    def _translate_values_fields(self, fields):
+        """Return a new QuerySet selecting the translations of the translated
+        fields of the given names, the fields to be selected instead of the
+        given ones, and a mapping of the aliases of the translations to the
+        names of the translated fields.
+
+        The lookups with transforms or spanning relations, e.g.
+        `title__upper`, and the expressions are selected untranslated.
+        """
+        clone, names = self._translate_lookups(
+            (
+                field
+                for field in fields
+                if isinstance(field, str) and LOOKUP_SEP not in field
+            ),
+            select=True,
+        )
+        lookups = []
+        renamed = {}
+        for field in fields:
+            lookup = field
+            if isinstance(field, str) and LOOKUP_SEP not in field:
+                lookup = self._translate_lookup(field, names)
+            if lookup != field:
+                renamed[lookup] = field
+            lookups.append(lookup)
+        for lookup, field in renamed.items():
+            if lookup in fields:
+                raise ValueError(
+                    "'{}' and '{}' can't be both selected, since both of "
+                    "them are resolved to '{}'.".format(field, lookup, lookup)
+                )
+        return clone, lookups, renamed
+
+    def values(self, *fields, **expressions):
+        """Return a new QuerySet instance yielding dictionaries instead of
+        model instances. The translated fields are returned as translated
+        into the language which the queryset is bound to.
+
+        The translations are selected as the aliases of the translated
+        fields, e.g. `title_translated`, and returned under the names of the
+        fields, so that the aliases themselves can't be requested along with
+        them. The lookups with transforms or spanning relations, e.g.
+        `title__upper`, return the original values.
+        """
+        if not fields and not expressions:
+            fields = self._get_values_fields()
+        clone, lookups, renamed = self._translate_values_fields(fields)
+        clone = super(TranslatedModelQuerySet, clone).values(
+            *lookups, **expressions
+        )
+        if renamed:
+            clone._iterable_class = TranslatedValuesIterable
+            clone._translation_values_names = renamed
+        return clone
+
+    def values_list(self, *fields, flat=False, named=False):
+        """Return a new QuerySet instance yielding tuples instead of model
+        instances. The translated fields are returned as translated into the
+        language which the queryset is bound to, like the ones of `values()`
+        are."""
+        if not fields and not flat:
+            fields = self._get_values_fields()
+        clone, lookups, renamed = self._translate_values_fields(fields)
+        clone = super(TranslatedModelQuerySet, clone).values_list(
+            *lookups, flat=flat, named=named
+        )
+        if renamed and named:
+            clone._iterable_class = TranslatedNamedValuesListIterable
+            clone._translation_values_names = renamed
+        return clone
+
+    def translated_values(self, language, *fields):
+        """Return a new QuerySet yielding a dictionary for each object, of
+        the values of the given fields (all the concrete fields, except for
+        the translation fields, if none), with the translated fields
+        translated into the language of the given code, e.g. `{"id": 1,
+        "title": "Solaris (pl)"}`.
+
+        The translations are resolved in the database along the language's
+        fallback chain, and returned under the names of the translated
+        fields. No model instances are created, so that large querysets can
+        be serialized, e.g. streamed with `iterator()`, cheaply. The QuerySet
+        is bound to the language, like the ones of `for_language()` are.
+        """
+        meta = self.model._translation_meta
+        if not fields:
+            storage_name = None
+            if self.model.translation_storage == JSON_STORAGE:
+                storage_name = TRANSLATIONS_FIELD_NAME
+            fields = [
+                field.name if field.name in meta.fields else field.attname
+                for field in self.model._meta.concrete_fields
+                if not hasattr(field, "translation_of")
+                and field.name != storage_name
+            ]
+        # Nothing is prefetched for the dictionaries
+        clone = self._prefetch_translations(None)
+        clone._translation_language = language
+        return clone.values(*fields)
+
+    def for_language(self, language):
+        """Return a new QuerySet deferring the translation fields of all the
+        languages except for the given one and the original language.
+
+        The translated attributes of the objects fetched are resolved for
+        the given language, regardless of the active one. So are the lookups
+        of the translated fields passed to `filter()`, `exclude()`,
+        `order_by()`, and `values()` afterwards.
+        """
+        meta = self.model._translation_meta
+        deferred_field_names = meta.deferred_field_names[
+            meta.get_language(language)
+        ]
+        clone = self.defer(*deferred_field_names)
+        if self.model.translation_storage == TABLE_STORAGE:
+            clone = clone._prefetch_translations(language)
+        if signals.translation_fields_deferred.receivers:
+            signals.translation_fields_deferred.send(
+                sender=self.model,
+                language=language,
+                deferred=len(deferred_field_names),
+                loaded=len(meta.get_translation_field_names())
+                - len(deferred_field_names),
+            )
+        if clone._iterable_class is ModelIterable:
+            clone._iterable_class = TranslatedModelIterable
+        clone._translation_language = language
+        return clone
+
+    def _prefetch_translations(self, language=None):
+        """Return a new QuerySet prefetching the rows of the table of
+        translations for the given language (see `TranslationPrefetch`),
+        instead of the ones prefetched for any other language."""
+        clone = self._chain()
+        clone._prefetch_related_lookups = (
+            *(
+                lookup
+                for lookup in clone._prefetch_related_lookups
+                if not isinstance(lookup, TranslationPrefetch)
+                or lookup.prefetch_to != TRANSLATIONS_FIELD_NAME
+            ),
+            *(
+                ()
+                if language is None
+                else (TranslationPrefetch(self.model, language),)
+            ),
+        )
+        return clone
+
+    def active_language(self):
+        """Return a new QuerySet deferring the translation fields of all the
+        languages except for the active one and the original language.
+
+        The translated attributes of the objects fetched are resolved for
+        the language active when this method is called.
+        """
+        return self.for_language(get_language())
+
+    def with_translations(self, language=None, fields=None):
+        """Return a new QuerySet annotated with the translations of the given
+        translated fields (all of them if None) into the given language (the
+        active one if None).
+
+        The translations are resolved in the database along the language's
+        fallback chain and annotated as `<field>_translated`, while the
+        translation fields are deferred. The translated attributes of the
+        objects fetched are resolved to the annotations.
+        """
+        if language is None:
+            language = get_language()
+
+        meta = self.model._translation_meta
+        if fields is None:
+            fields = meta.fields
+
+        annotations = {name: "{}_translated".format(name) for name in fields}
+
+        clone = self.for_language(language)
+        clone = clone.defer(
+            *(
+                field_name
+                for name in fields
+                for field_name in meta.field_names[name].values()
+                if field_name != name
+            )
+        )
+        clone = clone.annotate(
+            **{
+                annotation: get_translation_expression(
+                    self.model, name, language
+                )
+                for name, annotation in annotations.items()
+            }
+        )
+        if not set(meta.fields) - set(fields):
+            # All the translations are annotated, so there's nothing left to
+            # prefetch
+            clone = clone._prefetch_translations(None)
+        clone._translation_annotations = {
+            **clone._translation_annotations,
+            **annotations,
+        }
+        return clone
+
+    def search(self, query, language=None):
+        """Return a new QuerySet of the objects matching all the words of the
+        given query in the text search vector of the given language (the
+        active one if None), annotated with their rank as `search_rank` and
+        ordered by it, the best matches first.
+
+        The vector is made of the translations of the model's search fields
+        (see `search_fields` model attribute), each of them resolved along
+        the language's fallback chain, like the ones of `with_translations()`
+        are, and it's looked up with its index. In PostgreSQL, the words are
+        stemmed with the language's text search configuration. In SQLite,
+        the FTS5 table of the vector is joined; the rank is the BM25 score
+        negated, so that the better matches rank higher, as they do in
+        PostgreSQL. Nothing matches a query without words.
+        """
+        meta = self.model._translation_meta
+        if language is None:
+            language = get_language()
+        code = meta.get_language(language) or meta.original_language
+
+        name = get_search_index_name(self.model, code)
+        try:
+            index = next(
+                index
+                for index in self.model._meta.indexes
+                if index.name == name
+            )
+        except StopIteration:
+            raise ValueError(
+                "The model {} isn't searchable. Set its 'search_fields' "
+                "attribute.".format(self.model._meta.label)
+            ) from None
+
+        if not query.split():
+            # There's no word to be matched
+            return self.none()
+
+        connection = connections[self.db]
+        if connection.vendor == "postgresql":
+            vector = index.expressions[0]
+            config = vector.get_source_expressions()[0].value
+            search_query = SearchQuery(config, query)
+            clone = self.filter(SearchMatch(vector, search_query))
+            clone = clone.annotate(
+                search_rank=SearchRank(vector, search_query)
+            )
+        elif connection.vendor == "sqlite":
+            # The FTS5 table is joined by the rowids, i.e. the primary keys
+            quote_name = connection.ops.quote_name
+            table = quote_name(index.name)
+            clone = self.extra(
+                select={"search_rank": "-bm25({})".format(table)},
+                tables=[index.name],
+                where=[
+                    "{}.rowid = {}.{}".format(
+                        table,
+                        quote_name(self.model._meta.db_table),
+                        quote_name(self.model._meta.pk.column),
+                    ),
+                    "{} MATCH %s".format(table),
+                ],
+                params=[get_search_query(query)],
+            )
+        else:
+            raise NotSupportedError(
+                "search() is supported by PostgreSQL and SQLite only."
+            )
+        return clone.order_by("-search_rank")
+
+    def _get_translation_language(self, code):
+        """Return the model's translation language matching the given code,
+        raising ValueError if there's no such language."""
+        meta = self.model._translation_meta
+        language = meta.get_language(code)
+        if language is None or language == meta.original_language:
+            raise ValueError(
+                "'{}' isn't a translation language of '{}'.".format(
+                    code, self.model._meta.label
+                )
+            )
+        return language
+
+    def bulk_set_translations(self, language, translations, batch_size=None):
+        """Set the translations into the language of the given code, given
+        as a dictionary mapping primary keys of the objects to dictionaries
+        mapping names of the translated fields to their translations, and
+        return the number of rows updated.
+
+        The translations are set with a single UPDATE query per batch of
+        objects, using `CASE WHEN pk = ...` statements for each of the
+        translation fields set. No model instances are created, so neither
+        `save()` is called, nor any model signals are sent, like in the case
+        of `update()`. If the translations are stored in the JSON field (see
+        `translation_storage` model attribute), the JSON fields of the batch
+        are selected for update first, and the translations are merged into
+        them. If they're stored in the table of translations, the rows of
+        the batch are inserted, or updated if they exist, with a single
+        `INSERT ... ON CONFLICT` query per the set of the fields given.
+        """
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("Batch size must be a positive integer.")
+
+        started_at = time.perf_counter()
+        meta = self.model._translation_meta
+        language = self._get_translation_language(language)
+
+        fields = {}
+        for values in translations.values():
+            for name in values:
+                if name in fields:
+                    continue
+                try:
+                    field_name = meta.field_names[name][language]
+                except KeyError:
+                    raise ValueError(
+                        "'{}' isn't a translated field of '{}' translated "
+                        "into '{}'.".format(
+                            name, self.model._meta.label, language
+                        )
+                    )
+                fields[name] = self.model._meta.get_field(field_name)
+        if not fields:
+            return 0
+
+        storage = None
+        if self.model.translation_storage != COLUMNS_STORAGE:
+            storage = self.model._meta.get_field(TRANSLATIONS_FIELD_NAME)
+
+        # Primary key is used twice in the query, once in the filter and once
+        # in the WHEN statement
+        self._for_write = True
+        connection = connections[self.db]
+        max_batch_size = connection.ops.bulk_batch_size(
+            ["pk", "pk", *([storage] if storage else fields.values())],
+            translations,
+        )
+        batch_size = min(batch_size or max_batch_size, max_batch_size)
+        requires_casting = connection.features.requires_casted_case_in_updates
+
+        rows_updated = 0
+        queryset = self.using(self.db)
+        with transaction.atomic(using=self.db, savepoint=False):
+            pks = iter(translations)
+            while batch := tuple(itertools.islice(pks, batch_size)):
+                if storage is not None:
+                    if self.model.translation_storage == JSON_STORAGE:
+                        merge = queryset._merge_json_translations
+                    else:
+                        merge = queryset._merge_translation_rows
+                    rows_updated += merge(
+                        language,
+                        {pk: translations[pk] for pk in batch},
+                        fields,
+                    )
+                    continue
+                update_kwargs = {}
+                for name, field in fields.items():
+                    statements = [
+                        models.When(
+                            pk=pk,
+                            then=models.Value(
+                                translations[pk][name], output_field=field
+                            ),
+                        )
+                        for pk in batch
+                        if name in translations[pk]
+                    ]
+                    if not statements:
+                        continue
+                    # The translations of the objects, for which the field
+                    # isn't set, are left intact
+                    case = models.Case(
+                        *statements,
+                        default=models.F(field.attname),
+                        output_field=field,
+                    )
+                    if requires_casting:
+                        case = Cast(case, output_field=field)
+                    update_kwargs[field.attname] = case
+                if update_kwargs:
+                    rows_updated += (
+                        queryset.filter(pk__in=batch)
+                        ._as_base_queryset()
+                        .update(**update_kwargs)
+                    )
+        to_python = self.model._meta.pk.to_python
+        invalidate_objects_on_commit(
+            self.model, [to_python(pk) for pk in translations], self.db
+        )
+        if signals.bulk_translation_executed.receivers:
+            signals.bulk_translation_executed.send(
+                sender=self.model,
+                operation="bulk_set_translations",
+                rows=rows_updated,
+                duration=time.perf_counter() - started_at,
+            )
+        return rows_updated
+
+    def _merge_json_translations(self, language, translations, fields):
+        """Merge the translations, given as in `bulk_set_translations()`, of
+        the given translation fields into the JSON fields of the objects, and
+        return the number of rows updated."""
+        to_python = self.model._meta.pk.to_python
+        translations = {
+            to_python(pk): values for pk, values in translations.items()
+        }
+        objs = list(
+            self.filter(pk__in=translations)
+            .select_for_update()
+            .only(TRANSLATIONS_FIELD_NAME)
+        )
+        for obj in objs:
+            for name, value in translations[obj.pk].items():
+                setattr(obj, fields[name].attname, value)
+        return self._as_base_queryset().bulk_update(
+            objs, [TRANSLATIONS_FIELD_NAME]
+        )
+
+    def _merge_translation_rows(self, language, translations, fields):
+        """Insert or update the rows of the table of translations into the
+        language of the given code, given as in `bulk_set_translations()`,
+        and return the number of the objects, whose rows are set."""
+        translation_model = get_translation_model(self.model)
+        features = connections[self.db].features
+        to_python = self.model._meta.pk.to_python
+        translations = {
+            to_python(pk): values for pk, values in translations.items()
+        }
+        # Objects missing from the QuerySet are skipped
+        pks = list(
+            self.filter(pk__in=translations).values_list("pk", flat=True)
+        )
+
+        # Rows are grouped by the fields they set, so that the other fields
+        # of the existing rows are left intact
+        rows = {}
+        for pk in pks:
+            rows.setdefault(tuple(sorted(translations[pk])), []).append(
+                translation_model(
+                    parent_id=pk, language=language, **translations[pk]
+                )
+            )
+        for names, objs in rows.items():
+            translation_model._default_manager.using(self.db).bulk_create(
+                objs,
+                update_conflicts=True,
+                update_fields=names,
+                # Conflicts of any unique constraint are handled in MySQL
+                unique_fields=(
+                    ["parent", "language"]
+                    if features.supports_update_conflicts_with_target
+                    else None
+                ),
+            )
+        return len(pks)
+
+    async def abulk_set_translations(
+        self, language, translations, batch_size=None
+    ):
+        """Asynchronous version of `bulk_set_translations()`."""
+        return await sync_to_async(self.bulk_set_translations)(
+            language, translations, batch_size
+        )
+
+    def _as_base_queryset(self):
+        """Return a plain QuerySet of the same objects, whose updates don't
+        invalidate all the cached translations of the model, so that the
+        bulk writes invalidate only the objects they update."""
+        return models.QuerySet(
+            model=self.model,
+            query=self.query.chain(),
+            using=self._db,
+            hints=self._hints,
+        )
+
+    def update(self, **kwargs):
+        """Update all the objects in the QuerySet with the given values and
+        invalidate all the cached translations of the model (see
+        `invalidate_objects_on_commit()`)."""
+        rows_updated = super().update(**kwargs)
+        invalidate_objects_on_commit(self.model, None, self.db)
+        return rows_updated
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        """Update the given fields of each of the given objects and invalidate
+        their cached translations.
+
+        The translation fields stored in the JSON field (see
+        `translation_storage` model attribute) are updated by updating the
+        JSON field as a whole, and the ones stored in the table of
+        translations with `bulk_set_translations()`.
+        """
+        objs = tuple(objs)
+        if self.model.translation_storage == TABLE_STORAGE:
+            fields = self._bulk_update_translation_rows(objs, fields)
+            if not fields:
+                return len(objs)
+        fields = list(
+            dict.fromkeys(
+                getattr(self.model._meta.get_field(name), "storage_name", name)
+                for name in fields
+            )
+        )
+        rows_updated = self._as_base_queryset().bulk_update(
+            objs, fields, batch_size
+        )
+        invalidate_objects_on_commit(
+            self.model, [obj.pk for obj in objs], self.db
+        )
+        return rows_updated
+
+    def _bulk_update_translation_rows(self, objs, fields):
+        """Set the translations of the given translation fields stored in the
+        table of translations to the values of the objects, and return the
+        names of the other fields."""
+        translations = {}
+        other_fields = []
+        for name in fields:
+            field = self.model._meta.get_field(name)
+            if not isinstance(field, TableTranslationField):
+                other_fields.append(name)
+                continue
+            values = translations.setdefault(field.translation_language, {})
+            for obj in objs:
+                values.setdefault(obj.pk, {})[field.translation_of] = getattr(
+                    obj, field.attname
+                )
+        for language, values in translations.items():
+            self.bulk_set_translations(language, values)
+        return other_fields
+
+    def cached_translations(self, pks, language=None, fields=None):
+        """Return a dictionary mapping the given primary keys to dictionaries
+        of the translations of the given translated fields (all if None) into
+        the given language (the active one if None), as resolved by
+        `with_translations()`.
+
+        If the model's translations are cached (see `cache_translations`
+        model attribute), they're looked up in the cache first, with a single
+        query to it, and only the ones missing are fetched with a single
+        database query, and cached then. The cached translations of an
+        object are invalidated once it is saved or deleted, or updated in
+        bulk. The objects not found are omitted.
+        """
+        if language is None:
+            language = get_language()
+
+        meta = self.model._translation_meta
+        if fields is None:
+            fields = meta.fields
+        fields = tuple(fields)
+        code = meta.get_language(language) or meta.original_language
+
+        cached = self.model.cache_translations
+        translations = {}
+        if cached:
+            translations = cache.get_many(self.model, pks, fields, code)
+        missing = [pk for pk in pks if pk not in translations]
+        if cached and signals.translation_cache_accessed.receivers:
+            signals.translation_cache_accessed.send(
+                sender=self.model,
+                cache="translations",
+                hits=len(translations),
+                misses=len(missing),
+            )
+        if missing:
+            queryset = (
+                self.filter(pk__in=missing)
+                .with_translations(language, fields)
+                .values_list(
+                    "pk", *("{}_translated".format(name) for name in fields)
+                )
+            )
+            fetched = {
+                pk: dict(zip(fields, values)) for pk, *values in queryset
+            }
+            if cached:
+                cache.set_many(self.model, fetched, code)
+            translations.update(fetched)
+        return translations
+
+    async def acached_translations(self, pks, language=None, fields=None):
+        """Asynchronous version of `cached_translations()`."""
+        if language is None:
+            # The active language is local to the calling context
+            language = get_language()
+        return await sync_to_async(self.cached_translations)(
+            pks, language, fields
+        )
+
+    def missing(self, language, fields=None):
+        """Return a new QuerySet of the objects missing the translation of any
+        of the given translated fields (all if None) into the language of the
+        given code, i.e. the translation being NULL or empty."""
+        meta = self.model._translation_meta
+        language = self._get_translation_language(language)
+        if fields is None:
+            fields = meta.fields
+
+        condition = models.Q()
+        for name in fields:
+            field_name = meta.field_names[name].get(language)
+            if field_name is not None:
+                condition |= models.Q(
+                    **{"{}__isnull".format(field_name): True}
+                ) | models.Q(**{field_name: ""})
+        if not condition:
+            return self.none()
+        return self.filter(condition)
+
+    def iter_missing(self, language, fields=None, page_size=500, after=None):
+        """Yield pages (lists) of the objects missing the translation of any
+        of the given translated fields (all if None) into the language of the
+        given code, starting after the object of the given primary key.
+
+        The objects are given as dictionaries of the primary key (`pk`) and
+        the original values of the fields. The pages are fetched with keyset
+        pagination, i.e. filtered by the primary key of the last object of
+        the previous page, instead of being offset, so that fetching any of
+        them takes the same time regardless of how deep the page is.
+        """
+        if fields is None:
+            fields = self.model._translation_meta.fields
+        columns = ("pk", *fields)
+
+        queryset = self.missing(language, fields).order_by("pk")
+        while True:
+            page = [
+                dict(zip(columns, values))
+                for values in self._get_missing_page(
+                    queryset, fields, page_size, after
+                )
+            ]
+            if not page:
+                return
+            yield page
+            after = page[-1]["pk"]
+
+    async def aiter_missing(
+        self, language, fields=None, page_size=500, after=None
+    ):
+        """Asynchronous version of `iter_missing()`."""
+        if fields is None:
+            fields = self.model._translation_meta.fields
+        columns = ("pk", *fields)
+
+        queryset = self.missing(language, fields).order_by("pk")
+        while True:
+            page = [
+                dict(zip(columns, values))
+                async for values in self._get_missing_page(
+                    queryset, fields, page_size, after
+                )
+            ]
+            if not page:
+                return
+            yield page
+            after = page[-1]["pk"]
+
+    @staticmethod
+    def _get_missing_page(queryset, fields, page_size, after):
+        """Return a QuerySet of the primary keys and the original values of
+        the given translated fields of the page of the objects starting after
+        the object of the given primary key."""
+        if after is not None:
+            queryset = queryset.filter(pk__gt=after)
+        # The original values are selected by the attnames, which aren't
+        # translated, whatever language the queryset is bound to
+        return queryset.values_list(
+            "pk",
+            *(queryset.model._meta.get_field(name).attname for name in fields),
+        )[:page_size]
+
+    def translation_coverage(self, languages=None, fields=None, timeout=None):
+        """Return a dictionary with the number of the objects (`total`) and
+        the number of the objects translated (`translated`) into the given
+        languages (all if None), for each of the given translated fields (all
+        if None), e.g. `{"total": 3, "translated": {"title": {"pl": 2}}}`.
+
+        All the numbers are computed with a single aggregate query. Raise
+        ValueError if any of the languages isn't the model's. If the timeout
+        is given, the result is cached (see TRANSLATED_MODELS_CACHE setting)
+        for that number of seconds.
+        """
+        meta = self.model._translation_meta
+        if languages is None:
+            languages = meta.languages
+        else:
+            codes = languages
+            languages = []
+            for code in codes:
+                language = meta.get_language(code)
+                if language is None:
+                    raise ValueError(
+                        "'{}' isn't a language of '{}'.".format(
+                            code, self.model._meta.label
+                        )
+                    )
+                languages.append(language)
+        if fields is None:
+            fields = meta.fields
+
+        columns = [
+            (name, language, meta.field_names[name][language])
+            for name in fields
+            for language in languages
+            if language != meta.original_language
+            and language in meta.field_names.get(name, ())
+        ]
+
+        if timeout is not None:
+            try:
+                query, params = self.query.sql_with_params()
+            except EmptyResultSet:
+                query, params = None, ()
+            key = "translated_models.coverage.{}.{}".format(
+                self.model._meta.label_lower,
+                hashlib.md5(
+                    repr((self.db, query, params, columns)).encode()
+                ).hexdigest(),
+            )
+            coverage = cache.get_cache().get(key)
+            if coverage is not None:
+                return coverage
+
+        started_at = time.perf_counter()
+        counts = self.aggregate(
+            total=models.Count("pk"),
+            **{
+                "translated_{}".format(index): models.Count(
+                    "pk",
+                    filter=models.Q(**{"{}__isnull".format(column): False})
+                    & ~models.Q(**{column: ""}),
+                )
+                for index, (name, language, column) in enumerate(columns)
+            },
+        )
+
+        coverage = {"total": counts["total"], "translated": {}}
+        for index, (name, language, column) in enumerate(columns):
+            coverage["translated"].setdefault(name, {})[language] = counts[
+                "translated_{}".format(index)
+            ]
+
+        if signals.bulk_translation_executed.receivers:
+            signals.bulk_translation_executed.send(
+                sender=self.model,
+                operation="translation_coverage",
+                rows=counts["total"],
+                duration=time.perf_counter() - started_at,
+            )
+
+        if timeout is not None:
+            cache.get_cache().set(key, coverage, timeout)
+        return coverage
+
+    async def atranslation_coverage(
+        self, languages=None, fields=None, timeout=None
+    ):
+        """Asynchronous version of `translation_coverage()`."""
+        return await sync_to_async(self.translation_coverage)(
+            languages, fields, timeout
+        )
+
 
 class TranslatedModelManager(
     models.Manager.from_queryset(queryset_class=TranslatedModelQuerySet)
 ):
-    """Default manager of translated objects."""
+    """Default manager of translated objects.
+
+    If the cache size is given, the objects looked up by the primary key
+    with `get()` and `in_bulk()` are cached in each process, up to the given
+    number of objects per database (see `translated_models.cache.LRUCache`),
+    which suits small and rarely changing tables.
+    """
+
+    def __init__(self, cache_size=None, refresh_interval=1.0):
+        super().__init__()
+        self.cache_size = cache_size
+        self.refresh_interval = refresh_interval
+        # Caches of the models using the manager, by the models and the
+        # databases, shared by its copies, e.g. the ones of `db_manager()`
+        self._lru_caches = {}
+
+    @property
+    def lru_cache(self):
+        """Return the in-process cache of the model's objects of the
+        manager's database, or None if the objects aren't cached."""
+        if not self.cache_size:
+            return None
+        key = (self.model, self.db)
+        try:
+            return self._lru_caches[key]
+        except KeyError:
+            return self._lru_caches.setdefault(
+                key,
+                cache.LRUCache(
+                    self.model, self.cache_size, self.refresh_interval
+                ),
+            )
+
+    def get_lru_caches(self):
+        """Return the in-process caches of the model's objects of all the
+        databases."""
+        return [
+            lru_cache
+            for (model, using), lru_cache in self._lru_caches.items()
+            if model is self.model
+        ]
+
+    def _get_cached_pk(self, args, kwargs):
+        """Return the primary key the lookup is made by, or None if it's made
+        by anything else."""
+        if args or len(kwargs) != 1:
+            return None
+        pk = self.model._meta.pk
+        [(lookup, value)] = kwargs.items()
+        if lookup not in ("pk", "pk__exact", pk.name, pk.attname):
+            return None
+        try:
+            return pk.to_python(value)
+        except ValidationError:
+            return None
+
+    def _cache_objects(self, lru_cache, objs):
+        attnames = [
+            field.attname for field in self.model._meta.concrete_fields
+        ]
+        for obj in objs:
+            if not obj.get_deferred_fields():
+                lru_cache.set(
+                    obj.pk, tuple(obj.__dict__[name] for name in attnames)
+                )
+
+    def _get_cached_objects(self, lru_cache, pks):
+        """Return a dictionary of the cached objects of the given primary keys
+        and a list of the primary keys of the objects not cached."""
+        to_python = self.model._meta.pk.to_python
+        objs = {}
+        missing = []
+        for pk in pks:
+            pk = to_python(pk)
+            row = lru_cache.get(pk)
+            if row is None:
+                missing.append(pk)
+            else:
+                objs[pk] = self.model.from_db(self.db, None, row)
+        self._send_cache_accessed(len(objs), len(missing))
+        return objs, missing
+
+    def _send_cache_accessed(self, hits, misses=None):
+        """Send the signal of the given numbers of the hits and misses of the
+        in-process cache, or of a single hit or miss if a boolean is given
+        only."""
+        if signals.translation_cache_accessed.receivers:
+            if misses is None:
+                hits, misses = int(hits), int(not hits)
+            signals.translation_cache_accessed.send(
+                sender=self.model, cache="objects", hits=hits, misses=misses
+            )
+
+    def get(self, *args, **kwargs):
+        lru_cache = self.lru_cache
+        pk = None if lru_cache is None else self._get_cached_pk(args, kwargs)
+        if pk is None:
+            return super().get(*args, **kwargs)
+
+        lru_cache.refresh()
+        row = lru_cache.get(pk)
+        self._send_cache_accessed(row is not None)
+        if row is not None:
+            return self.model.from_db(self.db, None, row)
+
+        obj = super().get(*args, **kwargs)
+        self._cache_objects(lru_cache, [obj])
+        return obj
+
+    def in_bulk(self, id_list=None, *, field_name="pk"):
+        lru_cache = self.lru_cache
+        if lru_cache is None or id_list is None or field_name != "pk":
+            return super().in_bulk(id_list, field_name=field_name)
+
+        lru_cache.refresh()
+        objs, missing = self._get_cached_objects(lru_cache, id_list)
+        if missing:
+            fetched = super().in_bulk(missing)
+            self._cache_objects(lru_cache, fetched.values())
+            objs.update(fetched)
+        return objs
+
+    async def aget(self, *args, **kwargs):
+        # The objects cached in the process are returned without switching
+        # to a thread, except for looking the generation up once per the
+        # refresh interval
+        lru_cache = self.lru_cache
+        pk = None if lru_cache is None else self._get_cached_pk(args, kwargs)
+        if pk is None:
+            return await super().aget(*args, **kwargs)
+
+        await lru_cache.arefresh()
+        row = lru_cache.get(pk)
+        self._send_cache_accessed(row is not None)
+        if row is not None:
+            return self.model.from_db(self.db, None, row)
+
+        obj = await super().aget(*args, **kwargs)
+        self._cache_objects(lru_cache, [obj])
+        return obj
+
+    async def ain_bulk(self, id_list=None, *, field_name="pk"):
+        lru_cache = self.lru_cache
+        if lru_cache is None or id_list is None or field_name != "pk":
+            return await super().ain_bulk(id_list, field_name=field_name)
+
+        await lru_cache.arefresh()
+        objs, missing = self._get_cached_objects(lru_cache, id_list)
+        if missing:
+            fetched = await super().ain_bulk(missing)
+            self._cache_objects(lru_cache, fetched.values())
+            objs.update(fetched)
+        return objs
+
+
+# Results of the checks of the translated models, by the models and the values
+# the checks depend on
+check_results = {}
 
 
 class TranslatedModelBase(models.Model):
@@ -30,7 +1283,9 @@ class TranslatedModelBase(models.Model):
 
     # A collection (list, tuple, or set) of names for the model fields, for
     # which translation fields are created and appended to the model. If None,
-    # all the CharFields and TextFields
+    # all the CharFields and TextFields. Translation fields are named after
+    # the field and the language, e.g. `title_pl`, and are created when the
+    # model class is prepared.
     translated_fields = None
 
     # A collection (list, tuple, or set) of languages codes, for which
@@ -47,9 +1302,55 @@ class TranslatedModelBase(models.Model):
     # simply a hook representing a language which the content of the original
     # field is given in.
 
+    # A collection (list, tuple, or set) of names for the translated fields,
+    # whose translation fields are indexed, one index per language. The
+    # indexes are returned by `get_translation_index()` class method and
+    # appended to the model's `Meta.indexes`, so they are picked up by the
+    # migrations. If None, no indexes are created.
+    indexed_fields = None
+
+    # Whether the translations resolved by `cached_translations()` queryset
+    # method are cached across the processes, with the cache of the
+    # TRANSLATED_MODELS_CACHE setting. If True, the translations of the
+    # objects are invalidated once the objects are saved or deleted.
+    cache_translations = False
+
+    # Whether the indexes of the translation fields are partial, i.e. cover
+    # only the rows having the translation, e.g. `WHERE title_pl IS NOT NULL`.
+    # Partial indexes are supported by PostgreSQL and SQLite only.
+    partial_indexes = False
+
+    # Storage of the translations, either "columns", a column per translated
+    # field and language, "json", a single JSON field named `translations`
+    # mapping the languages to the translations of the fields, e.g.
+    # `{"pl": {"title": "..."}}`, or "table", a table of translations with a
+    # row per object and language, e.g. `MovieTranslation(parent, language,
+    # title)`, related to the objects as `translations`. The translation
+    # fields of the latter two have no columns, yet they are looked up in
+    # the same way, and adding a language requires no migration. The rows of
+    # the table of translations are saved along with the objects, thus not
+    # by `bulk_create()`; use `bulk_set_translations()` instead.
+    translation_storage = COLUMNS_STORAGE
+
+    # A collection (list, tuple, or set) of names for the translated fields,
+    # which are searched by `search()` queryset method. A text search vector
+    # of the fields is indexed per language (see `get_search_index()` class
+    # method), made of the translations along the language's fallback chain.
+    # The indexes are appended to the model's `Meta.indexes`, so they are
+    # picked up by the migrations. If None, the model isn't searchable.
+    search_fields = None
+
     class Meta:
         abstract = True
 
+    def refresh_from_db(self, using=None, fields=None):
+        """Reload the field values from the database, along with the rows of
+        the table of translations, if any, unless the fields are given."""
+        super().refresh_from_db(using, fields)
+        if fields is None:
+            self.__dict__.pop(ROWS_NAME, None)
+            self.__dict__.pop(CHANGED_ROWS_NAME, None)
+
     @classmethod
     def get_translated_fields(cls):
         """Return a collection of translation fields."""
@@ -57,8 +1358,9 @@ class TranslatedModelBase(models.Model):
         if translated_fields is None:
             return [
                 field.name
-                for field in cls._meta.get_fields()
+                for field in cls._meta.fields
                 if is_field_translatable(field)
+                and not hasattr(field, "translation_of")
             ]
         return translated_fields
 
@@ -70,16 +1372,104 @@ class TranslatedModelBase(models.Model):
             languages = [code for code, name in settings.LANGUAGES]
         return [language.replace("-", "_") for language in languages]
 
+    @classmethod
+    def get_translation_field_names(cls, languages=None):
+        """Return a list of names of the translation fields available in the
+        model for the given languages (all the model's languages if None)."""
+        return cls._translation_meta.get_translation_field_names(languages)
+
+    @classmethod
+    def get_translation_index(cls, field_name, name):
+        """Return an index of the translation field of the given name, named
+        as given.
+
+        Override this method to use other types of indexes, e.g. GIN indexes
+        with trigram operator classes in PostgreSQL.
+        """
+        condition = None
+        if cls.partial_indexes:
+            condition = models.Q(**{"{}__isnull".format(field_name): False})
+        return models.Index(
+            fields=[field_name], name=name, condition=condition
+        )
+
+    @classmethod
+    def get_search_index(cls, language, fields, name):
+        """Return an index of the text search vector of the translations of
+        the given translated fields into the given language, in the text
+        search configuration of the language, named as given.
+
+        Override this method to use other text search configurations than
+        the ones of the TRANSLATED_MODELS_SEARCH_CONFIGS setting.
+        """
+        return TranslationSearchIndex(
+            SearchVector(
+                get_search_config(language),
+                *(
+                    get_translation_expression(cls, field, language)
+                    for field in fields
+                ),
+            ),
+            name=name,
+            search_fields=fields,
+        )
+
     @classmethod
     def check(cls, **kwargs):
-        """Perform a full model check."""
+        """Perform a full model check.
+
+        The results are cached until any of the model's attributes or the
+        settings the checks depend on change, so the checks of unchanged
+        models are run only once per process.
+        """
+        key = cls._get_check_cache_key(kwargs.get("databases"))
+        try:
+            return list(check_results[key])
+        except KeyError:
+            pass
+        except TypeError:
+            # Some of the attributes are unhashable, thus invalid, and so the
+            # errors are reported without being cached
+            key = None
+
         errors = [
             *cls._check_translated_fields(**kwargs),
             *cls._check_languages(**kwargs),
             *cls._check_original_language(**kwargs),
+            *cls._check_indexed_fields(**kwargs),
+            *cls._check_translation_storage(**kwargs),
+            *cls._check_search_fields(**kwargs),
         ]
+        if key is not None:
+            check_results[key] = tuple(errors)
         return errors
 
+    @classmethod
+    def _get_check_cache_key(cls, databases=None):
+        """Return a key of the model checks' results, made of the model, its
+        attributes, the settings, and the databases the checks depend on."""
+
+        def freeze(value):
+            if isinstance(value, (list, tuple)):
+                return tuple(value)
+            if isinstance(value, set):
+                return frozenset(value)
+            return value
+
+        return (
+            cls,
+            freeze(cls.translated_fields),
+            freeze(cls.languages),
+            cls.original_language,
+            freeze(cls.indexed_fields),
+            cls.translation_storage,
+            freeze(cls.search_fields),
+            tuple(settings.LANGUAGES),
+            tuple(get_setting("TRANSLATED_MODELS_TRANSLATABLE_FIELDS")),
+            os.environ.get("DJANGO_SETTINGS_MODULE"),
+            tuple(databases or ()),
+        )
+
     @classmethod
     def _check_translated_fields(cls, **kwargs):
         """Perform `translated_fields` model attribute check."""
@@ -126,8 +1516,8 @@ class TranslatedModelBase(models.Model):
 
         # Check if all the attribute's values represent translatable field
         if not errors:
-            translatable_fields = (
-                settings.TRANSLATED_MODELS_TRANSLATABLE_FIELDS
+            translatable_fields = get_setting(
+                "TRANSLATED_MODELS_TRANSLATABLE_FIELDS"
             )
             errors += [
                 Error(
@@ -272,6 +1662,508 @@ class TranslatedModelBase(models.Model):
 
         return errors
 
+    @classmethod
+    def _check_indexed_fields(cls, **kwargs):
+        """Perform `indexed_fields` model attribute check."""
+        errors = []
+
+        indexed_fields = cls.indexed_fields
+        if indexed_fields is None:
+            return errors
+
+        # Check if the attribute is of a valid type
+        if not (
+            isinstance(indexed_fields, (list, tuple, set))
+            and all(isinstance(name, str) for name in indexed_fields)
+        ):
+            errors += [
+                Error(
+                    "'indexed_fields' must be None or a collection (list, "
+                    "tuple, or set) of strings.",
+                    obj=cls,
+                    id="translated_models.E013",
+                )
+            ]
+
+        # Check if all the attribute's values represent translated fields
+        if not errors:
+            errors += [
+                Error(
+                    "indexed_fields[{}] = '{}' doesn't represent a name of "
+                    "any of translated fields.".format(index, name),
+                    obj=cls,
+                    id="translated_models.E014",
+                )
+                for index, name in enumerate(indexed_fields)
+                if name not in cls._translation_meta.fields
+            ]
+
+        return errors
+
+    @classmethod
+    def _check_translation_storage(cls, **kwargs):
+        """Perform `translation_storage` model attribute check."""
+        errors = []
+
+        translation_storage = cls.translation_storage
+        storages = (COLUMNS_STORAGE, JSON_STORAGE, TABLE_STORAGE)
+        if translation_storage not in storages:
+            errors += [
+                Error(
+                    "'translation_storage' must be one of: {}.".format(
+                        ", ".join("'{}'".format(name) for name in storages)
+                    ),
+                    obj=cls,
+                    id="translated_models.E015",
+                )
+            ]
+
+        if (
+            not errors
+            and translation_storage != COLUMNS_STORAGE
+            and cls.indexed_fields
+        ):
+            errors += [
+                Error(
+                    "'indexed_fields' isn't supported with the '{}' "
+                    "translation storage, since the translation fields have "
+                    "no columns.".format(translation_storage),
+                    obj=cls,
+                    id="translated_models.E016",
+                )
+            ]
+
+        return errors
+
+    @classmethod
+    def _check_search_fields(cls, **kwargs):
+        """Perform `search_fields` model attribute check."""
+        errors = []
+
+        search_fields = cls.search_fields
+        if search_fields is None:
+            return errors
+
+        # Check if the attribute is of a valid type
+        if not (
+            isinstance(search_fields, (list, tuple, set))
+            and len(search_fields) > 0
+            and all(isinstance(name, str) for name in search_fields)
+        ):
+            errors += [
+                Error(
+                    "'search_fields' must be None or a non-empty collection "
+                    "(list, tuple, or set) of strings.",
+                    obj=cls,
+                    id="translated_models.E017",
+                )
+            ]
+
+        # Check if all the attribute's values represent translated fields
+        if not errors:
+            errors += [
+                Error(
+                    "search_fields[{}] = '{}' doesn't represent a name of "
+                    "any of translated fields.".format(index, name),
+                    obj=cls,
+                    id="translated_models.E018",
+                )
+                for index, name in enumerate(search_fields)
+                if name not in cls._translation_meta.fields
+            ]
+
+        if not errors and cls.translation_storage != COLUMNS_STORAGE:
+            errors += [
+                Error(
+                    "'search_fields' isn't supported with the '{}' "
+                    "translation storage, since the translation fields have "
+                    "no columns.".format(cls.translation_storage),
+                    obj=cls,
+                    id="translated_models.E019",
+                )
+            ]
+
+        # Check if the indexes of the text search vectors can be created in
+        # the databases checked
+        if not errors:
+            errors += [
+                Warning(
+                    "'search_fields' isn't supported by the '{}' database "
+                    "({}), so the model's search indexes can't be created "
+                    "there. Only PostgreSQL and SQLite are supported.".format(
+                        alias, connections[alias].vendor
+                    ),
+                    obj=cls,
+                    id="translated_models.W001",
+                )
+                for alias in kwargs.get("databases") or ()
+                if connections[alias].vendor not in ("postgresql", "sqlite")
+            ]
+
+        return errors
+
+
+def get_translation_field_arguments(field):
+    """Return the arguments of a new field storing the translations of the
+    given field.
+
+    The new field is of the same type and takes the same arguments as the
+    original one, except for being optional, since the translation may be
+    missing, and not being unique, indexed, or bound to a custom column.
+    """
+    name, path, args, kwargs = field.deconstruct()
+    for kwarg in ("primary_key", "unique", "db_index", "db_column", "default"):
+        kwargs.pop(kwarg, None)
+    kwargs.update(null=True, blank=True)
+    return args, kwargs
+
+
+def create_translation_field(field, language, storage=COLUMNS_STORAGE):
+    """Return a new field storing the translation of the given field into
+    the language of the given code, in the given storage (see
+    `translation_storage` model attribute)."""
+    args, kwargs = get_translation_field_arguments(field)
+    kwargs["verbose_name"] = "{} ({})".format(field.verbose_name, language)
+
+    if storage == COLUMNS_STORAGE:
+        translation_field = field.__class__(*args, **kwargs)
+        translation_field.descriptor_class = TranslationFieldDescriptor
+    else:
+        translation_field = get_translation_field_class(
+            STORAGE_FIELD_MIXINS[storage], field.__class__
+        )(*args, storage_name=TRANSLATIONS_FIELD_NAME, **kwargs)
+    translation_field.translation_of = field.name
+    translation_field.translation_language = language
+    return translation_field
+
+
+def create_translation_model(model, fields):
+    """Return a new model of the table of translations of the given fields
+    of the model, named after the model, e.g. `MovieTranslation`.
+
+    The table has a row per object and language, with a foreign key to the
+    object (`parent`), related to it as `translations`, the code of the
+    language (`language`), and a field storing the translation of each of
+    the given fields.
+    """
+    db_table = "{}_translation".format(model._meta.db_table)
+    attrs = {
+        "__module__": model.__module__,
+        "parent": models.ForeignKey(
+            model,
+            on_delete=models.CASCADE,
+            related_name=TRANSLATIONS_FIELD_NAME,
+        ),
+        "language": models.CharField(max_length=15),
+        "objects": TranslationQuerySet.as_manager(),
+        "Meta": type(
+            "Meta",
+            (),
+            {
+                "app_label": model._meta.app_label,
+                "apps": model._meta.apps,
+                "db_table": db_table,
+                "verbose_name": "{} translation".format(
+                    model._meta.verbose_name
+                ),
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=["parent", "language"],
+                        name="{}_language_uniq".format(db_table),
+                    )
+                ],
+            },
+        ),
+    }
+    for field in fields:
+        args, kwargs = get_translation_field_arguments(field)
+        attrs[field.name] = field.__class__(*args, **kwargs)
+    return type("{}Translation".format(model.__name__), (models.Model,), attrs)
+
+
+def get_translation_model(model):
+    """Return the model of the table of translations of the translated
+    model using the table storage (see `translation_storage` model
+    attribute)."""
+    return model._meta.get_field(TRANSLATIONS_FIELD_NAME).related_model
+
+
+def contribute_translation_fields(model):
+    """Add the translation fields to the model for each of its translated
+    fields and languages, except for the original language."""
+    meta = TranslationOptions(model)
+    if meta.original_language is None:
+        # The model is invalid and the error is reported by the model checks
+        return
+
+    local_fields = {field.name: field for field in model._meta.local_fields}
+    model_field_names = {field.name for field in model._meta.fields}
+
+    storage = model.translation_storage
+    if storage not in STORAGE_FIELD_MIXINS:
+        # Invalid values of the attribute are reported by the model checks,
+        # and the translations are stored in the columns then
+        storage = COLUMNS_STORAGE
+    if storage == JSON_STORAGE and meta.fields:
+        if TRANSLATIONS_FIELD_NAME not in model_field_names:
+            models.JSONField(
+                default=dict, blank=True, editable=False
+            ).contribute_to_class(model, TRANSLATIONS_FIELD_NAME)
+    if storage == TABLE_STORAGE:
+        fields = [
+            local_fields[name] for name in meta.fields if name in local_fields
+        ]
+        if fields:
+            create_translation_model(model, fields)
+
+    for name in meta.fields:
+        if name not in local_fields:
+            # Translation fields of the inherited fields belong to the parent
+            continue
+        for language in meta.languages:
+            if language == meta.original_language:
+                continue
+            translation_name = get_translation_field_name(name, language)
+            if translation_name in model_field_names:
+                # Respect the translation fields declared explicitly
+                continue
+            create_translation_field(
+                local_fields[name], language, storage
+            ).contribute_to_class(model, translation_name)
+
+        contribute_translated_field_descriptor(
+            model, local_fields[name], meta.original_language
+        )
+
+
+def contribute_translation_indexes(model):
+    """Append the indexes of the translation fields of the model's local
+    indexed fields to the model's `Meta.indexes`."""
+    meta = model._translation_meta
+    indexed_fields = model.indexed_fields
+    if (
+        not isinstance(indexed_fields, (list, tuple, set))
+        or model.translation_storage != COLUMNS_STORAGE
+    ):
+        # The attribute is either None or invalid, or the translation fields
+        # have no columns, and the error is reported by the model checks
+        return
+
+    local_field_names = {field.name for field in model._meta.local_fields}
+
+    indexes = []
+    for name in meta.fields:
+        if name not in indexed_fields or name not in local_field_names:
+            continue
+        for language, field_name in meta.field_names[name].items():
+            if language == meta.original_language:
+                continue
+            # Name the index in the same way Django names the indexes declared
+            # in `Meta.indexes` without a name
+            index = models.Index(fields=[field_name])
+            index.set_name_with_model(model)
+            indexes.append(model.get_translation_index(field_name, index.name))
+    append_indexes(model, indexes)
+
+
+def get_translation_expression(model, name, language):
+    """Return an expression resolving the translation of the model's
+    translated field of the given name into the language of the given code,
+    falling back to the next languages of the fallback chain if the
+    translation is NULL or empty."""
+    meta = model._translation_meta
+    field = model._meta.get_field(name)
+
+    expressions = [
+        models.F(field_name)
+        if field_name == name
+        else NullIf(models.F(field_name), models.Value(""), output_field=field)
+        for field_name in meta.fallback_field_names[name][
+            meta.get_language(language)
+        ]
+    ]
+    if len(expressions) == 1:
+        return expressions[0]
+    return Coalesce(*expressions, output_field=field)
+
+
+def append_indexes(model, indexes):
+    """Append the given indexes to the model's `Meta.indexes`, except for the
+    ones named as any of the indexes declared explicitly."""
+    index_names = {index.name for index in model._meta.indexes}
+    indexes = [index for index in indexes if index.name not in index_names]
+    if indexes:
+        # The migrations pick up the options found in `original_attrs` only
+        model._meta.indexes = [*model._meta.indexes, *indexes]
+        model._meta.original_attrs["indexes"] = model._meta.indexes
+
+
+def get_search_index_name(model, language):
+    """Return the name of the index of the model's text search vector of the
+    given language.
+
+    The index is named after the model's table and the language, within the
+    30 characters Django allows.
+    """
+    digest = hashlib.md5(
+        "{}.{}".format(model._meta.db_table, language).encode()
+    ).hexdigest()
+    return "{}_{}_{}_fts".format(
+        model._meta.db_table[:11], language[:5], digest[:6]
+    )
+
+
+def contribute_search_indexes(model):
+    """Append the indexes of the text search vectors of the model's search
+    fields, one per language, to the model's `Meta.indexes`."""
+    meta = model._translation_meta
+    search_fields = model.search_fields
+    if (
+        not isinstance(search_fields, (list, tuple, set))
+        or not search_fields
+        or not set(search_fields) <= set(meta.fields)
+        or model.translation_storage != COLUMNS_STORAGE
+    ):
+        # The attribute is either None or invalid, or the translation fields
+        # have no columns, and the error is reported by the model checks
+        return
+
+    fields = [name for name in meta.fields if name in search_fields]
+    append_indexes(
+        model,
+        [
+            model.get_search_index(
+                language, fields, get_search_index_name(model, language)
+            )
+            for language in meta.languages
+        ],
+    )
+
+
+def contribute_translated_field_descriptor(model, field, original_language):
+    """Replace the model attribute of the translated field with a descriptor
+    resolving to the translation into the active language.
+
+    The original value is moved to the field's attname named after the
+    original language, e.g. `title_en`, in the same way as the values of
+    foreign keys are stored under `<name>_id`. The database column remains
+    unchanged.
+    """
+    field.attname = get_translation_field_name(field.name, original_language)
+    setattr(model, field.attname, field.descriptor_class(field))
+    setattr(model, field.name, TranslatedFieldDescriptor(field))
+    model._meta._expire_cache()
+
+
+@receiver(class_prepared)
+def prepare_translated_model(sender, **kwargs):
+    """Add the translation fields and their indexes to a translated model,
+    build its translation metadata, and connect the receivers invalidating
+    its cached objects, once its class is prepared."""
+    if issubclass(sender, TranslatedModelBase):
+        if not sender._meta.proxy:
+            contribute_translation_fields(sender)
+        sender._translation_meta = TranslationOptions(sender)
+        if not sender._meta.proxy:
+            contribute_translation_indexes(sender)
+            contribute_search_indexes(sender)
+        # The receivers are connected to the models caching the objects only,
+        # so that the others can still be deleted without fetching them
+        if sender.cache_translations or any(
+            getattr(manager, "cache_size", None)
+            for manager in sender._meta.managers
+        ):
+            post_save.connect(invalidate_cached_translations, sender=sender)
+            post_delete.connect(invalidate_cached_translations, sender=sender)
+
+
+def invalidate_objects(model, pks=None):
+    """Invalidate the cached translations and rows of the model's objects of
+    the given primary keys (all if None)."""
+    if model.cache_translations:
+        if pks is None:
+            cache.invalidate(model)
+        else:
+            cache.delete_many(model, pks)
+
+    managers = [
+        manager
+        for manager in model._meta.managers
+        if getattr(manager, "cache_size", None)
+    ]
+    if managers:
+        # The caches of the other processes are cleared once they notice the
+        # new generation, while the ones of this process, of all the
+        # databases, are updated at once
+        cache.increment_generation(model)
+        for manager in managers:
+            for lru_cache in manager.get_lru_caches():
+                if pks is None:
+                    lru_cache.clear()
+                else:
+                    lru_cache.discard(pks)
+
+
+def invalidate_objects_on_commit(model, pks, using):
+    """Invalidate the cached translations and rows of the model's objects of
+    the given primary keys (all if None) at once, and once again when the
+    transaction of the given database is committed.
+
+    The latter drops the translations cached meanwhile by the concurrent
+    readers, which still see the values committed before, while the former
+    makes the changes visible within the transaction.
+    """
+    invalidate_objects(model, pks)
+    transaction.on_commit(lambda: invalidate_objects(model, pks), using=using)
+
+
+@receiver(post_save)
+def save_translation_rows(sender, instance, raw=False, **kwargs):
+    """Save the rows of the table of translations of a translated object
+    changed since the object was saved."""
+    changed = instance.__dict__.pop(CHANGED_ROWS_NAME, None)
+    if not changed or raw:
+        return
+    rows = instance.__dict__[ROWS_NAME]
+    for language, names in changed.items():
+        # Only the fields set are saved, so that the other translations of
+        # the row are left intact
+        row = rows[language]
+        if row.pk is not None:
+            row.save(update_fields=names)
+            continue
+        # The row may exist if the object wasn't fetched from the database
+        (
+            rows[language],
+            created,
+        ) = row.__class__._default_manager.update_or_create(
+            parent=instance,
+            language=language,
+            defaults={name: getattr(row, name) for name in names},
+        )
+
+
+def invalidate_cached_translations(sender, instance, using, **kwargs):
+    """Invalidate the cached translations of a translated object once it's
+    saved or deleted (see `invalidate_objects_on_commit()`)."""
+    invalidate_objects_on_commit(sender, [instance.pk], using)
+
+
+@receiver(setting_changed)
+def update_translated_models(setting, **kwargs):
+    """Rebuild the translation metadata of all the translated models once
+    any of the settings it depends on changes."""
+    if setting in (
+        "LANGUAGES",
+        "TRANSLATED_MODELS_TRANSLATABLE_FIELDS",
+        "TRANSLATED_MODELS_FALLBACK_LANGUAGES",
+    ):
+        for model in apps.get_models():
+            if issubclass(model, TranslatedModelBase):
+                model._translation_meta = TranslationOptions(model)
+        # The results are keyed by the settings, so this only frees memory
+        check_results.clear()
+
 
 class TranslatedModel(TranslatedModelBase):
     """A class to represent translated objects.
@@ -0,0 +1,179 @@
+from types import MappingProxyType
+
+from .settings import get_setting
+from .utils import get_translation_field_name, normalize_language_code
+
+
+class TranslationOptions:
+    """An immutable container of the translation metadata of a model.
+
+    Instances are built once per model, when the model class is prepared,
+    and rebuilt only when any of the settings they depend on changes. They
+    are available as the `_translation_meta` attribute of the model.
+    """
+
+    __slots__ = (
+        "model",
+        "fields",
+        "languages",
+        "original_language",
+        "field_names",
+        "fallback_languages",
+        "fallback_field_names",
+        "deferred_field_names",
+    )
+
+    def __init__(self, model):
+        # Forward fields only, since the app registry may not be ready yet
+        model_field_names = {field.name for field in model._meta.fields}
+        concrete_field_names = {
+            field.name for field in model._meta.concrete_fields
+        }
+
+        # Invalid attributes of the model are reported by the model checks,
+        # so they are simply ignored here
+        try:
+            fields = tuple(
+                name
+                for name in model.get_translated_fields()
+                if name in model_field_names
+            )
+        except TypeError:
+            fields = ()
+
+        try:
+            languages = tuple(model.get_languages())
+        except (AttributeError, TypeError):
+            languages = ()
+
+        original_language = model.original_language
+        if isinstance(original_language, str):
+            original_language = normalize_language_code(original_language)
+            if original_language not in languages:
+                languages = (*languages, original_language)
+        else:
+            original_language = None
+
+        # Map each of the translated fields and languages to the name of the
+        # model field storing the translation. The original language is
+        # stored in the translated field itself.
+        field_names = {}
+        for name in fields:
+            field_names[name] = MappingProxyType(
+                {
+                    language: (
+                        name
+                        if language == original_language
+                        else get_translation_field_name(name, language)
+                    )
+                    for language in languages
+                    if language == original_language
+                    or get_translation_field_name(name, language)
+                    in model_field_names
+                }
+            )
+
+        # Chains of languages to look the translation up in, starting with
+        # the language itself, followed by its fallback languages declared
+        # in the TRANSLATED_MODELS_FALLBACK_LANGUAGES setting, and ending
+        # with the original language; None stands for any language not used
+        # in the model
+        try:
+            fallback_settings = {
+                normalize_language_code(code): [
+                    normalize_language_code(fallback) for fallback in fallbacks
+                ]
+                for code, fallbacks in (
+                    get_setting("TRANSLATED_MODELS_FALLBACK_LANGUAGES").items()
+                )
+            }
+        except (AttributeError, TypeError):
+            # The setting is invalid and the error is reported by the checks
+            fallback_settings = {}
+        fallback_languages = {}
+        for language in (*languages, None):
+            chain = [language, *fallback_settings.get(language, ())]
+            if original_language is not None:
+                chain.append(original_language)
+            fallback_languages[language] = tuple(
+                dict.fromkeys(code for code in chain if code in languages)
+            )
+
+        # Names of the fields making up the chains above
+        fallback_field_names = {
+            name: MappingProxyType(
+                {
+                    language: tuple(
+                        names[code] for code in chain if code in names
+                    )
+                    for language, chain in fallback_languages.items()
+                }
+            )
+            for name, names in field_names.items()
+        }
+
+        # Names of the translation fields to be deferred when the objects
+        # are fetched for a given language; the ones without columns of their
+        # own (see `translation_storage` model attribute) can't be deferred
+        deferred_field_names = {
+            language: tuple(
+                field_name
+                for names in field_names.values()
+                for code, field_name in names.items()
+                if code not in chain and field_name in concrete_field_names
+            )
+            for language, chain in fallback_languages.items()
+        }
+
+        setattr_ = super().__setattr__
+        setattr_("model", model)
+        setattr_("fields", fields)
+        setattr_("languages", languages)
+        setattr_("original_language", original_language)
+        setattr_("field_names", MappingProxyType(field_names))
+        setattr_("fallback_languages", MappingProxyType(fallback_languages))
+        setattr_(
+            "fallback_field_names", MappingProxyType(fallback_field_names)
+        )
+        setattr_(
+            "deferred_field_names", MappingProxyType(deferred_field_names)
+        )
+
+    def __repr__(self):
+        return "<{}: {}>".format(self.__class__.__name__, self.model.__name__)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "'{}' object is immutable.".format(self.__class__.__name__)
+        )
+
+    def __delattr__(self, name):
+        raise AttributeError(
+            "'{}' object is immutable.".format(self.__class__.__name__)
+        )
+
+    def get_language(self, code):
+        """Return the model's language matching the given code, falling back
+        to the base language (e.g. "en" for "en-us"), or None if neither of
+        them is used in the model."""
+        if code is None:
+            return None
+        code = normalize_language_code(code)
+        if code in self.languages:
+            return code
+        code = code.split("_")[0]
+        if code in self.languages:
+            return code
+        return None
+
+    def get_translation_field_names(self, languages=None):
+        """Return a list of names of the translation fields for the given
+        languages (all the model's languages if None)."""
+        if languages is None:
+            languages = self.languages
+        return [
+            names[language]
+            for names in self.field_names.values()
+            for language in languages
+            if language != self.original_language and language in names
+        ]
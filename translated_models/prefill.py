@@ -0,0 +1,117 @@
+import itertools
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from . import signals
+
+
+class TranslationMemory:
+    """A bounded mapping of the source texts to their translations, evicted
+    in the least recently used order, so that the texts repeated across the
+    rows are translated only once."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.translations = OrderedDict()
+
+    def __contains__(self, text):
+        return text in self.translations
+
+    def __getitem__(self, text):
+        self.translations.move_to_end(text)
+        return self.translations[text]
+
+    def __setitem__(self, text, translation):
+        self.translations[text] = translation
+        self.translations.move_to_end(text)
+        if len(self.translations) > self.maxsize:
+            self.translations.popitem(last=False)
+
+
+def prefill_translations(
+    queryset,
+    language,
+    translator,
+    fields=None,
+    page_size=500,
+    batch_size=50,
+    workers=4,
+    memory_size=10_000,
+):
+    """Translate the missing translations of the objects of the queryset into
+    the language of the given code with the given translator (see
+    `translated_models.translators.BaseTranslator`), and return a dictionary
+    of the numbers of the objects updated (`objects`) and of the texts sent
+    to the translator (`texts`).
+
+    The objects missing the translation of each of the fields are streamed
+    in pages (see `TranslatedModelQuerySet.iter_missing()`). The distinct
+    original values of a page not translated yet are sent to the translator
+    in batches, up to the given number of them at once, and the translations
+    are written back with a single `bulk_set_translations()` call per page.
+    The next page is fetched only then, so that at most one page is held in
+    the memory, regardless of the number of the objects.
+    """
+    if page_size <= 0:
+        raise ValueError("Page size must be a positive integer.")
+    if batch_size <= 0:
+        raise ValueError("Batch size must be a positive integer.")
+
+    started_at = time.perf_counter()
+    meta = queryset.model._translation_meta
+    if fields is None:
+        fields = meta.fields
+    source_language = meta.original_language
+
+    memory = TranslationMemory(memory_size)
+    stats = {"objects": 0, "texts": 0}
+
+    def translate(texts):
+        return translator.translate(texts, source_language, language)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for name in fields:
+            for page in queryset.iter_missing(language, [name], page_size):
+                # Distinct texts of the page, the ones translated before being
+                # taken from the memory
+                translations = {}
+                pending = []
+                for text in dict.fromkeys(row[name] for row in page):
+                    if not text:
+                        continue
+                    if text in memory:
+                        translations[text] = memory[text]
+                    else:
+                        pending.append(text)
+
+                pending = iter(pending)
+                batches = list(
+                    iter(
+                        lambda: list(itertools.islice(pending, batch_size)), []
+                    )
+                )
+                for batch, results in zip(
+                    batches, executor.map(translate, batches)
+                ):
+                    for text, translation in zip(batch, results):
+                        translations[text] = memory[text] = translation
+                    stats["texts"] += len(batch)
+
+                stats["objects"] += queryset.bulk_set_translations(
+                    language,
+                    {
+                        row["pk"]: {name: translations[row[name]]}
+                        for row in page
+                        if row[name]
+                    },
+                )
+
+    if signals.bulk_translation_executed.receivers:
+        signals.bulk_translation_executed.send(
+            sender=queryset.model,
+            operation="prefill_translations",
+            rows=stats["objects"],
+            duration=time.perf_counter() - started_at,
+        )
+    return stats
@@ -0,0 +1,259 @@
+from django.db import NotSupportedError, models
+from django.db.backends.ddl_references import Statement, Table
+from django.db.models.expressions import Col
+from django.db.models.functions import Coalesce
+from django.db.models.sql import Query
+
+from .settings import get_setting
+from .utils import normalize_language_code
+
+
+def get_search_config(language):
+    """Return the name of the PostgreSQL text search configuration of the
+    language of the given code (see TRANSLATED_MODELS_SEARCH_CONFIGS
+    setting), falling back to the one of the base language, and to the
+    "simple" configuration eventually."""
+    configs = {
+        normalize_language_code(code): config
+        for code, config in get_setting(
+            "TRANSLATED_MODELS_SEARCH_CONFIGS"
+        ).items()
+    }
+    code = normalize_language_code(language)
+    return configs.get(code) or configs.get(code.split("_")[0]) or "simple"
+
+
+def get_search_query(query):
+    """Return an FTS5 query matching the rows containing all the words of
+    the given query, each of them quoted, so that no FTS5 syntax is
+    interpreted."""
+    return " ".join(
+        '"{}"'.format(word.replace('"', '""')) for word in query.split()
+    )
+
+
+class SearchVector(models.Func):
+    """Text search vector (`to_tsvector()`) of the given expressions joined
+    with spaces, in the text search configuration of the given name.
+
+    The expressions are joined with the `||` operator, which, unlike
+    `CONCAT()`, is immutable, so that the vector can be indexed.
+    """
+
+    output_field = models.TextField()
+
+    def __init__(self, config, *expressions):
+        super().__init__(
+            models.Value(config),
+            *(
+                Coalesce(
+                    expression,
+                    models.Value(""),
+                    output_field=models.TextField(),
+                )
+                for expression in expressions
+            ),
+        )
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(
+            "Text search vectors are supported by PostgreSQL only."
+        )
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        config, *expressions = self.get_source_expressions()
+        config_sql, config_params = compiler.compile(config)
+        sqls, params = [], [*config_params]
+        for expression in expressions:
+            sql, expression_params = compiler.compile(expression)
+            sqls.append(sql)
+            params.extend(expression_params)
+        return (
+            "to_tsvector({}::regconfig, {})".format(
+                config_sql, " || ' ' || ".join(sqls)
+            ),
+            params,
+        )
+
+
+class SearchQuery(models.Func):
+    """Text search query (`plainto_tsquery()`) matching all the words of the
+    given query, in the text search configuration of the given name."""
+
+    function = "plainto_tsquery"
+    output_field = models.TextField()
+
+    def __init__(self, config, query):
+        super().__init__(models.Value(config), models.Value(query))
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        config, query = self.get_source_expressions()
+        config_sql, config_params = compiler.compile(config)
+        query_sql, query_params = compiler.compile(query)
+        return "plainto_tsquery({}::regconfig, {})".format(
+            config_sql, query_sql
+        ), [*config_params, *query_params]
+
+
+class SearchMatch(models.Func):
+    """Condition of the text search vector matching the text search query
+    (`@@` operator)."""
+
+    template = "%(expressions)s"
+    arg_joiner = " @@ "
+    output_field = models.BooleanField()
+
+
+class SearchRank(models.Func):
+    """Rank of the text search vector for the text search query."""
+
+    function = "ts_rank"
+    output_field = models.FloatField()
+
+
+class TranslationSearchIndex(models.Index):
+    """Index of the text search vector of the translations of a model's
+    search fields into a language (see `search_fields` model attribute).
+
+    In PostgreSQL, it's a GIN index of the vector's expression, used by the
+    queries matching the same expression. In SQLite, it's an FTS5 table of
+    the translations, with the model's table as the external content, kept
+    in sync by the triggers of the model's table, so that it serves as a
+    plain fallback for the tests. Other databases aren't supported and the
+    model checks warn about them.
+    """
+
+    def __init__(self, *expressions, search_fields=(), **kwargs):
+        super().__init__(*expressions, **kwargs)
+        self.search_fields = tuple(search_fields)
+
+    def deconstruct(self):
+        path, args, kwargs = super().deconstruct()
+        kwargs["search_fields"] = list(self.search_fields)
+        return path, args, kwargs
+
+    def get_trigger_names(self):
+        """Return the names of the triggers maintaining the FTS5 table."""
+        return [
+            "{}_{}".format(self.name, suffix) for suffix in ("ai", "ad", "au")
+        ]
+
+    def get_values_sql(self, model, schema_editor, alias):
+        """Return the SQL of the translations the vector is made of, with the
+        columns of the model's table referenced by the given alias, e.g.
+        `new` within the triggers."""
+        query = Query(model)
+        compiler = query.get_compiler(connection=schema_editor.connection)
+        if alias != model._meta.db_table:
+            compiler.quote_cache[alias] = alias
+        sqls = []
+        for expression in self.expressions[0].get_source_expressions()[1:]:
+            expression = expression.resolve_expression(query)
+            # The columns of the fields copied from another model, e.g. once
+            # the model's table is altered, may refer to its table
+            sql, params = compiler.compile(
+                expression.relabeled_clone(
+                    {
+                        column.alias: alias
+                        for column in expression.flatten()
+                        if isinstance(column, Col)
+                    }
+                )
+            )
+            sqls.append(sql % tuple(map(schema_editor.quote_value, params)))
+        return ", ".join(sqls)
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        vendor = schema_editor.connection.vendor
+        if vendor == "postgresql":
+            return super().create_sql(
+                model, schema_editor, using=" USING gin", **kwargs
+            )
+        if vendor == "sqlite":
+            quote_name = schema_editor.quote_name
+            table = quote_name(self.name)
+            columns = ", ".join(map(quote_name, self.search_fields))
+            pk = quote_name(model._meta.pk.column)
+            insert = "INSERT INTO {}(rowid, {}) VALUES (new.{}, {});".format(
+                table,
+                columns,
+                pk,
+                self.get_values_sql(model, schema_editor, "new"),
+            )
+            delete = (
+                "INSERT INTO {0}({0}, rowid, {1}) "
+                "VALUES ('delete', old.{2}, {3});".format(
+                    table,
+                    columns,
+                    pk,
+                    self.get_values_sql(model, schema_editor, "old"),
+                )
+            )
+            insert_trigger, delete_trigger, update_trigger = map(
+                quote_name, self.get_trigger_names()
+            )
+            for sql in (
+                "CREATE VIRTUAL TABLE IF NOT EXISTS {} USING fts5({}, "
+                "content={}, content_rowid={})".format(
+                    table,
+                    columns,
+                    schema_editor.quote_value(model._meta.db_table),
+                    schema_editor.quote_value(model._meta.pk.column),
+                ),
+                # The entries of the table replaced by the model's table, if
+                # any, e.g. once it's altered, are dropped, and the existing
+                # rows are indexed
+                "INSERT INTO {0}({0}) VALUES ('delete-all')".format(table),
+                "INSERT INTO {}(rowid, {}) SELECT {}, {} FROM {}".format(
+                    table,
+                    columns,
+                    pk,
+                    self.get_values_sql(
+                        model, schema_editor, model._meta.db_table
+                    ),
+                    quote_name(model._meta.db_table),
+                ),
+                *(
+                    "DROP TRIGGER IF EXISTS {}".format(trigger)
+                    for trigger in (
+                        insert_trigger,
+                        delete_trigger,
+                        update_trigger,
+                    )
+                ),
+                "CREATE TRIGGER {} AFTER INSERT ON {} BEGIN {} END".format(
+                    insert_trigger, quote_name(model._meta.db_table), insert
+                ),
+                "CREATE TRIGGER {} AFTER DELETE ON {} BEGIN {} END".format(
+                    delete_trigger, quote_name(model._meta.db_table), delete
+                ),
+            ):
+                schema_editor.execute(sql, params=None)
+            # The statement may be deferred until the model's table is
+            # renamed, e.g. once it's altered
+            return Statement(
+                "CREATE TRIGGER %(name)s AFTER UPDATE ON %(table)s "
+                "BEGIN %(delete)s %(insert)s END",
+                name=update_trigger,
+                table=Table(model._meta.db_table, quote_name),
+                delete=delete,
+                insert=insert,
+            )
+        raise NotSupportedError(
+            "Translation search indexes are supported by PostgreSQL and "
+            "SQLite only."
+        )
+
+    def remove_sql(self, model, schema_editor, **kwargs):
+        if schema_editor.connection.vendor == "sqlite":
+            for trigger in self.get_trigger_names():
+                schema_editor.execute(
+                    "DROP TRIGGER IF EXISTS {}".format(
+                        schema_editor.quote_name(trigger)
+                    ),
+                    params=None,
+                )
+            return "DROP TABLE IF EXISTS {}".format(
+                schema_editor.quote_name(self.name)
+            )
+        return super().remove_sql(model, schema_editor, **kwargs)
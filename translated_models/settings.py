@@ -1,7 +1,63 @@
 from django.conf import settings
-from django.db.models import CharField, TextField
 
-if not hasattr(
-    settings, "TRANSLATED_MODELS_TRANSLATABLE_FIELDS"
-):  # pragma: no cover
-    settings.TRANSLATED_MODELS_TRANSLATABLE_FIELDS = (CharField, TextField)
+
+def _get_translatable_fields():
+    from django.db.models import CharField, TextField
+
+    return (CharField, TextField)
+
+
+def _get_search_configs():
+    # Text search configurations built into PostgreSQL, by language codes
+    return {
+        "ar": "arabic",
+        "da": "danish",
+        "de": "german",
+        "el": "greek",
+        "en": "english",
+        "es": "spanish",
+        "fi": "finnish",
+        "fr": "french",
+        "hu": "hungarian",
+        "id": "indonesian",
+        "it": "italian",
+        "lt": "lithuanian",
+        "nb": "norwegian",
+        "ne": "nepali",
+        "nl": "dutch",
+        "no": "norwegian",
+        "pt": "portuguese",
+        "ro": "romanian",
+        "ru": "russian",
+        "sv": "swedish",
+        "ta": "tamil",
+        "tr": "turkish",
+    }
+
+
+# Factories of the default values of the app's settings, called only if the
+# setting isn't declared in the project's settings module
+DEFAULTS = {
+    "TRANSLATED_MODELS_TRANSLATABLE_FIELDS": _get_translatable_fields,
+    "TRANSLATED_MODELS_FALLBACK_LANGUAGES": dict,
+    "TRANSLATED_MODELS_CACHE": lambda: "default",
+    "TRANSLATED_MODELS_TRANSLATOR": lambda: None,
+    "TRANSLATED_MODELS_SEARCH_CONFIGS": _get_search_configs,
+}
+
+
+def get_setting(name):
+    """Return the value of the app's setting of the given name, or its
+    default value if the setting isn't declared."""
+    try:
+        return getattr(settings, name)
+    except AttributeError:
+        return DEFAULTS[name]()
+
+
+def set_defaults():
+    """Declare the app's settings missing from the project's settings module
+    with their default values."""
+    for name, default in DEFAULTS.items():
+        if not hasattr(settings, name):
+            setattr(settings, name, default())
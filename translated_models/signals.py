@@ -0,0 +1,28 @@
+from django.dispatch import Signal
+
+# Signals instrumenting the translation handling. They're sent only if any
+# receivers are connected, so they cost nothing otherwise.
+
+# Sent once a translated attribute of an object is resolved, with the
+# arguments: `sender` (the model), `instance`, `field` (the name of the
+# translated field), `language` (the language requested), `resolved_language`
+# (the language of the translation the attribute is resolved to), and
+# `fallback` (whether the latter differs from the former).
+translation_resolved = Signal()
+
+# Sent once the translation fields are deferred by `for_language()`, with the
+# arguments: `sender` (the model), `language`, `deferred` and `loaded` (the
+# numbers of the translation fields deferred and loaded).
+translation_fields_deferred = Signal()
+
+# Sent once the translations or the objects are looked up in a cache, with
+# the arguments: `sender` (the model), `cache` ("translations" for the cache
+# of `cached_translations()`, "objects" for the in-process cache of the
+# manager), `hits`, and `misses`.
+translation_cache_accessed = Signal()
+
+# Sent once a bulk translation operation completes, with the arguments:
+# `sender` (the model), `operation` (the name of the operation, e.g.
+# "bulk_set_translations"), `rows` (the number of the rows affected), and
+# `duration` (in seconds).
+bulk_translation_executed = Signal()
@@ -0,0 +1,45 @@
+from django.utils.module_loading import import_string
+
+from .settings import get_setting
+
+
+class BaseTranslator:
+    """Base class of the machine translation backends used to prefill the
+    missing translations (see `translated_models.prefill`).
+
+    Subclasses must implement `translate()`. They're called concurrently
+    from multiple threads, so they must be thread-safe.
+    """
+
+    def translate(self, texts, source_language, target_language):
+        """Return a list of the translations of the given texts from the
+        source language into the target one, in the same order."""
+        raise NotImplementedError(
+            "Subclasses of BaseTranslator must provide a translate() method."
+        )
+
+
+class EchoTranslator(BaseTranslator):
+    """Translator returning the texts unchanged, optionally with the given
+    format applied, e.g. "{text} ({language})", meant for tests and
+    development."""
+
+    def __init__(self, format="{text}"):
+        self.format = format
+
+    def translate(self, texts, source_language, target_language):
+        return [
+            self.format.format(text=text, language=target_language)
+            for text in texts
+        ]
+
+
+def get_translator(path=None):
+    """Return an instance of the translator of the given import path (see
+    TRANSLATED_MODELS_TRANSLATOR setting if None), or None if no translator
+    is set."""
+    if path is None:
+        path = get_setting("TRANSLATED_MODELS_TRANSLATOR")
+        if path is None:
+            return None
+    return import_string(path)()
@@ -1,24 +1,66 @@
+import functools
+
 from django.conf import global_settings, settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .settings import get_setting
+
+
+def _get_language_codes(settings):
+    """Return a frozenset of codes for the languages declared in LANGUAGES
+    setting of the settings module given."""
+    return frozenset(code for code, name in settings.LANGUAGES)
+
+
+@functools.lru_cache(maxsize=None)
+def get_django_language_codes():
+    """Return a frozenset of codes for the languages available in Django."""
+    return _get_language_codes(global_settings)
+
 
+@functools.lru_cache(maxsize=None)
+def get_settings_language_codes():
+    """Return a frozenset of codes for the languages declared in LANGUAGES
+    setting of the project's settings module."""
+    return _get_language_codes(settings)
 
-def _is_language_in_languages_settings(code, settings):
-    """Return a boolean indicating whether the language of a given code is
-    available in LANGUAGES setting of the settings module given."""
-    codes, names = zip(*settings.LANGUAGES)
-    return code.split("-")[0] in codes
+
+@receiver(setting_changed)
+def clear_language_codes_cache(setting, **kwargs):
+    if setting == "LANGUAGES":
+        get_settings_language_codes.cache_clear()
+
+
+def _is_language_in_codes(code, codes):
+    """Return a boolean indicating whether the language of a given code, or
+    its base language, is in the collection of codes given."""
+    return code in codes or code.split("-")[0] in codes
 
 
 def is_language_in_django(code):
-    return _is_language_in_languages_settings(code, global_settings)
+    return _is_language_in_codes(code, get_django_language_codes())
 
 
 def is_language_in_settings(code):
-    return _is_language_in_languages_settings(code, settings)
+    return _is_language_in_codes(code, get_settings_language_codes())
+
+
+def normalize_language_code(code):
+    """Return a language code in the form used in names of the translation
+    fields, e.g. "pt_br" for "pt-br"."""
+    return code.replace("-", "_")
+
+
+def get_translation_field_name(name, code):
+    """Return the name of the translation field for the field and the
+    language of the given code."""
+    return "{}_{}".format(name, normalize_language_code(code))
 
 
 def is_field_translatable(field):
     """Return a boolean indicating whether field is "translatable", in other
     words, can be declared as the field to be translated."""
     return isinstance(
-        field, (*settings.TRANSLATED_MODELS_TRANSLATABLE_FIELDS,)
+        field, (*get_setting("TRANSLATED_MODELS_TRANSLATABLE_FIELDS"),)
     )